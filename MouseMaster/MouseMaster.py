@@ -101,8 +101,7 @@ Based on the Slicer extension template.
             builtin_dir=builtin_presets_dir,
             user_dir=user_presets_dir,
         )
-        presetManager.load_all()
-
+        # get_preset reads just this preset's file when it can
         preset = presetManager.get_preset(presetId)
         if preset:
             MouseMaster._sharedEventHandler.set_preset(preset)
@@ -479,8 +478,7 @@ class MouseMasterWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
         module_dir = Path(__file__).parent
         definitions_dir = module_dir / "Resources" / "MouseDefinitions"
         if definitions_dir.exists():
-            for json_file in definitions_dir.glob("*.json"):
-                profile = MouseProfile.from_json_file(json_file)
+            for profile in MouseProfile.load_all(definitions_dir):
                 self._mouseProfiles[profile.id] = profile
                 logging.info(f"Loaded built-in mouse profile: {profile.name}")
 
@@ -489,8 +487,7 @@ class MouseMasterWidget(ScriptedLoadableModuleWidget, VTKObservationMixin):
             Path(slicer.app.slicerUserSettingsFilePath).parent / "MouseMaster" / "MouseDefinitions"
         )
         if user_dir.exists():
-            for json_file in user_dir.glob("*.json"):
-                profile = MouseProfile.from_json_file(json_file)
+            for profile in MouseProfile.load_all(user_dir):
                 self._mouseProfiles[profile.id] = profile
                 logging.info(f"Loaded user mouse profile: {profile.name}")
 
@@ -0,0 +1,44 @@
+"""Compatibility helpers for Slicer's bundled Python and optional dependencies."""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime
+from typing import Any
+
+# Keyword arguments for @dataclass that enable __slots__ where supported.
+# ``slots=True`` requires Python 3.10; older Slicer releases bundle 3.9, where
+# the dataclasses keep their per-instance __dict__.
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# JSON (de)serialization, using orjson when it is installed. Both variants
+# work on UTF-8 bytes, write 2-space indented output and encode datetime
+# objects as ISO 8601 strings, and decode errors are json.JSONDecodeError
+# (orjson.JSONDecodeError subclasses it).
+try:
+    import orjson
+
+    def json_loads(data: bytes) -> Any:
+        """Parse JSON from UTF-8 bytes."""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to indented UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _json_default(obj: Any) -> Any:
+        """Encode the types orjson supports natively but json does not."""
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def json_loads(data: bytes) -> Any:
+        """Parse JSON from UTF-8 bytes."""
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize to indented UTF-8 JSON bytes."""
+        return json.dumps(obj, indent=2, default=_json_default).encode("utf-8")
@@ -7,13 +7,18 @@ module-specific actions, and custom Python commands.
 
 from __future__ import annotations
 
+import functools
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections.abc import Mapping
+from dataclasses import dataclass
 from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
 
+# Shared default for ActionContext.modifiers (most presses have no modifiers)
+_EMPTY_FROZENSET: frozenset[str] = frozenset()
+
 
 @dataclass
 class ActionContext:
@@ -22,13 +27,13 @@ class ActionContext:
     Attributes:
         module_name: Currently active Slicer module
         button_id: The button that triggered the action
-        modifiers: Active modifier keys
+        modifiers: Active modifier keys (immutable; build a new frozenset to change)
         view_name: Name of the view that received the event (if applicable)
     """
 
     module_name: str | None = None
     button_id: str | None = None
-    modifiers: set[str] = field(default_factory=set)
+    modifiers: frozenset[str] = _EMPTY_FROZENSET
     view_name: str | None = None
 
 
@@ -49,10 +54,12 @@ class SlicerActionHandler(ActionHandler):
 
     def __init__(self, action_name: str) -> None:
         self._action_name = action_name
+        # QAction found by the last lookup, reused while the main window is unchanged
+        self._cached_action: Any = None
+        self._cached_main: Any = None
 
     def execute(self, context: ActionContext, **kwargs: Any) -> bool:
         """Trigger the Slicer menu action."""
-        import qt
         from slicer.util import mainWindow
 
         main = mainWindow()
@@ -60,13 +67,44 @@ class SlicerActionHandler(ActionHandler):
             logger.warning("Main window not available")
             return False
 
+        action = self._cached_action
+        if action is None or main is not self._cached_main:
+            action = self._find_action(main)
+            if action is None:
+                return False
+
+        try:
+            action.trigger()
+        except RuntimeError:
+            # The cached QAction was deleted (menu rebuilt or module reloaded)
+            action = self._find_action(main)
+            if action is None:
+                return False
+            action.trigger()
+        return True
+
+    def _find_action(self, main: Any) -> Any:
+        """Look up the QAction in the main window and cache it.
+
+        Returns:
+            The QAction, or None if it does not exist
+        """
+        import qt
+
+        self._cached_action = None
         action = main.findChild(qt.QAction, self._action_name)
         if action is None:
             logger.warning(f"Action not found: {self._action_name}")
-            return False
+            return None
+        self._cached_action = action
+        self._cached_main = main
+        return action
 
-        action.trigger()
-        return True
+
+@functools.lru_cache(maxsize=64)
+def _compile_command(command: str) -> Any:
+    """Compile a Python command string to a code object for exec()."""
+    return compile(command, "<PythonCommandHandler>", "exec")
 
 
 class PythonCommandHandler(ActionHandler):
@@ -74,15 +112,119 @@ class PythonCommandHandler(ActionHandler):
 
     def __init__(self, command: str) -> None:
         self._command = command
+        # Compiled once; handlers are rebuilt from mapping parameters on every
+        # press, so the code object is shared via the module-level cache
+        self._code = _compile_command(command)
+
+    @classmethod
+    def from_parameters(cls, parameters: Mapping[str, Any]) -> PythonCommandHandler | None:
+        """Create a handler from mapping parameters ({"command": ...}).
+
+        Returns:
+            The handler, or None if no command is given
+        """
+        command = parameters.get("command", "")
+        return cls(command) if command else None
 
     def execute(self, context: ActionContext, **kwargs: Any) -> bool:
         """Execute the Python command."""
         import slicer
 
-        exec(self._command, {"slicer": slicer, "context": context})
+        exec(self._code, {"slicer": slicer, "context": context})
         return True
 
 
+# Qt key codes by key name ("Z", "F5", "Delete"), built on first use
+_KEY_MAP: dict[str, Any] | None = None
+
+
+def _build_key_map() -> dict[str, Any]:
+    """Build the key name to Qt key code map from the ``Key_*`` names of qt.Qt."""
+    import qt
+
+    return {name[4:]: getattr(qt.Qt, name) for name in dir(qt.Qt) if name.startswith("Key_")}
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_qt_key(key: str) -> Any:
+    """Map a key string (e.g. "A", "F5", "Delete") to a Qt key code.
+
+    Unknown keys are cached as None like any other result, so the key map
+    is only built once.
+
+    Returns:
+        The Qt key code, or None if the key is unknown
+    """
+    global _KEY_MAP
+    if _KEY_MAP is None:
+        _KEY_MAP = _build_key_map()
+    key_code = _KEY_MAP.get(key)
+    if key_code is None:
+        # Try uppercase
+        key_code = _KEY_MAP.get(key.upper())
+    return key_code
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_modifier_flags(modifiers: tuple[str, ...]) -> Any:
+    """Combine modifier names ("ctrl", "shift", "alt", "meta") into Qt flags."""
+    import qt
+
+    modifier_map = {
+        "ctrl": qt.Qt.ControlModifier,
+        "shift": qt.Qt.ShiftModifier,
+        "alt": qt.Qt.AltModifier,
+        "meta": qt.Qt.MetaModifier,
+    }
+    flags = qt.Qt.NoModifier
+    for mod in modifiers:
+        flag = modifier_map.get(mod.lower())
+        if flag is not None:
+            flags = flags | flag
+    return flags
+
+
+# Focus widget of the main window, kept up to date from
+# QApplication.focusChanged once tracking is installed
+_cached_focus_widget: Any = None
+# Main window whose focus widget is tracked
+_focus_tracking_main: Any = None
+# None until tracking is first attempted, then whether it could be installed
+_focus_tracking_installed: bool | None = None
+
+
+def _on_focus_changed(old: Any, new: Any) -> None:
+    """Track the main window's focus widget (QApplication.focusChanged slot).
+
+    Focus moving to another window (a dialog, the Python console) or out of
+    the application is ignored, matching what ``main.focusWidget()`` reports.
+    """
+    global _cached_focus_widget
+    main = _focus_tracking_main
+    if new is not None and main is not None and main.isAncestorOf(new):
+        _cached_focus_widget = new
+
+
+def _install_focus_tracking(main: Any) -> None:
+    """Connect to QApplication.focusChanged and seed the cached focus widget.
+
+    Only attempted once; if the connection fails, callers keep querying
+    ``main.focusWidget()`` instead.
+    """
+    global _cached_focus_widget, _focus_tracking_main, _focus_tracking_installed
+    _focus_tracking_main = main
+    try:
+        import qt
+
+        qt.QApplication.instance().focusChanged.connect(_on_focus_changed)
+    except (ImportError, AttributeError) as e:
+        logger.debug("Focus tracking unavailable: %s", e)
+        _focus_tracking_installed = False
+        return
+    _cached_focus_widget = main.focusWidget()
+    _focus_tracking_installed = True
+
+
 class KeyboardShortcutHandler(ActionHandler):
     """Handler that simulates keyboard shortcuts."""
 
@@ -95,6 +237,19 @@ class KeyboardShortcutHandler(ActionHandler):
         """
         self._key = key
         self._modifiers = modifiers or []
+        # Resolved once; shared across handlers via the module-level caches
+        self._key_code = _resolve_qt_key(key)
+        self._modifier_flags = _resolve_modifier_flags(tuple(self._modifiers))
+
+    @classmethod
+    def from_parameters(cls, parameters: Mapping[str, Any]) -> KeyboardShortcutHandler | None:
+        """Create a handler from mapping parameters ({"key": ..., "modifiers": [...]}).
+
+        Returns:
+            The handler, or None if no key is given
+        """
+        key = parameters.get("key", "")
+        return cls(key, parameters.get("modifiers", [])) if key else None
 
     def execute(self, context: ActionContext, **kwargs: Any) -> bool:
         """Simulate the keyboard shortcut."""
@@ -105,33 +260,72 @@ class KeyboardShortcutHandler(ActionHandler):
         if main is None:
             return False
 
-        # Build modifier flags
-        modifier_map = {
-            "ctrl": qt.Qt.ControlModifier,
-            "shift": qt.Qt.ShiftModifier,
-            "alt": qt.Qt.AltModifier,
-            "meta": qt.Qt.MetaModifier,
-        }
-        modifiers = qt.Qt.NoModifier
-        for mod in self._modifiers:
-            if mod.lower() in modifier_map:
-                modifiers = modifiers | modifier_map[mod.lower()]
-
-        # Map key string to Qt key code
-        key_code = getattr(qt.Qt, f"Key_{self._key}", None)
-        if key_code is None:
-            # Try uppercase
-            key_code = getattr(qt.Qt, f"Key_{self._key.upper()}", None)
+        key_code = self._key_code
         if key_code is None:
             logger.warning(f"Unknown key: {self._key}")
             return False
 
         # Create and post key event
-        event = qt.QKeyEvent(qt.QEvent.KeyPress, key_code, modifiers)
-        qt.QApplication.postEvent(main.focusWidget() or main, event)
+        event = qt.QKeyEvent(qt.QEvent.KeyPress, key_code, self._modifier_flags)
+        if _focus_tracking_installed is None:
+            _install_focus_tracking(main)
+        target = _cached_focus_widget if _focus_tracking_installed else main.focusWidget()
+        qt.QApplication.postEvent(target or main, event)
         return True
 
 
+class SegmentEditorEffectHandler(ActionHandler):
+    """Handler that activates a Segment Editor effect by name.
+
+    The Segment Editor widget is resolved once and shared by all instances
+    until ``invalidate_editor_cache`` is called, or until the cached widget
+    turns out to have been deleted.
+    """
+
+    _editor: Any = None
+
+    def __init__(self, effect_name: str) -> None:
+        self._effect_name = effect_name
+
+    @classmethod
+    def invalidate_editor_cache(cls) -> None:
+        """Forget the cached Segment Editor widget (e.g. after module reload)."""
+        cls._editor = None
+
+    @classmethod
+    def _get_editor(cls) -> Any:
+        """Get the Segment Editor widget, resolving it on first use."""
+        editor = cls._editor
+        if editor is None:
+            import slicer
+
+            editor_widget = slicer.modules.segmenteditor.widgetRepresentation()
+            if editor_widget is None:
+                return None
+            editor = cls._editor = editor_widget.self().editor
+        return editor
+
+    def execute(self, context: ActionContext, **kwargs: Any) -> bool:
+        """Activate the effect in the Segment Editor."""
+        editor = self._get_editor()
+        if editor is None:
+            return False
+        try:
+            editor.setActiveEffectByName(self._effect_name)
+        except (RuntimeError, ValueError):
+            # The cached editor was deleted (Segment Editor reloaded or recreated)
+            self.invalidate_editor_cache()
+            editor = self._get_editor()
+            if editor is None:
+                return False
+            editor.setActiveEffectByName(self._effect_name)
+        return True
+
+    def is_available(self, context: ActionContext) -> bool:
+        """Only available while the Segment Editor module is active."""
+        return context.module_name == "SegmentEditor"
+
+
 class CallableHandler(ActionHandler):
     """Handler that wraps a callable."""
 
@@ -163,29 +357,45 @@ class ActionEntry:
     category: str
     description: str
     icon: str | None = None
+    # True when the handler does not override is_available(), so dispatch
+    # can skip the call entirely
+    always_available: bool = False
 
 
 class ActionRegistry:
-    """Singleton registry of available actions."""
+    """Singleton registry of available actions.
 
-    _instance: ActionRegistry | None = None
+    The shared instance is created at import time and bound to the
+    module-level ``_REGISTRY``; ``get_instance`` simply returns it.
+    """
 
     def __init__(self) -> None:
         self._actions: dict[str, ActionEntry] = {}
-        self._categories: dict[str, list[str]] = {}
+        # Category -> action IDs; a dict keeps registration order with O(1) removal
+        self._categories: dict[str, dict[str, None]] = {}
+        # MRML node lookups cached until the scene adds/removes nodes
+        self._node_cache: dict[str, Any] = {}
+        self._scene_observer_tags: list[int] = []
+        self._observed_scene: Any = None
+        # Lists returned by get_categories()/get_all_actions(), rebuilt after changes
+        self._category_list: list[str] | None = None
+        self._action_list: list[ActionEntry] | None = None
+        # (segmentation, MTime, segment IDs, ID -> position) of the last segment walk
+        self._segment_id_cache: tuple[Any, int, list[str], dict[str, int]] | None = None
 
     @classmethod
     def get_instance(cls) -> ActionRegistry:
         """Get the singleton instance."""
-        if cls._instance is None:
-            cls._instance = ActionRegistry()
-            cls._instance._register_builtin_actions()
-        return cls._instance
+        return _REGISTRY
 
     @classmethod
     def reset_instance(cls) -> None:
         """Reset the singleton (for testing)."""
-        cls._instance = None
+        global _REGISTRY
+        # Scene observers would otherwise keep the old registry alive
+        _REGISTRY._remove_scene_observers()
+        _REGISTRY = _create_registry()
+        SegmentEditorEffectHandler.invalidate_editor_cache()
 
     def register(
         self,
@@ -202,13 +412,12 @@ class ActionRegistry:
             category=category,
             description=description,
             icon=icon,
+            always_available=type(handler).is_available is ActionHandler.is_available,
         )
         self._actions[action_id] = entry
 
-        if category not in self._categories:
-            self._categories[category] = []
-        if action_id not in self._categories[category]:
-            self._categories[category].append(action_id)
+        self._categories.setdefault(category, {})[action_id] = None
+        self._category_list = self._action_list = None
 
     def unregister(self, action_id: str) -> bool:
         """Unregister an action."""
@@ -217,9 +426,11 @@ class ActionRegistry:
 
         entry = self._actions[action_id]
         del self._actions[action_id]
+        self._action_list = None
 
-        if entry.category in self._categories and action_id in self._categories[entry.category]:
-            self._categories[entry.category].remove(action_id)
+        action_ids = self._categories.get(entry.category)
+        if action_ids is not None:
+            action_ids.pop(action_id, None)
 
         return True
 
@@ -229,28 +440,39 @@ class ActionRegistry:
 
     def execute(self, action_id: str, context: ActionContext, **kwargs: Any) -> bool:
         """Execute an action."""
-        entry = self.get_action(action_id)
+        entry = self._actions.get(action_id)
         if entry is None:
             logger.warning(f"Action not found: {action_id}")
             return False
 
-        if not entry.handler.is_available(context):
+        handler = entry.handler
+        if not entry.always_available and not handler.is_available(context):
             return False
 
-        return entry.handler.execute(context, **kwargs)
+        return handler.execute(context, **kwargs)
 
     def get_actions_by_category(self, category: str) -> list[ActionEntry]:
         """Get all actions in a category."""
-        action_ids = self._categories.get(category, [])
+        action_ids = self._categories.get(category, ())
         return [self._actions[aid] for aid in action_ids if aid in self._actions]
 
     def get_categories(self) -> list[str]:
-        """Get all category names."""
-        return list(self._categories.keys())
+        """Get all category names.
+
+        The list is cached until the next register/unregister; do not modify it.
+        """
+        if self._category_list is None:
+            self._category_list = list(self._categories)
+        return self._category_list
 
     def get_all_actions(self) -> list[ActionEntry]:
-        """Get all registered actions."""
-        return list(self._actions.values())
+        """Get all registered actions.
+
+        The list is cached until the next register/unregister; do not modify it.
+        """
+        if self._action_list is None:
+            self._action_list = list(self._actions.values())
+        return self._action_list
 
     def discover_slicer_actions(self) -> int:
         """Discover and register available QActions from Slicer's main window.
@@ -267,6 +489,10 @@ class ActionRegistry:
                 logger.warning("Main window not available for action discovery")
                 return 0
 
+            prefix = "slicer_menu_"
+            # Object names already registered, checked before reading anything else
+            known = {aid[len(prefix) :] for aid in self._actions if aid.startswith(prefix)}
+
             count = 0
             # Find all QActions in the main window
             for action in main.findChildren(qt.QAction):
@@ -274,11 +500,15 @@ class ActionRegistry:
                 name = (
                     action.objectName if isinstance(action.objectName, str) else action.objectName()
                 )
+                # Skip empty names and actions that are already registered
+                if not name or name in known:
+                    continue
+
                 text_raw = action.text if isinstance(action.text, str) else action.text()
                 text = text_raw.replace("&", "")  # Remove accelerator markers
 
-                # Skip empty or system actions
-                if not name or not text:
+                # Skip system actions without text
+                if not text:
                     continue
                 # Skip separators
                 is_sep = (
@@ -289,11 +519,7 @@ class ActionRegistry:
                 if is_sep:
                     continue
 
-                action_id = f"slicer_menu_{name}"
-
-                # Skip if already registered
-                if action_id in self._actions:
-                    continue
+                action_id = prefix + name
 
                 # Determine category from menu path
                 category = "slicer_menus"
@@ -310,6 +536,7 @@ class ActionRegistry:
                     text,
                     None,
                 )
+                known.add(name)
                 count += 1
 
             logger.info(f"Discovered {count} Slicer menu actions")
@@ -320,6 +547,61 @@ class ActionRegistry:
             logger.debug("Action discovery exception details:", exc_info=True)
             return 0
 
+    def _observe_scene(self) -> None:
+        """Install scene observers that invalidate the node cache (once)."""
+        if self._scene_observer_tags:
+            return
+
+        import slicer
+
+        scene = slicer.mrmlScene
+        self._scene_observer_tags = [
+            scene.AddObserver(event, self._invalidate_node_caches)
+            for event in (scene.NodeAddedEvent, scene.NodeRemovedEvent, scene.EndCloseEvent)
+        ]
+        self._observed_scene = scene
+
+    def _remove_scene_observers(self) -> None:
+        """Remove the observers installed by _observe_scene and drop the node cache."""
+        scene = self._observed_scene
+        if scene is not None:
+            for tag in self._scene_observer_tags:
+                scene.RemoveObserver(tag)
+        self._scene_observer_tags = []
+        self._observed_scene = None
+        self._node_cache.clear()
+
+    def _invalidate_node_caches(self, caller: Any = None, event: Any = None) -> None:
+        """Drop cached MRML node lookups (scene observer callback)."""
+        self._node_cache.clear()
+
+    def _cached_node_lookup(self, key: str, lookup: Callable[[], Any]) -> Any:
+        """Return a cached MRML lookup result, computing it on first use.
+
+        Args:
+            key: Cache key for the lookup
+            lookup: Callable performing the scene query
+
+        Returns:
+            The (possibly cached) lookup result
+        """
+        try:
+            return self._node_cache[key]
+        except KeyError:
+            pass
+        self._observe_scene()
+        result = self._node_cache[key] = lookup()
+        return result
+
+    def _get_nodes_by_class(self, class_name: str) -> list[Any]:
+        """Get all scene nodes of a class, cached until the scene changes."""
+        import slicer
+
+        nodes: list[Any] = self._cached_node_lookup(
+            class_name, lambda: list(slicer.util.getNodesByClass(class_name))
+        )
+        return nodes
+
     def _register_builtin_actions(self) -> None:
         """Register built-in Slicer actions."""
         # Editing actions
@@ -364,20 +646,14 @@ class ActionRegistry:
         # Segment Editor actions
         self.register(
             "segment_editor_paint",
-            CallableHandler(
-                self._set_segment_editor_effect("Paint"),
-                self._is_segment_editor_active,
-            ),
+            SegmentEditorEffectHandler("Paint"),
             "segment_editor",
             "Activate Paint effect",
             "paint",
         )
         self.register(
             "segment_editor_erase",
-            CallableHandler(
-                self._set_segment_editor_effect("Erase"),
-                self._is_segment_editor_active,
-            ),
+            SegmentEditorEffectHandler("Erase"),
             "segment_editor",
             "Activate Erase effect",
             "erase",
@@ -472,15 +748,14 @@ class ActionRegistry:
             view.resetCamera()
         return True
 
-    @staticmethod
-    def _center_crosshair(context: ActionContext) -> bool:
+    def _center_crosshair(self, context: ActionContext) -> bool:
         import slicer
 
-        crosshair = slicer.util.getNode("Crosshair")
+        crosshair = self._cached_node_lookup("Crosshair", lambda: slicer.util.getNode("Crosshair"))
         if crosshair:
             pos = [0.0, 0.0, 0.0]
             crosshair.GetCursorPositionRAS(pos)
-            for node in slicer.util.getNodesByClass("vtkMRMLSliceNode"):
+            for node in self._get_nodes_by_class("vtkMRMLSliceNode"):
                 node.JumpSliceByCentering(pos[0], pos[1], pos[2])
         return True
 
@@ -498,22 +773,22 @@ class ActionRegistry:
     def _is_segment_editor_active(context: ActionContext) -> bool:
         return context.module_name == "SegmentEditor"
 
-    @staticmethod
-    def _set_segment_editor_effect(effect_name: str) -> Callable[[ActionContext], bool]:
-        def handler(context: ActionContext) -> bool:
-            import slicer
-
-            editor_widget = slicer.modules.segmenteditor.widgetRepresentation()
-            if editor_widget is None:
-                return False
-            editor = editor_widget.self().editor
-            editor.setActiveEffectByName(effect_name)
-            return True
+    def _segment_ids(self, seg: Any) -> tuple[list[str], dict[str, int]]:
+        """Return the segment IDs of a vtkSegmentation and each ID's position.
 
-        return handler
+        The walk over GetNthSegmentID() is cached until the segmentation (or
+        its modified time) changes.
+        """
+        mtime = seg.GetMTime()
+        cached = self._segment_id_cache
+        if cached is None or cached[0] is not seg or cached[1] != mtime:
+            ids = [seg.GetNthSegmentID(i) for i in range(seg.GetNumberOfSegments())]
+            positions = {segment_id: i for i, segment_id in enumerate(ids)}
+            cached = self._segment_id_cache = (seg, mtime, ids, positions)
+        return cached[2], cached[3]
 
-    @staticmethod
-    def _next_segment(context: ActionContext) -> bool:
+    def _step_segment(self, step: int) -> bool:
+        """Select the segment ``step`` positions away from the current one (wrapping)."""
         import slicer
 
         editor_widget = slicer.modules.segmenteditor.widgetRepresentation()
@@ -522,33 +797,17 @@ class ActionRegistry:
         editor = editor_widget.self().editor
         segmentation = editor.segmentationNode()
         if segmentation:
-            seg = segmentation.GetSegmentation()
-            current_id = editor.currentSegmentID()
-            ids = [seg.GetNthSegmentID(i) for i in range(seg.GetNumberOfSegments())]
-            if current_id in ids:
-                idx = ids.index(current_id)
-                next_idx = (idx + 1) % len(ids)
-                editor.setCurrentSegmentID(ids[next_idx])
+            ids, positions = self._segment_ids(segmentation.GetSegmentation())
+            idx = positions.get(editor.currentSegmentID())
+            if idx is not None:
+                editor.setCurrentSegmentID(ids[(idx + step) % len(ids)])
         return True
 
-    @staticmethod
-    def _previous_segment(context: ActionContext) -> bool:
-        import slicer
+    def _next_segment(self, context: ActionContext) -> bool:
+        return self._step_segment(1)
 
-        editor_widget = slicer.modules.segmenteditor.widgetRepresentation()
-        if editor_widget is None:
-            return False
-        editor = editor_widget.self().editor
-        segmentation = editor.segmentationNode()
-        if segmentation:
-            seg = segmentation.GetSegmentation()
-            current_id = editor.currentSegmentID()
-            ids = [seg.GetNthSegmentID(i) for i in range(seg.GetNumberOfSegments())]
-            if current_id in ids:
-                idx = ids.index(current_id)
-                prev_idx = (idx - 1) % len(ids)
-                editor.setCurrentSegmentID(ids[prev_idx])
-        return True
+    def _previous_segment(self, context: ActionContext) -> bool:
+        return self._step_segment(-1)
 
     @staticmethod
     def _add_segment(context: ActionContext) -> bool:
@@ -600,12 +859,20 @@ class ActionRegistry:
             markup_node.RemoveNthControlPoint(n - 1)
         return True
 
-    @staticmethod
-    def _toggle_volume_rendering(context: ActionContext) -> bool:
-        import slicer
-
+    def _toggle_volume_rendering(self, context: ActionContext) -> bool:
         # Find volume rendering display nodes
-        vol_rendering_nodes = slicer.util.getNodesByClass("vtkMRMLVolumeRenderingDisplayNode")
+        vol_rendering_nodes = self._get_nodes_by_class("vtkMRMLVolumeRenderingDisplayNode")
         for node in vol_rendering_nodes:
             node.SetVisibility(not node.GetVisibility())
         return True
+
+
+def _create_registry() -> ActionRegistry:
+    """Create a registry populated with the built-in actions."""
+    registry = ActionRegistry()
+    registry._register_builtin_actions()
+    return registry
+
+
+# Module-level singleton returned by ActionRegistry.get_instance()
+_REGISTRY = _create_registry()
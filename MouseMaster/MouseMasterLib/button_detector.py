@@ -12,6 +12,25 @@ from typing import Callable, ClassVar
 
 logger = logging.getLogger(__name__)
 
+# Button IDs that are never offered for remapping in generated profiles
+_NON_REMAPPABLE = frozenset({"left", "right"})
+
+# Qt mouse buttons are single-bit flags; one slot per bit position
+_BIT_SLOTS = 32
+
+
+def _classify_button(qt_button: int) -> int:
+    """Map a Qt button code to its slot in the bit-indexed lookup.
+
+    Args:
+        qt_button: The Qt button code
+
+    Returns:
+        The slot index, or -1 if the code has no slot
+    """
+    bit = qt_button.bit_length() - 1
+    return bit if bit < _BIT_SLOTS else -1
+
 
 @dataclass
 class DetectedButton:
@@ -47,6 +66,38 @@ class DetectionSession:
     step: int = 0
     total_steps: int = 0
     completed: bool = False
+    # Parallel lookup indexed by bit position, avoiding dict hashing per event
+    _buttons_by_bit: list[DetectedButton | None] = field(
+        default_factory=lambda: [None] * _BIT_SLOTS, repr=False, compare=False
+    )
+
+    def get_button(self, qt_button: int) -> DetectedButton | None:
+        """Look up a detected button by its Qt button code.
+
+        Args:
+            qt_button: The Qt button code
+
+        Returns:
+            The DetectedButton, or None if not yet detected
+        """
+        bit = _classify_button(qt_button)
+        if bit >= 0:
+            existing = self._buttons_by_bit[bit]
+            if existing is not None and existing.qt_button == qt_button:
+                return existing
+        return self.buttons.get(qt_button)
+
+    def add_button(self, detected: DetectedButton) -> None:
+        """Record a newly detected button.
+
+        Args:
+            detected: The detected button
+        """
+        qt_button = detected.qt_button
+        self.buttons[qt_button] = detected
+        bit = _classify_button(qt_button)
+        if bit >= 0 and self._buttons_by_bit[bit] is None:
+            self._buttons_by_bit[bit] = detected
 
 
 class ButtonDetector:
@@ -134,19 +185,19 @@ class ButtonDetector:
         Returns:
             True if the press was handled, False if no session active
         """
-        if not self._session:
+        session = self._session
+        if not session:
             return False
 
         # Check if already detected
-        if qt_button in self._session.buttons:
-            self._session.buttons[qt_button].press_count += 1
-            logger.debug(
-                f"Button {qt_button} pressed again (count: {self._session.buttons[qt_button].press_count})"
-            )
+        existing = session.get_button(qt_button)
+        if existing is not None:
+            existing.press_count += 1
+            logger.debug(f"Button {qt_button} pressed again (count: {existing.press_count})")
             return True
 
         # New button detected
-        step = len(self._session.buttons)
+        step = len(session.buttons)
         suggested = (
             self.SUGGESTED_BUTTONS[step]
             if step < len(self.SUGGESTED_BUTTONS)
@@ -160,21 +211,22 @@ class ButtonDetector:
             press_count=1,
         )
 
-        self._session.buttons[qt_button] = detected
+        session.add_button(detected)
         self._detection_order.append(qt_button)
-        self._session.step = step + 1
+        step += 1
+        session.step = step
 
         # Update prompt
-        if self._session.step < self._session.total_steps:
+        if step < session.total_steps:
             next_name = (
-                self.SUGGESTED_BUTTONS[self._session.step][1]
-                if self._session.step < len(self.SUGGESTED_BUTTONS)
-                else f"Button {self._session.step + 1}"
+                self.SUGGESTED_BUTTONS[step][1]
+                if step < len(self.SUGGESTED_BUTTONS)
+                else f"Button {step + 1}"
             )
-            self._session.current_prompt = f"Press button {self._session.step + 1} ({next_name})..."
+            session.current_prompt = f"Press button {step + 1} ({next_name})..."
         else:
-            self._session.current_prompt = "Detection complete!"
-            self._session.completed = True
+            session.current_prompt = "Detection complete!"
+            session.completed = True
 
         logger.info(f"Detected button {qt_button} as {detected.suggested_name}")
 
@@ -182,11 +234,18 @@ class ButtonDetector:
         if self._on_button:
             self._on_button(detected)
 
-        if self._session.completed and self._on_complete:
-            self._on_complete(self._session)
+        if session.completed:
+            self._fire_complete(session)
 
         return True
 
+    def _fire_complete(self, session: DetectionSession) -> None:
+        """Invoke the completion callback at most once per session."""
+        callback = self._on_complete
+        self._on_complete = None
+        if callback is not None:
+            callback(session)
+
     def get_session(self) -> DetectionSession | None:
         """Get the current detection session.
 
@@ -226,16 +285,16 @@ class ButtonDetector:
             raise ValueError("No buttons detected")
 
         # Build buttons list in detection order
-        buttons = []
-        for qt_button in self._detection_order:
-            detected = self._session.buttons[qt_button]
-            button_data = {
+        detected_buttons = self._session.buttons
+        buttons = [
+            {
                 "id": detected.suggested_id,
                 "name": detected.suggested_name,
-                "qtButton": qt_button,
-                "remappable": detected.suggested_id not in ("left", "right"),
+                "qtButton": detected.qt_button,
+                "remappable": detected.suggested_id not in _NON_REMAPPABLE,
             }
-            buttons.append(button_data)
+            for detected in (detected_buttons[qt_button] for qt_button in self._detection_order)
+        ]
 
         profile = {
             "id": profile_id,
@@ -258,13 +317,12 @@ class ButtonDetector:
         Returns:
             The completed session, or None if not detecting
         """
-        if not self._session:
+        session = self._session
+        if not session:
             return None
 
-        self._session.completed = True
-        self._session.current_prompt = "Detection complete!"
+        session.completed = True
+        session.current_prompt = "Detection complete!"
+        self._fire_complete(session)
 
-        if self._on_complete:
-            self._on_complete(self._session)
-
-        return self._session
+        return session
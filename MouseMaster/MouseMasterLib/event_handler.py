@@ -2,47 +2,131 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import sys
+import time
 from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
-    from MouseMasterLib.preset_manager import Preset
+    from MouseMasterLib.action_registry import ActionContext
+    from MouseMasterLib.preset_manager import Mapping, Preset
 
 logger = logging.getLogger(__name__)
 
+# Contexts are interned so mapping lookups can match keys by identity
+_DEFAULT_CTX = sys.intern("default")
+
+# Seconds to reuse the current-module lookup between presses. The cache is
+# also invalidated when the module selector reports a change.
+_CONTEXT_CACHE_TTL = 0.1
+
+
+@functools.cache
+def _get_handlers() -> dict[str, Any]:
+    """Map mapping action types to handler classes built from mapping parameters."""
+    from MouseMasterLib.action_registry import KeyboardShortcutHandler, PythonCommandHandler
+
+    return {
+        "python_command": PythonCommandHandler,
+        "keyboard_shortcut": KeyboardShortcutHandler,
+    }
+
 
 class MouseMasterEventHandler:
     """Application-level event handler for mouse button interception."""
 
+    __slots__ = (
+        "_action_context",
+        "_action_registry",
+        "_context_cache",
+        "_context_cache_time",
+        "_enabled",
+        "_installed",
+        "_layout_manager",
+        "_log_debug",
+        "_mapping_cache",
+        "_module_selector",
+        "_normalize",
+        "_on_button_press",
+        "_platform_adapter",
+        "_preset",
+        "_qt_handler",
+        "_registry_execute",
+        "_selected_module_fn",
+        "_vtk_observers",
+    )
+
     def __init__(self) -> None:
         self._installed = False
         self._enabled = True
         self._preset: Preset | None = None
+        # Flattened (button_id, context) -> Mapping table, rebuilt in set_preset
+        self._mapping_cache: dict[tuple[str, str | None], Mapping] = {}
         self._qt_handler: object | None = None
         self._platform_adapter: object | None = None
         self._action_registry: object | None = None
+        # Bound in install() so the first press does not pay for imports (or
+        # on first use if the handler is driven directly); cached as bound
+        # methods to skip attribute lookups per event
+        self._normalize: Callable[[object], Any] | None = None
+        self._registry_execute: Callable[..., bool] | None = None
+        self._selected_module_fn: Callable[[], str | None] | None = None
+        # Reused for every dispatch; actions must not keep a reference to it
+        self._action_context: ActionContext | None = None
         self._on_button_press: Callable[[str, str], None] | None = None
-        self._vtk_observers: list[tuple[Any, str]] = []
+        # Filtered views, held strongly: PythonQt wrappers are short-lived
+        # proxies, so weak references would not track the C++ widgets
+        self._vtk_observers: list[Any] = []
+        self._context_cache: str | None = None
+        self._context_cache_time = 0.0
+        self._module_selector: Any = None
+        self._layout_manager: Any = None
+        # Per-event logging is skipped entirely unless DEBUG is enabled
+        self._log_debug = logger.isEnabledFor(logging.DEBUG)
 
     def install(self) -> None:
-        """Install the event handler on the Qt application and VTK views."""
+        """Install the event handler on the Qt application and the slice and 3D views."""
         if self._installed:
             return
 
         import slicer
 
-        # Install Qt application event filter
+        self._bind_dependencies()
+
+        # Install Qt application event filter. It sees every event in the
+        # application; the filter's fast pass keeps that cheap while there is
+        # nothing to dispatch to.
         self._qt_handler = _create_event_filter(self)
+        self._update_fast_pass()
         slicer.app.installEventFilter(self._qt_handler)
 
-        # Install VTK observers on slice views and 3D views
-        self._install_vtk_observers()
+        # Also filter the slice and 3D views directly
+        self._connect_view_tracking()
+
+        # Drop the cached context whenever the user switches modules
+        self._connect_module_selector()
 
         self._installed = True
         logger.info("Event handler installed")
 
-    def _install_vtk_observers(self) -> None:
-        """Install Qt event filters on all view widgets."""
+    def _bind_dependencies(self) -> None:
+        """Import and bind the collaborators used on every button press."""
+        import slicer.util
+
+        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
+        from MouseMasterLib.platform_adapter import PlatformAdapter
+
+        self._platform_adapter = PlatformAdapter.get_instance()
+        self._normalize = self._platform_adapter.normalize_event
+        self._action_registry = ActionRegistry.get_instance()
+        self._registry_execute = self._action_registry.execute
+        self._action_context = ActionContext()
+        self._selected_module_fn = slicer.util.selectedModule
+        _get_handlers()
+
+    def _connect_view_tracking(self) -> None:
+        """Filter every slice and 3D view, and views added by later layout changes."""
         import slicer
 
         layoutManager = slicer.app.layoutManager()
@@ -50,28 +134,55 @@ class MouseMasterEventHandler:
             logger.warning("No layout manager available")
             return
 
-        # Get slice view names and install event filters on their widgets
+        layoutManager.layoutChanged.connect(self._on_layout_changed)
+        self._layout_manager = layoutManager
+        self._install_view_filters()
+
+    def _on_layout_changed(self, *args: Any) -> None:
+        """Filter the views created by the new layout."""
+        self._install_view_filters()
+
+    def _install_view_filters(self) -> None:
+        """Install the Qt event filter on all slice and 3D views not yet filtered."""
+        layoutManager = self._layout_manager
         for sliceViewName in layoutManager.sliceViewNames():
             sliceWidget = layoutManager.sliceWidget(sliceViewName)
             if sliceWidget:
-                # Install on the slice view (the VTK widget)
-                view = sliceWidget.sliceView()
-                if view:
-                    view.installEventFilter(self._qt_handler)
-                    self._vtk_observers.append((view, "filter"))
-                    logger.debug(f"Installed filter on slice view: {sliceViewName}")
-
-        # Get 3D views and install event filters
+                self._install_view_filter(sliceWidget.sliceView())
+
         for i in range(layoutManager.threeDViewCount):
             threeDWidget = layoutManager.threeDWidget(i)
             if threeDWidget:
-                view = threeDWidget.threeDView()
-                if view:
-                    view.installEventFilter(self._qt_handler)
-                    self._vtk_observers.append((view, "filter"))
-                    logger.debug(f"Installed filter on 3D view: {i}")
+                self._install_view_filter(threeDWidget.threeDView())
+
+        logger.debug("Event filters installed on %d view widgets", len(self._vtk_observers))
+
+    def _install_view_filter(self, view: Any) -> None:
+        """Install the Qt event filter on a view, once."""
+        if not view or view in self._vtk_observers:
+            return
+
+        view.installEventFilter(self._qt_handler)
+        self._vtk_observers.append(view)
+        if self._log_debug:
+            logger.debug("Installed filter on view: %s", view.objectName)
+
+    def _connect_module_selector(self) -> None:
+        """Invalidate the context cache when a different module is selected."""
+        import slicer.util
+
+        try:
+            selector = slicer.util.moduleSelector()
+            selector.moduleSelected.connect(self._invalidate_context)
+        except (AttributeError, RuntimeError) as e:
+            # No main window (e.g. testing mode); the TTL still bounds staleness
+            logger.debug("Module selector not available: %s", e)
+            return
+        self._module_selector = selector
 
-        logger.info(f"Installed event filters on {len(self._vtk_observers)} view widgets")
+    def _invalidate_context(self, *args: Any) -> None:
+        """Forget the cached module context."""
+        self._context_cache = None
 
     def uninstall(self) -> None:
         """Remove the event handler from the Qt application and views."""
@@ -81,7 +192,7 @@ class MouseMasterEventHandler:
         import slicer
 
         # Remove event filters from view widgets
-        for view, _ in self._vtk_observers:
+        for view in self._vtk_observers:
             try:
                 view.removeEventFilter(self._qt_handler)
             except RuntimeError as e:
@@ -89,6 +200,21 @@ class MouseMasterEventHandler:
                 logger.debug("Could not remove event filter (view likely deleted): %s", e)
         self._vtk_observers.clear()
 
+        if self._layout_manager is not None:
+            try:
+                self._layout_manager.layoutChanged.disconnect(self._on_layout_changed)
+            except (AttributeError, RuntimeError, TypeError) as e:
+                logger.debug("Could not disconnect layout manager: %s", e)
+            self._layout_manager = None
+
+        if self._module_selector is not None:
+            try:
+                self._module_selector.moduleSelected.disconnect(self._invalidate_context)
+            except (AttributeError, RuntimeError, TypeError) as e:
+                logger.debug("Could not disconnect module selector: %s", e)
+            self._module_selector = None
+        self._invalidate_context()
+
         # Remove from application
         if self._qt_handler:
             slicer.app.removeEventFilter(self._qt_handler)
@@ -107,14 +233,31 @@ class MouseMasterEventHandler:
 
     def set_enabled(self, enabled: bool) -> None:
         self._enabled = enabled
+        self._update_fast_pass()
 
     def set_preset(self, preset: Preset | None) -> None:
         self._preset = preset
+        self._mapping_cache = preset.build_lookup() if preset is not None else {}
+        self._update_fast_pass()
         if preset:
             logger.info(f"Preset loaded: {preset.name}")
 
     def set_on_button_press(self, callback: Callable[[str, str], None] | None) -> None:
         self._on_button_press = callback
+        self._update_fast_pass()
+
+    def refresh_log_level(self) -> None:
+        """Re-read the logger level after it changes at runtime."""
+        self._log_debug = logger.isEnabledFor(logging.DEBUG)
+        if self._qt_handler is not None:
+            self._qt_handler._log_debug = self._log_debug  # type: ignore[attr-defined]
+
+    def _update_fast_pass(self) -> None:
+        """Let the Qt filter skip events that handle_button_press would ignore."""
+        if self._qt_handler is not None:
+            self._qt_handler._fast_pass = not self._enabled or (  # type: ignore[attr-defined]
+                self._preset is None and self._on_button_press is None
+            )
 
     def handle_button_press(self, qt_event: object) -> bool:
         """Handle a mouse button press event.
@@ -125,14 +268,11 @@ class MouseMasterEventHandler:
         if not self._enabled:
             return False
 
-        # Get platform adapter (lazy load)
-        if self._platform_adapter is None:
-            from MouseMasterLib.platform_adapter import PlatformAdapter
-
-            self._platform_adapter = PlatformAdapter.get_instance()
+        if self._normalize is None:
+            self._bind_dependencies()
 
         # Normalize the event
-        normalized = self._platform_adapter.normalize_event(qt_event)  # type: ignore
+        normalized = self._normalize(qt_event)  # type: ignore[misc]
 
         # Get current context
         context = self._get_current_context()
@@ -146,64 +286,69 @@ class MouseMasterEventHandler:
             return False
 
         # Look up mapping
-        logger.info(f"Button: {normalized.button_id}, context: {context}")
-        mapping = self._preset.get_mapping(normalized.button_id, context)
+        log_debug = self._log_debug
+        if log_debug:
+            logger.debug("Button: %s, context: %s", normalized.button_id, context)
+        mapping_cache = self._mapping_cache
+        mapping = mapping_cache.get((normalized.button_id, context))
+        if mapping is None:
+            mapping = mapping_cache.get((normalized.button_id, None))
         if not mapping:
-            logger.info(f"No mapping found for {normalized.button_id}")
+            if log_debug:
+                logger.debug("No mapping found for %s", normalized.button_id)
             return False
 
-        logger.info(f"Found mapping: {mapping.action}")
+        if log_debug:
+            logger.debug("Found mapping: %s", mapping.action)
         # Execute the action and consume the event
         self._execute_mapping(mapping, normalized, context)
         return True
 
     def _get_current_context(self) -> str:
-        """Get the name of the currently active Slicer module."""
-        import slicer.util
+        """Get the name of the currently active Slicer module.
 
-        return slicer.util.selectedModule() or "default"
+        The result is cached for ``_CONTEXT_CACHE_TTL`` seconds, or until the
+        module selector reports a change.
+        """
+        now = time.monotonic()
+        cached = self._context_cache
+        if cached is not None and now - self._context_cache_time < _CONTEXT_CACHE_TTL:
+            return cached
+
+        if self._selected_module_fn is None:
+            self._bind_dependencies()
+        try:
+            module = self._selected_module_fn()  # type: ignore[misc]
+        except AttributeError as e:
+            # No main window/module selector (e.g. testing mode)
+            logger.debug("Could not get selected module: %s", e)
+            module = None
+        context = sys.intern(module) if module else _DEFAULT_CTX
+        self._context_cache = context
+        self._context_cache_time = now
+        return context
 
     def _execute_mapping(self, mapping: object, normalized: object, context: str) -> None:
         """Execute a button mapping."""
-        # Get action registry (lazy load)
-        if self._action_registry is None:
-            from MouseMasterLib.action_registry import ActionRegistry
-
-            self._action_registry = ActionRegistry.get_instance()
-
-        from MouseMasterLib.action_registry import ActionContext
-
-        action_context = ActionContext(
-            module_name=context,
-            button_id=normalized.button_id,  # type: ignore
-            modifiers=normalized.modifiers,  # type: ignore
-        )
+        if self._action_context is None:
+            self._bind_dependencies()
+        action_context: Any = self._action_context
+        action_context.module_name = context
+        action_context.button_id = normalized.button_id  # type: ignore[attr-defined]
+        # The adapter returns shared frozensets, so they are passed through as-is
+        action_context.modifiers = normalized.modifiers  # type: ignore[attr-defined]
 
         action_type = mapping.action  # type: ignore
-        action_id = getattr(mapping, "action_id", None)
-
-        if action_type == "python_command":
-            command = mapping.parameters.get("command", "")  # type: ignore[attr-defined]
-            if command:
-                from MouseMasterLib.action_registry import PythonCommandHandler
-
-                cmd_handler = PythonCommandHandler(command)
-                cmd_handler.execute(action_context)
-            return
-
-        if action_type == "keyboard_shortcut":
-            key = mapping.parameters.get("key", "")  # type: ignore[attr-defined]
-            mods = mapping.parameters.get("modifiers", [])  # type: ignore[attr-defined]
-            if key:
-                from MouseMasterLib.action_registry import KeyboardShortcutHandler
-
-                kb_handler = KeyboardShortcutHandler(key, mods)
-                kb_handler.execute(action_context)
+        handler_cls = _get_handlers().get(action_type)
+        if handler_cls is not None:
+            action_handler = handler_cls.from_parameters(mapping.parameters)  # type: ignore
+            if action_handler is not None:
+                action_handler.execute(action_context)
             return
 
         # Default: treat as slicer action
-        effective_action_id = action_id or action_type
-        self._action_registry.execute(effective_action_id, action_context)  # type: ignore
+        effective_action_id = getattr(mapping, "action_id", None) or action_type
+        self._registry_execute(effective_action_id, action_context)  # type: ignore[misc]
 
 
 def _create_event_filter(handler: MouseMasterEventHandler) -> object:
@@ -214,27 +359,54 @@ def _create_event_filter(handler: MouseMasterEventHandler) -> object:
         def __init__(self, parent: Any = None) -> None:
             super().__init__(parent)
             self._handler = handler
-            self._mouse_press = qt.QEvent.MouseButtonPress
-            self._mouse_release = qt.QEvent.MouseButtonRelease
-            # Track consumed buttons to also consume their release
-            self._consumed_buttons: set[int] = set()
+            # Plain ints compare faster than the enum wrappers
+            self._mouse_press = int(qt.QEvent.MouseButtonPress)
+            self._mouse_release = int(qt.QEvent.MouseButtonRelease)
+            # Buttons up to Qt.MiddleButton are never intercepted
+            self._button_threshold = 4
+            # Bitmask of consumed buttons, so their release is consumed too.
+            # Qt button values are single-bit flags and serve as their own mask.
+            self._consumed_bits = 0
+            # (timestamp, button) of the last press dispatched. The application
+            # and view filters, and propagation to parent widgets, can all
+            # deliver the same press; it is only dispatched once. Cleared on
+            # release, so later presses with an equal timestamp (synthetic
+            # events, platforms reporting 0) are still dispatched.
+            self._last_press: tuple[Any, int] | None = None
+            # Set by the handler when it is disabled or has nothing to dispatch to
+            self._fast_pass = True
+            # Refreshed through MouseMasterEventHandler.refresh_log_level()
+            self._log_debug = handler._log_debug
 
         def eventFilter(self, obj: Any, event: Any) -> bool:
+            consumed = self._consumed_bits
+            if self._fast_pass and not consumed:
+                return False
             event_type = event.type()
             if event_type == self._mouse_press:
                 button = int(event.button())
-                if button > 4:
-                    logger.info(f"Press event: button={button}")
+                if button > self._button_threshold:
+                    press = (event.timestamp(), button)
+                    if press == self._last_press:
+                        return False
+                    self._last_press = press
+                    log_debug = self._log_debug
+                    if log_debug:
+                        logger.debug("Press event: button=%d", button)
                     if self._handler.handle_button_press(event):
-                        self._consumed_buttons.add(button)
-                        logger.info(f"Consumed press for button {button}")
+                        self._consumed_bits |= button
+                        if log_debug:
+                            logger.debug("Consumed press for button %d", button)
                         return True
-                    logger.info("Press NOT consumed")
+                    if log_debug:
+                        logger.debug("Press NOT consumed")
             elif event_type == self._mouse_release:
                 button = int(event.button())
-                if button in self._consumed_buttons:
-                    self._consumed_buttons.discard(button)
-                    logger.info(f"Consumed release for button {button}")
+                self._last_press = None
+                if consumed & button:
+                    self._consumed_bits = consumed & ~button
+                    if self._log_debug:
+                        logger.debug("Consumed release for button %d", button)
                     return True
             return False
 
@@ -6,16 +6,20 @@ including button definitions and device features.
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from MouseMasterLib._compat import DATACLASS_SLOTS, json_dumps, json_loads
+
 logger = logging.getLogger(__name__)
 
+# Profiles with more buttons than this skip MouseButton.__init__ when loading
+_BULK_BUTTON_THRESHOLD = 8
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MouseButton:
     """Represents a single mouse button.
 
@@ -44,6 +48,17 @@ class MouseButton:
             default_action=data.get("defaultAction"),
         )
 
+    @classmethod
+    def _bulk_from_dict(cls, data: dict[str, Any]) -> MouseButton:
+        """Like from_dict, but fills the fields without calling __init__."""
+        button = cls.__new__(cls)
+        button.id = data["id"]
+        button.name = data["name"]
+        button.qt_button = data["qtButton"]
+        button.remappable = data.get("remappable", True)
+        button.default_action = data.get("defaultAction")
+        return button
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         result: dict[str, Any] = {
@@ -57,7 +72,7 @@ class MouseButton:
         return result
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MouseFeatures:
     """Optional mouse features.
 
@@ -89,7 +104,7 @@ class MouseFeatures:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MouseProfile:
     """Represents a mouse hardware profile.
 
@@ -114,11 +129,38 @@ class MouseProfile:
     product_ids: list[str]
     buttons: list[MouseButton]
     features: MouseFeatures = field(default_factory=MouseFeatures)
+    # Lookup tables derived from buttons (see reindex_buttons)
+    _id_index: dict[str, MouseButton] = field(init=False, repr=False, compare=False)
+    _qt_index: dict[int, MouseButton] = field(init=False, repr=False, compare=False)
+    _remappable: tuple[MouseButton, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.reindex_buttons()
+
+    def reindex_buttons(self) -> None:
+        """Rebuild the button lookup tables.
+
+        Called automatically on construction; call again after modifying
+        ``buttons`` in place.
+        """
+        id_index: dict[str, MouseButton] = {}
+        qt_index: dict[int, MouseButton] = {}
+        for button in self.buttons:
+            # First definition wins, matching the order of self.buttons
+            id_index.setdefault(button.id, button)
+            qt_index.setdefault(button.qt_button, button)
+        self._id_index = id_index
+        self._qt_index = qt_index
+        self._remappable = tuple(b for b in self.buttons if b.remappable)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> MouseProfile:
         """Create a MouseProfile from a dictionary."""
-        buttons = [MouseButton.from_dict(b) for b in data.get("buttons", [])]
+        buttons_data = data.get("buttons", [])
+        if len(buttons_data) > _BULK_BUTTON_THRESHOLD:
+            buttons = [MouseButton._bulk_from_dict(b) for b in buttons_data]
+        else:
+            buttons = [MouseButton.from_dict(b) for b in buttons_data]
         features = MouseFeatures.from_dict(data.get("features", {}))
 
         return cls(
@@ -149,11 +191,27 @@ class MouseProfile:
         path = Path(path)
         logger.debug(f"Loading mouse profile from {path}")
 
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = json_loads(f.read())
 
         return cls.from_dict(data)
 
+    @classmethod
+    def load_all(cls, directory: Path | str) -> list[MouseProfile]:
+        """Load all profile JSON files in a directory.
+
+        Args:
+            directory: Directory containing profile JSON files
+
+        Returns:
+            Loaded profiles, sorted by file name
+
+        Raises:
+            json.JSONDecodeError: If a profile JSON is invalid
+            KeyError: If required fields are missing
+        """
+        return [cls.from_json_file(path) for path in sorted(Path(directory).glob("*.json"))]
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -175,8 +233,8 @@ class MouseProfile:
         path = Path(path)
         logger.debug(f"Saving mouse profile to {path}")
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        with open(path, "wb") as f:
+            f.write(json_dumps(self.to_dict()))
 
     def get_button(self, button_id: str) -> MouseButton | None:
         """Get a button by ID.
@@ -187,10 +245,7 @@ class MouseProfile:
         Returns:
             The MouseButton if found, None otherwise
         """
-        for button in self.buttons:
-            if button.id == button_id:
-                return button
-        return None
+        return self._id_index.get(button_id)
 
     def get_button_by_qt_code(self, qt_button: int) -> MouseButton | None:
         """Get a button by Qt button code.
@@ -201,10 +256,7 @@ class MouseProfile:
         Returns:
             The MouseButton if found, None otherwise
         """
-        for button in self.buttons:
-            if button.qt_button == qt_button:
-                return button
-        return None
+        return self._qt_index.get(qt_button)
 
     def get_remappable_buttons(self) -> list[MouseButton]:
         """Get all remappable buttons.
@@ -212,7 +264,7 @@ class MouseProfile:
         Returns:
             List of buttons that can be remapped
         """
-        return [b for b in self.buttons if b.remappable]
+        return list(self._remappable)
 
     @property
     def button_count(self) -> int:
@@ -222,4 +274,4 @@ class MouseProfile:
     @property
     def remappable_count(self) -> int:
         """Get the number of remappable buttons."""
-        return len(self.get_remappable_buttons())
+        return len(self._remappable)
@@ -11,6 +11,9 @@ import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import IntEnum
+from typing import ClassVar
+
+from MouseMasterLib._compat import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +49,25 @@ BUTTON_ID_MAP: dict[CanonicalButton, str] = {
 }
 
 
+def _build_button_id_table() -> tuple[str, ...]:
+    """Build BUTTON_ID_MAP as a tuple indexed directly by canonical button value.
+
+    All canonical values are below 256; values without an ID map to "unknown".
+    """
+    table = ["unknown"] * 256
+    for button, button_id in BUTTON_ID_MAP.items():
+        table[button] = button_id
+    return tuple(table)
+
+
+_BUTTON_ID_TABLE = _build_button_id_table()
+
+# Reverse of BUTTON_ID_MAP for string ID -> button lookups
+_ID_TO_BUTTON: dict[str, CanonicalButton] = {
+    button_id: button for button, button_id in BUTTON_ID_MAP.items()
+}
+
+
 class CanonicalModifier(IntEnum):
     """Canonical modifier key identifiers."""
 
@@ -56,7 +78,30 @@ class CanonicalModifier(IntEnum):
     META = 8
 
 
-@dataclass
+# Qt Shift/Control/Alt/Meta modifier flags occupy bits 25-28, so shifting
+# them down gives a CanonicalModifier bitmask usable as a table index.
+_QT_MODIFIER_SHIFT = 25
+
+
+def _build_modifier_table(names: tuple[str, str, str, str]) -> tuple[frozenset[str], ...]:
+    """Build the 16 modifier sets indexed by a CanonicalModifier bitmask.
+
+    Args:
+        names: Names for the Qt Shift, Control, Alt and Meta flags, in order
+    """
+    return tuple(
+        frozenset(name for bit, name in enumerate(names) if index >> bit & 1) for index in range(16)
+    )
+
+
+# Qt flags mapped straight through: Windows, Linux, and macOS with the
+# Ctrl/Meta swap (Qt already reports Cmd as Control there)
+_QT_MODIFIER_TABLE = _build_modifier_table(("shift", "ctrl", "alt", "meta"))
+# Physical macOS keys: Qt Control (Cmd) as Meta, Qt Meta (Ctrl) as Ctrl
+_MACOS_NATIVE_MODIFIER_TABLE = _build_modifier_table(("shift", "meta", "alt", "ctrl"))
+
+
+@dataclass(**DATACLASS_SLOTS)
 class NormalizedEvent:
     """A platform-normalized mouse event.
 
@@ -70,7 +115,7 @@ class NormalizedEvent:
 
     button: CanonicalButton
     button_id: str
-    modifiers: set[str]
+    modifiers: frozenset[str]
     x: int = 0
     y: int = 0
 
@@ -79,10 +124,21 @@ class PlatformAdapter(ABC):
     """Abstract base class for platform-specific adapters.
 
     Subclasses implement platform-specific button code normalization
-    and modifier key handling.
+    and modifier key handling. The adapter for the running platform is
+    created at import time and bound to the module-level ``_ADAPTER``;
+    ``get_instance`` simply returns it.
     """
 
-    _instance: PlatformAdapter | None = None
+    # Qt button codes are the same on every platform
+    _BUTTON_MAP: ClassVar[dict[int, CanonicalButton]] = {
+        1: CanonicalButton.LEFT,  # Qt.LeftButton
+        2: CanonicalButton.RIGHT,  # Qt.RightButton
+        4: CanonicalButton.MIDDLE,  # Qt.MiddleButton
+        8: CanonicalButton.BACK,  # Qt.BackButton
+        16: CanonicalButton.FORWARD,  # Qt.ForwardButton
+        32: CanonicalButton.EXTRA1,  # Qt.ExtraButton3
+        64: CanonicalButton.EXTRA2,  # Qt.ExtraButton4
+    }
 
     @classmethod
     def get_instance(cls) -> PlatformAdapter:
@@ -91,22 +147,14 @@ class PlatformAdapter(ABC):
         Returns:
             The singleton PlatformAdapter for the current platform
         """
-        if cls._instance is None:
-            if sys.platform == "win32":
-                cls._instance = WindowsAdapter()
-            elif sys.platform == "darwin":
-                cls._instance = MacOSAdapter()
-            else:
-                cls._instance = LinuxAdapter()
-            logger.info(f"Using platform adapter: {cls._instance.__class__.__name__}")
-        return cls._instance
+        return _ADAPTER
 
     @classmethod
     def reset_instance(cls) -> None:
         """Reset the singleton (for testing)."""
-        cls._instance = None
+        global _ADAPTER
+        _ADAPTER = _create_adapter()
 
-    @abstractmethod
     def normalize_button(self, qt_button: int) -> CanonicalButton:
         """Convert a Qt button code to canonical form.
 
@@ -116,9 +164,10 @@ class PlatformAdapter(ABC):
         Returns:
             The canonical button enum value
         """
+        return self._BUTTON_MAP.get(qt_button, CanonicalButton.UNKNOWN)
 
     @abstractmethod
-    def normalize_modifiers(self, qt_modifiers: int) -> set[str]:
+    def normalize_modifiers(self, qt_modifiers: int) -> frozenset[str]:
         """Convert Qt modifiers to canonical form.
 
         Args:
@@ -137,14 +186,13 @@ class PlatformAdapter(ABC):
         Returns:
             A NormalizedEvent with platform-independent values
         """
-        button = self.normalize_button(int(qt_event.button()))  # type: ignore
-        modifiers = self.normalize_modifiers(int(qt_event.modifiers()))  # type: ignore
-
-        button_id = BUTTON_ID_MAP.get(button, "unknown")
+        # Qt enum and flag values are int subclasses, so no int() conversion
+        button = self.normalize_button(qt_event.button())  # type: ignore
+        modifiers = self.normalize_modifiers(qt_event.modifiers())  # type: ignore
 
         return NormalizedEvent(
             button=button,
-            button_id=button_id,
+            button_id=_BUTTON_ID_TABLE[button],
             modifiers=modifiers,
             x=qt_event.x(),  # type: ignore
             y=qt_event.y(),  # type: ignore
@@ -159,7 +207,18 @@ class PlatformAdapter(ABC):
         Returns:
             The string ID (e.g., "left", "back")
         """
-        return BUTTON_ID_MAP.get(button, "unknown")
+        return _BUTTON_ID_TABLE[button]
+
+    def id_to_button(self, button_id: str) -> CanonicalButton:
+        """Convert a string ID to a canonical button.
+
+        Args:
+            button_id: The string ID (e.g., "left", "back")
+
+        Returns:
+            The canonical button, or UNKNOWN for unrecognized IDs
+        """
+        return _ID_TO_BUTTON.get(button_id, CanonicalButton.UNKNOWN)
 
 
 class WindowsAdapter(PlatformAdapter):
@@ -180,31 +239,9 @@ class WindowsAdapter(PlatformAdapter):
     QT_ALT = 0x08000000
     QT_META = 0x10000000
 
-    def normalize_button(self, qt_button: int) -> CanonicalButton:
-        """Normalize Qt button code on Windows."""
-        mapping = {
-            self.QT_LEFT: CanonicalButton.LEFT,
-            self.QT_RIGHT: CanonicalButton.RIGHT,
-            self.QT_MIDDLE: CanonicalButton.MIDDLE,
-            self.QT_BACK: CanonicalButton.BACK,
-            self.QT_FORWARD: CanonicalButton.FORWARD,
-            self.QT_EXTRA1: CanonicalButton.EXTRA1,
-            self.QT_EXTRA2: CanonicalButton.EXTRA2,
-        }
-        return mapping.get(qt_button, CanonicalButton.UNKNOWN)
-
-    def normalize_modifiers(self, qt_modifiers: int) -> set[str]:
+    def normalize_modifiers(self, qt_modifiers: int) -> frozenset[str]:
         """Normalize Qt modifiers on Windows."""
-        result: set[str] = set()
-        if qt_modifiers & self.QT_SHIFT:
-            result.add("shift")
-        if qt_modifiers & self.QT_CTRL:
-            result.add("ctrl")
-        if qt_modifiers & self.QT_ALT:
-            result.add("alt")
-        if qt_modifiers & self.QT_META:
-            result.add("meta")
-        return result
+        return _QT_MODIFIER_TABLE[(qt_modifiers >> _QT_MODIFIER_SHIFT) & 0xF]
 
 
 class MacOSAdapter(PlatformAdapter):
@@ -237,46 +274,24 @@ class MacOSAdapter(PlatformAdapter):
                            Windows/Linux conventions (Cmd acts as Ctrl)
         """
         self._swap_ctrl_meta = swap_ctrl_meta
+        # The flag never changes, so pick the implementation once here
+        # rather than testing it on every event
+        if not swap_ctrl_meta:
+            self.normalize_modifiers = self._normalize_modifiers_native  # type: ignore[method-assign]
 
-    def normalize_button(self, qt_button: int) -> CanonicalButton:
-        """Normalize Qt button code on macOS."""
-        mapping = {
-            self.QT_LEFT: CanonicalButton.LEFT,
-            self.QT_RIGHT: CanonicalButton.RIGHT,
-            self.QT_MIDDLE: CanonicalButton.MIDDLE,
-            self.QT_BACK: CanonicalButton.BACK,
-            self.QT_FORWARD: CanonicalButton.FORWARD,
-            self.QT_EXTRA1: CanonicalButton.EXTRA1,
-            self.QT_EXTRA2: CanonicalButton.EXTRA2,
-        }
-        return mapping.get(qt_button, CanonicalButton.UNKNOWN)
-
-    def normalize_modifiers(self, qt_modifiers: int) -> set[str]:
+    def normalize_modifiers(self, qt_modifiers: int) -> frozenset[str]:
         """Normalize Qt modifiers on macOS.
 
         By default, swaps Ctrl and Meta so Command key acts like
         Ctrl on other platforms.
         """
-        result: set[str] = set()
-        if qt_modifiers & self.QT_SHIFT:
-            result.add("shift")
-        if qt_modifiers & self.QT_ALT:
-            result.add("alt")
-
-        if self._swap_ctrl_meta:
-            # Swap: Qt Ctrl (Cmd) -> canonical Ctrl
-            #       Qt Meta (Ctrl) -> canonical Meta
-            if qt_modifiers & self.QT_CTRL:
-                result.add("ctrl")
-            if qt_modifiers & self.QT_META:
-                result.add("meta")
-        else:
-            if qt_modifiers & self.QT_CTRL:
-                result.add("meta")  # Cmd -> Meta
-            if qt_modifiers & self.QT_META:
-                result.add("ctrl")  # Ctrl -> Ctrl
-
-        return result
+        # Swap: Qt Ctrl (Cmd) -> canonical Ctrl, Qt Meta (Ctrl) -> canonical Meta.
+        # Qt already reports them that way, so the flags map through unchanged.
+        return _QT_MODIFIER_TABLE[(qt_modifiers >> _QT_MODIFIER_SHIFT) & 0xF]
+
+    def _normalize_modifiers_native(self, qt_modifiers: int) -> frozenset[str]:
+        """Normalize Qt modifiers on macOS with Cmd as Meta and Ctrl as Ctrl."""
+        return _MACOS_NATIVE_MODIFIER_TABLE[(qt_modifiers >> _QT_MODIFIER_SHIFT) & 0xF]
 
 
 class LinuxAdapter(PlatformAdapter):
@@ -300,28 +315,23 @@ class LinuxAdapter(PlatformAdapter):
     QT_ALT = 0x08000000
     QT_META = 0x10000000
 
-    def normalize_button(self, qt_button: int) -> CanonicalButton:
-        """Normalize Qt button code on Linux."""
-        mapping = {
-            self.QT_LEFT: CanonicalButton.LEFT,
-            self.QT_RIGHT: CanonicalButton.RIGHT,
-            self.QT_MIDDLE: CanonicalButton.MIDDLE,
-            self.QT_BACK: CanonicalButton.BACK,
-            self.QT_FORWARD: CanonicalButton.FORWARD,
-            self.QT_EXTRA1: CanonicalButton.EXTRA1,
-            self.QT_EXTRA2: CanonicalButton.EXTRA2,
-        }
-        return mapping.get(qt_button, CanonicalButton.UNKNOWN)
-
-    def normalize_modifiers(self, qt_modifiers: int) -> set[str]:
+    def normalize_modifiers(self, qt_modifiers: int) -> frozenset[str]:
         """Normalize Qt modifiers on Linux."""
-        result: set[str] = set()
-        if qt_modifiers & self.QT_SHIFT:
-            result.add("shift")
-        if qt_modifiers & self.QT_CTRL:
-            result.add("ctrl")
-        if qt_modifiers & self.QT_ALT:
-            result.add("alt")
-        if qt_modifiers & self.QT_META:
-            result.add("meta")
-        return result
+        return _QT_MODIFIER_TABLE[(qt_modifiers >> _QT_MODIFIER_SHIFT) & 0xF]
+
+
+def _create_adapter() -> PlatformAdapter:
+    """Create the adapter for the current platform."""
+    adapter: PlatformAdapter
+    if sys.platform == "win32":
+        adapter = WindowsAdapter()
+    elif sys.platform == "darwin":
+        adapter = MacOSAdapter()
+    else:
+        adapter = LinuxAdapter()
+    logger.info(f"Using platform adapter: {adapter.__class__.__name__}")
+    return adapter
+
+
+# Module-level singleton returned by PlatformAdapter.get_instance()
+_ADAPTER = _create_adapter()
@@ -8,20 +8,32 @@ from __future__ import annotations
 
 import json
 import logging
+import sys
+from collections.abc import Mapping as MappingABC
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Callable
 
+from MouseMasterLib._compat import DATACLASS_SLOTS, json_dumps, json_loads
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to read preset files in parallel
+_MAX_LOAD_WORKERS = 8
+
 # Current preset format version
 CURRENT_PRESET_VERSION = "1.0"
 
 # Migration functions: version -> function that transforms data dict
-# Each migration takes data dict and returns migrated data dict
+# Each migration takes data dict and returns migrated data dict, with
+# "version" set to the version it produces. Migrations are chained until
+# the current version is reached; one that leaves "version" unchanged is
+# taken to produce the current version.
 PRESET_MIGRATIONS: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
     # Example migration from 0.9 to 1.0:
-    # "0.9": lambda data: {**data, "newField": "defaultValue"},
+    # "0.9": lambda data: {**data, "version": "1.0", "newField": "defaultValue"},
 }
 
 
@@ -36,26 +48,36 @@ def migrate_preset_data(data: dict[str, Any]) -> dict[str, Any]:
     """
     version = data.get("version", "1.0")
 
-    # Already at current version
-    if version == CURRENT_PRESET_VERSION:
+    # Already at current version, or nothing to migrate: return as is
+    if version == CURRENT_PRESET_VERSION or version not in PRESET_MIGRATIONS:
         return data
 
-    # Apply migrations in order
-    # This is a simple linear migration; for complex version graphs,
-    # a more sophisticated approach would be needed
+    # Only copy when a migration actually runs, so the caller's dict is
+    # never modified.
+    original_version = version
     migrated = data.copy()
-    if version in PRESET_MIGRATIONS:
-        migrated = PRESET_MIGRATIONS[version](migrated)
-        migrated["version"] = CURRENT_PRESET_VERSION
-        logger.info(f"Migrated preset from version {version} to {CURRENT_PRESET_VERSION}")
+    while version != CURRENT_PRESET_VERSION:
+        migration = PRESET_MIGRATIONS.get(version)
+        if migration is None:
+            logger.warning(f"No migration from preset version {version}")
+            break
+        migrated = migration(migrated)
+        next_version = migrated.get("version", version)
+        version = CURRENT_PRESET_VERSION if next_version == version else next_version
+    migrated["version"] = version
+    logger.info(f"Migrated preset from version {original_version} to {version}")
 
     return migrated
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Mapping:
     """A single button-to-action mapping.
 
+    Mappings are immutable; replace a mapping with ``Preset.set_mapping``
+    rather than editing it in place. ``parameters`` is stored as a read-only
+    copy and is left out of the hash, so mappings can be hashed.
+
     Attributes:
         action: The action type (e.g., "slicer_action", "python_command")
         action_id: Specific action identifier
@@ -64,7 +86,10 @@ class Mapping:
 
     action: str
     action_id: str | None = None
-    parameters: dict[str, Any] = field(default_factory=dict)
+    parameters: MappingABC[str, Any] = field(default_factory=dict, hash=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "parameters", MappingProxyType(dict(self.parameters)))
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Mapping:
@@ -81,11 +106,11 @@ class Mapping:
         if self.action_id:
             result["actionId"] = self.action_id
         if self.parameters:
-            result["parameters"] = self.parameters
+            result["parameters"] = dict(self.parameters)
         return result
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Preset:
     """A complete button mapping preset.
 
@@ -111,24 +136,61 @@ class Preset:
     context_mappings: dict[str, dict[str, Mapping]] = field(default_factory=dict)
     author: str | None = None
     description: str | None = None
+    # Flattened (button_id, context) -> Mapping index; see _reindex_mappings
+    _flat: dict[tuple[str, str | None], Mapping] = field(init=False, repr=False, compare=False)
+    # Serialized form last read from or written to _saved_path; lets
+    # PresetManager.save_preset skip rewriting a file with the same content
+    _saved_dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _saved_path: Path | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._reindex_mappings()
+
+    def _reindex_mappings(self) -> None:
+        """Rebuild the flattened mapping index from the nested dictionaries.
+
+        Default mappings are keyed with a context of None. Keys are interned
+        so lookups with interned button IDs and module names compare by
+        identity. ``set_mapping`` and ``remove_mapping`` keep the index in
+        sync; call this after modifying ``mappings`` or ``context_mappings``
+        directly.
+        """
+        intern = sys.intern
+        flat: dict[tuple[str, str | None], Mapping] = {
+            (intern(button_id), None): mapping for button_id, mapping in self.mappings.items()
+        }
+        for context, context_mappings in self.context_mappings.items():
+            if not context:
+                continue
+            context = intern(context)
+            for button_id, mapping in context_mappings.items():
+                flat[(intern(button_id), context)] = mapping
+        self._flat = flat
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Preset:
         """Create a Preset from a dictionary."""
-        # Migrate old versions to current version
-        data = migrate_preset_data(data)
+        # Migrate old versions to current version; nearly every preset is
+        # already current, so only call into the migration code otherwise
+        if data.get("version") != CURRENT_PRESET_VERSION:
+            data = migrate_preset_data(data)
+
+        # Button IDs and module names repeat across presets; intern them so
+        # the copies share memory and key comparisons short-circuit
+        intern = sys.intern
 
         # Parse default mappings
         mappings: dict[str, Mapping] = {}
         for button_id, mapping_data in data.get("mappings", {}).items():
-            mappings[button_id] = Mapping.from_dict(mapping_data)
+            mappings[intern(button_id)] = Mapping.from_dict(mapping_data)
 
         # Parse context-specific mappings
         context_mappings: dict[str, dict[str, Mapping]] = {}
         for context, context_data in data.get("contextMappings", {}).items():
-            context_mappings[context] = {}
-            for button_id, mapping_data in context_data.items():
-                context_mappings[context][button_id] = Mapping.from_dict(mapping_data)
+            context_mappings[intern(context)] = {
+                intern(button_id): Mapping.from_dict(mapping_data)
+                for button_id, mapping_data in context_data.items()
+            }
 
         return cls(
             id=data["id"],
@@ -159,10 +221,15 @@ class Preset:
         path = Path(path)
         logger.debug(f"Loading preset from {path}")
 
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = json_loads(f.read())
 
-        return cls.from_dict(data)
+        preset = cls.from_dict(data)
+        # from_dict does not keep references into data, so it can serve as
+        # the snapshot; migrated or normalized presets compare unequal
+        preset._saved_dict = data
+        preset._saved_path = path
+        return preset
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -196,8 +263,11 @@ class Preset:
         path = Path(path)
         logger.debug(f"Saving preset to {path}")
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        data = self.to_dict()
+        with open(path, "wb") as f:
+            f.write(json_dumps(data))
+        self._saved_dict = data
+        self._saved_path = path
 
     def get_mapping(self, button_id: str, context: str | None = None) -> Mapping | None:
         """Get the mapping for a button, considering context.
@@ -211,16 +281,31 @@ class Preset:
         Returns:
             The Mapping if found, None otherwise
         """
+        flat = self._flat
+
         # Try context-specific first
-        if (
-            context
-            and context in self.context_mappings
-            and button_id in self.context_mappings[context]
-        ):
-            return self.context_mappings[context][button_id]
+        if context:
+            mapping = flat.get((button_id, context))
+            if mapping is not None:
+                return mapping
 
         # Fall back to default
-        return self.mappings.get(button_id)
+        return flat.get((button_id, None))
+
+    def build_lookup(self) -> dict[tuple[str, str | None], Mapping]:
+        """Flatten all mappings into one (button_id, context) lookup table.
+
+        Default mappings are keyed with a context of None, so
+        ``lookup.get((button_id, context)) or lookup.get((button_id, None))``
+        gives the same result as ``get_mapping(button_id, context)``. The
+        table is a snapshot copy of the preset's index; rebuild it after
+        changing the preset. Keys are interned so lookups with interned
+        button IDs and module names compare by identity.
+
+        Returns:
+            Dictionary mapping (button_id, context) to Mapping
+        """
+        return dict(self._flat)
 
     def set_mapping(self, button_id: str, mapping: Mapping, context: str | None = None) -> None:
         """Set a mapping for a button.
@@ -236,6 +321,7 @@ class Preset:
             self.context_mappings[context][button_id] = mapping
         else:
             self.mappings[button_id] = mapping
+        self._flat[(sys.intern(button_id), sys.intern(context) if context else None)] = mapping
 
     def remove_mapping(self, button_id: str, context: str | None = None) -> bool:
         """Remove a mapping for a button.
@@ -253,13 +339,24 @@ class Preset:
             and button_id in self.context_mappings[context]
         ):
             del self.context_mappings[context][button_id]
+            del self._flat[(button_id, context)]
             return True
         if not context and button_id in self.mappings:
             del self.mappings[button_id]
+            del self._flat[(button_id, None)]
             return True
         return False
 
 
+def _load_preset_file(path: Path) -> Preset | None:
+    """Load one preset file, logging and skipping it if it is invalid."""
+    try:
+        return Preset.from_json_file(path)
+    except (json.JSONDecodeError, KeyError) as e:
+        logger.warning(f"Failed to load preset {path}: {e}")
+        return None
+
+
 class PresetManager:
     """Manages loading, saving, and organizing presets.
 
@@ -285,6 +382,8 @@ class PresetManager:
         self._user_dir = Path(user_dir) if user_dir else None
         self._presets: dict[str, Preset] = {}
         self._loaded = False
+        # File name stem -> path, for loading single presets on demand
+        self._index: dict[str, Path] | None = None
 
     def load_all(self) -> None:
         """Load all presets from builtin and user directories."""
@@ -301,6 +400,19 @@ class PresetManager:
         self._loaded = True
         logger.info(f"Loaded {len(self._presets)} presets")
 
+    def _build_index(self) -> dict[str, Path]:
+        """Map preset file name stems to paths without parsing the files.
+
+        User presets shadow built-in presets with the same file name.
+        """
+        index: dict[str, Path] = {}
+        for directory in (self._builtin_dir, self._user_dir):
+            if directory and directory.exists():
+                for path in directory.iterdir():
+                    if path.suffix == ".json":
+                        index[path.stem] = path
+        return index
+
     def _load_from_directory(self, directory: Path, is_builtin: bool) -> None:
         """Load all preset files from a directory.
 
@@ -308,25 +420,48 @@ class PresetManager:
             directory: Directory to load from
             is_builtin: Whether these are built-in presets
         """
-        for path in directory.glob("*.json"):
-            try:
-                preset = Preset.from_json_file(path)
+        # A flat directory only needs a suffix check, not glob pattern matching
+        paths = [path for path in directory.iterdir() if path.suffix == ".json"]
+        if not paths:
+            return
+
+        # File reads dominate, so overlap them; results keep directory order
+        with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(paths))) as executor:
+            presets = list(executor.map(_load_preset_file, paths))
+
+        for preset in presets:
+            if preset is not None:
                 self._presets[preset.id] = preset
                 logger.debug(f"Loaded preset: {preset.id} ({'builtin' if is_builtin else 'user'})")
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Failed to load preset {path}: {e}")
 
     def get_preset(self, preset_id: str) -> Preset | None:
         """Get a preset by ID.
 
+        Before all presets are loaded, only ``<preset_id>.json`` is read
+        (the name ``save_preset`` uses). If that file is missing or holds a
+        different ID, all presets are loaded instead.
+
         Args:
             preset_id: The preset ID
 
         Returns:
             The Preset if found, None otherwise
         """
-        if not self._loaded:
-            self.load_all()
+        preset = self._presets.get(preset_id)
+        if preset is not None or self._loaded:
+            return preset
+
+        if self._index is None:
+            self._index = self._build_index()
+        path = self._index.get(preset_id)
+        if path is not None:
+            preset = _load_preset_file(path)
+            if preset is not None and preset.id == preset_id:
+                self._presets[preset_id] = preset
+                return preset
+
+        # File names need not match IDs; fall back to a full scan
+        self.load_all()
         return self._presets.get(preset_id)
 
     def get_presets_for_mouse(self, mouse_id: str) -> list[Preset]:
@@ -355,6 +490,9 @@ class PresetManager:
     def save_preset(self, preset: Preset) -> None:
         """Save a preset to the user directory.
 
+        The file is not rewritten if the preset serializes to the same
+        content it was last read from or written to the same path with.
+
         Args:
             preset: The preset to save
 
@@ -366,8 +504,17 @@ class PresetManager:
 
         self._user_dir.mkdir(parents=True, exist_ok=True)
         path = self._user_dir / f"{preset.id}.json"
-        preset.to_json_file(path)
+        if (
+            preset._saved_path != path
+            or not path.exists()
+            or preset.to_dict() != preset._saved_dict
+        ):
+            preset.to_json_file(path)
+        else:
+            logger.debug(f"Preset unchanged, not rewriting: {preset.id}")
         self._presets[preset.id] = preset
+        if self._index is not None:
+            self._index[preset.id] = path
         logger.info(f"Saved preset: {preset.id}")
 
     def delete_preset(self, preset_id: str) -> bool:
@@ -385,8 +532,9 @@ class PresetManager:
         path = self._user_dir / f"{preset_id}.json"
         if path.exists():
             path.unlink()
-            if preset_id in self._presets:
-                del self._presets[preset_id]
+            self._presets.pop(preset_id, None)
+            # A built-in preset with this name may now be visible again
+            self._index = None
             logger.info(f"Deleted preset: {preset_id}")
             return True
         return False
@@ -6,70 +6,206 @@ They test the pure-Python components that don't require Qt/VTK/Slicer.
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
 
-# Add the module to the path for imports
-MODULE_DIR = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(MODULE_DIR))
+# MouseMaster/ and this directory are on sys.path via the pytest pythonpath setting
+from MouseMasterLib._compat import json_dumps
+from MouseMasterLib.platform_adapter import CanonicalButton, NormalizedEvent
 
 # ============================================================================
 # Centralized Slicer/Qt/VTK mock setup
 # ============================================================================
 # These mocks must be installed in sys.modules BEFORE any MouseMasterLib
-# imports occur. This is done at module load time.
+# imports occur. This is done at module load time; each test then gets its
+# own fresh set (see module_mocks below).
+
+
+def _build_module_mocks() -> dict[str, MagicMock]:
+    """Build a fresh set of Slicer/Qt/VTK module mocks keyed by module name."""
+    mock_slicer = MagicMock(name="slicer")
+    mock_slicer.util = MagicMock(name="slicer.util")
+    return {
+        "slicer": mock_slicer,
+        "slicer.util": mock_slicer.util,
+        "qt": MagicMock(name="qt"),
+        "ctk": MagicMock(name="ctk"),
+        "vtk": MagicMock(name="vtk"),
+        "slicer.ScriptedLoadableModule": MagicMock(name="slicer.ScriptedLoadableModule"),
+    }
 
-_MOCK_SLICER = MagicMock(name="slicer")
-_MOCK_SLICER_UTIL = MagicMock(name="slicer.util")
-_MOCK_SLICER.util = _MOCK_SLICER_UTIL
-_MOCK_QT = MagicMock(name="qt")
-_MOCK_CTK = MagicMock(name="ctk")
-_MOCK_VTK = MagicMock(name="vtk")
-_MOCK_SLICER_SCRIPTED = MagicMock(name="slicer.ScriptedLoadableModule")
 
 # Install mocks in sys.modules
-sys.modules["slicer"] = _MOCK_SLICER
-sys.modules["slicer.util"] = _MOCK_SLICER_UTIL
-sys.modules["qt"] = _MOCK_QT
-sys.modules["ctk"] = _MOCK_CTK
-sys.modules["vtk"] = _MOCK_VTK
-sys.modules["slicer.ScriptedLoadableModule"] = _MOCK_SLICER_SCRIPTED
+sys.modules.update(_build_module_mocks())
 
 
 @pytest.fixture(autouse=True)
-def reset_slicer_mocks():
-    """Reset all Slicer/Qt mocks before each test to ensure isolation."""
-    _MOCK_SLICER.reset_mock()
-    _MOCK_SLICER_UTIL.reset_mock()
-    _MOCK_QT.reset_mock()
-    _MOCK_CTK.reset_mock()
-    _MOCK_VTK.reset_mock()
-    _MOCK_SLICER_SCRIPTED.reset_mock()
+def module_mocks(monkeypatch: pytest.MonkeyPatch) -> dict[str, MagicMock]:
+    """Install fresh Slicer/Qt/VTK mocks in sys.modules for each test.
+
+    Every test starts from a new, untouched mock tree, which isolates tests
+    without walking and resetting a shared tree; the load-time mocks are put
+    back in sys.modules when the test finishes.
+    """
+    mocks = _build_module_mocks()
+    for name, mock in mocks.items():
+        monkeypatch.setitem(sys.modules, name, mock)
+    return mocks
+
+
+@pytest.fixture
+def slicer_mock(module_mocks: dict[str, MagicMock]) -> MagicMock:
+    """Fresh slicer module mock installed for the current test."""
+    return module_mocks["slicer"]
+
+
+@pytest.fixture
+def slicer_util_mock(module_mocks: dict[str, MagicMock]) -> MagicMock:
+    """Fresh slicer.util module mock installed for the current test."""
+    return module_mocks["slicer.util"]
+
+
+@pytest.fixture
+def qt_mock(module_mocks: dict[str, MagicMock]) -> MagicMock:
+    """Fresh qt module mock installed for the current test."""
+    return module_mocks["qt"]
+
+
+# Segment editor methods called by the built-in actions and effect handlers
+_SEGMENT_EDITOR_SPEC = (
+    "currentSegmentID",
+    "redo",
+    "segmentationNode",
+    "setActiveEffectByName",
+    "setCurrentSegmentID",
+    "undo",
+)
 
-    # Re-establish the slicer.util relationship after reset
-    _MOCK_SLICER.util = _MOCK_SLICER_UTIL
 
-    yield
+@pytest.fixture
+def segment_editor(slicer_mock: MagicMock) -> MagicMock:
+    """Segment editor reached through the Segment Editor module widget.
+
+    Installed as ``slicer.modules.segmenteditor.widgetRepresentation().self().editor``
+    on the fresh slicer mock. It is spec'd to the editor methods the actions
+    use, so a misspelled call fails instead of silently returning a mock.
+    """
+    editor = MagicMock(spec=_SEGMENT_EDITOR_SPEC)
+    widget = slicer_mock.modules.segmenteditor.widgetRepresentation.return_value
+    widget.self.return_value.editor = editor
+    return editor
+
+
+def make_segment_editor_stub(
+    num_segments: int = 0, current_id: str = "", new_segment_id: str = ""
+) -> SimpleNamespace:
+    """Build a stand-in for the Segment Editor widget's ``self()`` object.
+
+    Segments are named ``segment_0`` .. ``segment_<n-1>``. Plain attributes
+    and lambdas are used throughout; only the calls tests assert on
+    (``editor.setCurrentSegmentID`` and ``AddEmptySegment``) are mocks.
+    The segmentation's ``GetMTime`` returns 1 until a test replaces it.
+    """
+    segmentation = SimpleNamespace(
+        GetMTime=lambda: 1,
+        GetNumberOfSegments=lambda: num_segments,
+        GetNthSegmentID=lambda i: f"segment_{i}",
+        AddEmptySegment=MagicMock(return_value=new_segment_id),
+    )
+    segmentation_node = SimpleNamespace(GetSegmentation=lambda: segmentation)
+    editor = SimpleNamespace(
+        segmentationNode=lambda: segmentation_node,
+        currentSegmentID=lambda: current_id,
+        setCurrentSegmentID=MagicMock(),
+    )
+    return SimpleNamespace(editor=editor, segmentation=segmentation)
+
+
+@pytest.fixture
+def normalized_back_event() -> NormalizedEvent:
+    """Normalized press of the ``back`` button with no modifiers held."""
+    return NormalizedEvent(button=CanonicalButton.BACK, button_id="back", modifiers=frozenset())
+
+
+@pytest.fixture
+def mock_platform_adapter(normalized_back_event: NormalizedEvent) -> MagicMock:
+    """Platform adapter whose ``normalize_event`` yields ``normalized_back_event``."""
+    adapter = MagicMock()
+    adapter.normalize_event.return_value = normalized_back_event
+    return adapter
+
+
+@pytest.fixture
+def patched_adapter(monkeypatch: pytest.MonkeyPatch, mock_platform_adapter: MagicMock) -> MagicMock:
+    """Serve ``mock_platform_adapter`` from ``PlatformAdapter.get_instance``.
+
+    The replacement ``get_instance`` is itself a mock, so tests can assert
+    how often the adapter was looked up.
+    """
+    monkeypatch.setattr(
+        "MouseMasterLib.platform_adapter.PlatformAdapter.get_instance",
+        MagicMock(return_value=mock_platform_adapter),
+    )
+    return mock_platform_adapter
 
 
-def get_mock_slicer():
-    """Get the centralized slicer mock."""
-    return _MOCK_SLICER
+@pytest.fixture
+def patched_registry(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Serve a fresh mock registry from ``ActionRegistry.get_instance``."""
+    registry = MagicMock()
+    monkeypatch.setattr(
+        "MouseMasterLib.action_registry.ActionRegistry.get_instance",
+        MagicMock(return_value=registry),
+    )
+    return registry
 
 
-def get_mock_slicer_util():
-    """Get the centralized slicer.util mock."""
-    return _MOCK_SLICER_UTIL
+def _patch_handler_execute(monkeypatch: pytest.MonkeyPatch, handler_cls: type) -> Any:
+    """Replace ``handler_cls.execute`` with an autospec'd mock.
 
+    The event handler caches its handler classes, so the method is swapped
+    rather than the class. Being autospec'd, the mock binds like a method
+    and records the handler instance as the first call argument.
+    """
+    execute = create_autospec(handler_cls.execute)
+    monkeypatch.setattr(handler_cls, "execute", execute)
+    return execute
 
-def get_mock_qt():
-    """Get the centralized qt mock."""
-    return _MOCK_QT
+
+@pytest.fixture
+def patched_python_handler(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Mocked ``PythonCommandHandler.execute``."""
+    from MouseMasterLib.action_registry import PythonCommandHandler
+
+    return _patch_handler_execute(monkeypatch, PythonCommandHandler)
+
+
+@pytest.fixture
+def patched_keyboard_handler(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Mocked ``KeyboardShortcutHandler.execute``."""
+    from MouseMasterLib.action_registry import KeyboardShortcutHandler
+
+    return _patch_handler_execute(monkeypatch, KeyboardShortcutHandler)
+
+
+@pytest.fixture
+def builtin_registry(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Install a fresh ActionRegistry singleton holding the built-in actions.
+
+    The registry is rebuilt for every test so that entries and the
+    registry that built-in handlers are bound to are never shared.
+    """
+    from MouseMasterLib import action_registry
+
+    registry = action_registry._create_registry()
+    monkeypatch.setattr(action_registry, "_REGISTRY", registry)
+    action_registry.SegmentEditorEffectHandler.invalidate_editor_cache()
+    return registry
 
 
 # =============================================================================
@@ -102,102 +238,127 @@ def pytest_collection_modifyitems(config, items):
     except (ImportError, AttributeError):
         in_slicer = False
 
-    if not in_slicer:
-        skip_slicer = pytest.mark.skip(reason="Test requires Slicer environment")
-        for item in items:
-            if "requires_slicer" in item.keywords:
-                item.add_marker(skip_slicer)
-
-
-@pytest.fixture
+    if in_slicer:
+        return
+
+    # Find the marked items first; add_marker is only paid for those
+    marked = [item for item in items if "requires_slicer" in item.keywords]
+    if not marked:
+        return
+    skip_slicer = pytest.mark.skip(reason="Test requires Slicer environment")
+    for item in marked:
+        item.add_marker(skip_slicer)
+
+
+# Sample data shared by every test that requests it (see the fixtures below)
+_SAMPLE_MOUSE_PROFILE_DATA: dict[str, Any] = {
+    "id": "test_mouse",
+    "name": "Test Mouse",
+    "vendor": "Test Vendor",
+    "vendorId": "0x1234",
+    "productIds": ["0x5678"],
+    "buttons": [
+        {"id": "left", "name": "Left Click", "qtButton": 1, "remappable": False},
+        {"id": "right", "name": "Right Click", "qtButton": 2, "remappable": False},
+        {"id": "middle", "name": "Middle Click", "qtButton": 4, "remappable": True},
+        {
+            "id": "back",
+            "name": "Back",
+            "qtButton": 8,
+            "remappable": True,
+            "defaultAction": "edit_undo",
+        },
+    ],
+    "features": {"horizontalScroll": True, "thumbWheel": False},
+}
+
+_SAMPLE_PRESET_DATA: dict[str, Any] = {
+    "id": "test_preset",
+    "name": "Test Preset",
+    "version": "1.0",
+    "mouseId": "test_mouse",
+    "author": "Test Author",
+    "description": "A test preset",
+    "mappings": {
+        "middle": {"action": "view_reset_3d"},
+        "back": {"action": "edit_undo"},
+    },
+    "contextMappings": {
+        "SegmentEditor": {
+            "back": {"action": "segment_previous"},
+        }
+    },
+}
+
+
+@pytest.fixture(scope="session")
 def sample_mouse_profile_data() -> dict[str, Any]:
-    """Sample mouse profile data for testing."""
-    return {
-        "id": "test_mouse",
-        "name": "Test Mouse",
-        "vendor": "Test Vendor",
-        "vendorId": "0x1234",
-        "productIds": ["0x5678"],
-        "buttons": [
-            {"id": "left", "name": "Left Click", "qtButton": 1, "remappable": False},
-            {"id": "right", "name": "Right Click", "qtButton": 2, "remappable": False},
-            {"id": "middle", "name": "Middle Click", "qtButton": 4, "remappable": True},
-            {
-                "id": "back",
-                "name": "Back",
-                "qtButton": 8,
-                "remappable": True,
-                "defaultAction": "edit_undo",
-            },
-        ],
-        "features": {"horizontalScroll": True, "thumbWheel": False},
-    }
+    """Sample mouse profile data for testing.
 
+    The dict is shared across the session; copy it before modifying.
+    """
+    return _SAMPLE_MOUSE_PROFILE_DATA
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_preset_data() -> dict[str, Any]:
-    """Sample preset data for testing."""
-    return {
-        "id": "test_preset",
-        "name": "Test Preset",
-        "version": "1.0",
-        "mouseId": "test_mouse",
-        "author": "Test Author",
-        "description": "A test preset",
-        "mappings": {
-            "middle": {"action": "view_reset_3d"},
-            "back": {"action": "edit_undo"},
-        },
-        "contextMappings": {
-            "SegmentEditor": {
-                "back": {"action": "segment_previous"},
-            }
-        },
-    }
+    """Sample preset data for testing.
 
+    The dict is shared across the session; copy it before modifying.
+    """
+    return _SAMPLE_PRESET_DATA
 
-@pytest.fixture
-def temp_json_file(tmp_path: Path, sample_mouse_profile_data: dict) -> Path:
-    """Create a temporary JSON file with sample data."""
-    file_path = tmp_path / "test_profile.json"
-    with open(file_path, "w") as f:
-        json.dump(sample_mouse_profile_data, f)
+
+@pytest.fixture(scope="session")
+def temp_json_file(
+    tmp_path_factory: pytest.TempPathFactory, sample_mouse_profile_data: dict
+) -> Path:
+    """Create a temporary JSON file with sample data.
+
+    The file is written once per session; tests must not modify it.
+    """
+    file_path = tmp_path_factory.mktemp("profiles") / "test_profile.json"
+    file_path.write_bytes(json_dumps(sample_mouse_profile_data))
     return file_path
 
 
-@pytest.fixture
-def temp_preset_file(tmp_path: Path, sample_preset_data: dict) -> Path:
-    """Create a temporary preset file."""
-    file_path = tmp_path / "test_preset.json"
-    with open(file_path, "w") as f:
-        json.dump(sample_preset_data, f)
+@pytest.fixture(scope="session")
+def temp_preset_file(tmp_path_factory: pytest.TempPathFactory, sample_preset_data: dict) -> Path:
+    """Create a temporary preset file.
+
+    The file is written once per session; tests must not modify it.
+    """
+    file_path = tmp_path_factory.mktemp("presets") / "test_preset.json"
+    file_path.write_bytes(json_dumps(sample_preset_data))
     return file_path
 
 
-@pytest.fixture
-def mock_qt() -> MagicMock:
-    """Mock Qt module for testing event handling."""
-    qt_mock = MagicMock()
-    qt_mock.QEvent.MouseButtonPress = 2
-    qt_mock.QEvent.MouseButtonRelease = 3
-    qt_mock.LeftButton = 1
-    qt_mock.RightButton = 2
-    qt_mock.MiddleButton = 4
-    qt_mock.BackButton = 8
-    qt_mock.ForwardButton = 16
-    qt_mock.ShiftModifier = 0x02000000
-    qt_mock.ControlModifier = 0x04000000
-    qt_mock.AltModifier = 0x08000000
-    qt_mock.MetaModifier = 0x10000000
-    return qt_mock
+@pytest.fixture(scope="session")
+def mock_qt() -> SimpleNamespace:
+    """Stand-in Qt namespace with the event and button constants.
+
+    Only plain attribute reads are needed, so a SimpleNamespace is enough
+    and one instance is shared by the whole session.
+    """
+    return SimpleNamespace(
+        QEvent=SimpleNamespace(MouseButtonPress=2, MouseButtonRelease=3),
+        LeftButton=1,
+        RightButton=2,
+        MiddleButton=4,
+        BackButton=8,
+        ForwardButton=16,
+        ShiftModifier=0x02000000,
+        ControlModifier=0x04000000,
+        AltModifier=0x08000000,
+        MetaModifier=0x10000000,
+    )
 
 
-@pytest.fixture
-def mock_slicer() -> MagicMock:
-    """Mock slicer module for testing."""
-    slicer_mock = MagicMock()
-    slicer_mock.app.moduleManager().currentModule.return_value = "Welcome"
-    return slicer_mock
+@pytest.fixture(scope="session")
+def mock_slicer() -> SimpleNamespace:
+    """Stand-in slicer namespace whose current module is "Welcome"."""
+    module_manager = SimpleNamespace(currentModule=lambda: "Welcome")
+    return SimpleNamespace(app=SimpleNamespace(moduleManager=lambda: module_manager))
 
 
 @pytest.fixture
@@ -18,9 +18,7 @@ The script:
 
 from __future__ import annotations
 
-import json
 import sys
-from datetime import datetime
 from pathlib import Path
 
 
@@ -37,8 +35,77 @@ def get_screenshots_dir() -> Path:
     return Path(__file__).parent / "screenshots"
 
 
+class _Skipped(Exception):
+    """Raised by a widget check that does not apply to the current widget."""
+
+
+def _check_mouse_selector(slicer, widget, capture) -> str:
+    if not hasattr(widget, "mouseSelector") or widget.mouseSelector.count <= 1:
+        raise _Skipped("No mice available")
+    widget.mouseSelector.setCurrentIndex(1)
+    slicer.app.processEvents()
+    capture.capture_module_widget("After selecting mouse")
+    return "Mouse selector works"
+
+
+def _check_preset_selector(slicer, widget, capture) -> str:
+    if not hasattr(widget, "presetSelector") or widget.presetSelector.count <= 1:
+        raise _Skipped("No presets available")
+    widget.presetSelector.setCurrentIndex(1)
+    slicer.app.processEvents()
+    capture.capture_module_widget("After selecting preset")
+    return "Preset selector works"
+
+
+def _check_context_toggle(slicer, widget, capture) -> str:
+    if not hasattr(widget, "contextToggle"):
+        raise _Skipped("No context toggle")
+    initial_state = widget.contextToggle.checked
+    widget.contextToggle.setChecked(True)
+    slicer.app.processEvents()
+    capture.capture_module_widget("Context toggle enabled")
+
+    # Process the restore too, so later captures show the original state
+    widget.contextToggle.setChecked(initial_state)
+    slicer.app.processEvents()
+    return "Context toggle works"
+
+
+def _check_enable_button(slicer, widget, capture) -> str:
+    if not hasattr(widget, "enableButton"):
+        raise _Skipped("No enable button")
+    capture.capture_widget(widget.enableButton, "Enable button state")
+    return "Enable button accessible"
+
+
+def _check_mapping_table(slicer, widget, capture) -> str:
+    if not hasattr(widget, "mappingTable"):
+        raise _Skipped("No mapping table")
+    capture.capture_widget(widget.mappingTable, "Mapping table")
+    # Handle both property and method access for rowCount
+    row_count = widget.mappingTable.rowCount
+    if callable(row_count):
+        row_count = row_count()
+    return f"Mapping table has {row_count} rows"
+
+
+# Widget checks run in order by run_tests(); each returns its pass message
+WIDGET_CHECKS = [
+    ("Mouse selector", _check_mouse_selector),
+    ("Preset selector", _check_preset_selector),
+    ("Context toggle", _check_context_toggle),
+    ("Enable button", _check_enable_button),
+    ("Mapping table", _check_mapping_table),
+]
+
+
 def run_tests():
     """Run the MouseMaster integration tests with screenshots."""
+    # Imported here so importing this module (e.g. during test collection)
+    # stays cheap; they are only needed once the run starts
+    import json
+    from datetime import datetime
+
     import slicer
 
     screenshots_dir = get_screenshots_dir()
@@ -74,89 +141,20 @@ def run_tests():
         widget = widget_rep.self()
         capture.capture_module_widget("MouseMaster module initial state")
 
-        # Run test: Mouse selector
-        print("\nTest: Mouse selector...")
-        try:
-            if hasattr(widget, "mouseSelector") and widget.mouseSelector.count > 1:
-                widget.mouseSelector.setCurrentIndex(1)
-                slicer.app.processEvents()
-                capture.capture_module_widget("After selecting mouse")
-                print("  PASSED: Mouse selector works")
-                results["passed"] += 1
-            else:
-                print("  SKIPPED: No mice available")
-        except Exception as e:
-            print(f"  FAILED: {e}")
-            results["failed"] += 1
-            results["errors"].append(f"Mouse selector: {e}")
-
-        # Run test: Preset selector
-        print("\nTest: Preset selector...")
-        try:
-            if hasattr(widget, "presetSelector") and widget.presetSelector.count > 1:
-                widget.presetSelector.setCurrentIndex(1)
-                slicer.app.processEvents()
-                capture.capture_module_widget("After selecting preset")
-                print("  PASSED: Preset selector works")
-                results["passed"] += 1
-            else:
-                print("  SKIPPED: No presets available")
-        except Exception as e:
-            print(f"  FAILED: {e}")
-            results["failed"] += 1
-            results["errors"].append(f"Preset selector: {e}")
-
-        # Run test: Context toggle
-        print("\nTest: Context toggle...")
-        try:
-            if hasattr(widget, "contextToggle"):
-                initial_state = widget.contextToggle.checked
-                widget.contextToggle.setChecked(True)
-                slicer.app.processEvents()
-                capture.capture_module_widget("Context toggle enabled")
-
-                widget.contextToggle.setChecked(initial_state)
-                slicer.app.processEvents()
-                print("  PASSED: Context toggle works")
-                results["passed"] += 1
-            else:
-                print("  SKIPPED: No context toggle")
-        except Exception as e:
-            print(f"  FAILED: {e}")
-            results["failed"] += 1
-            results["errors"].append(f"Context toggle: {e}")
-
-        # Run test: Enable button
-        print("\nTest: Enable button...")
-        try:
-            if hasattr(widget, "enableButton"):
-                capture.capture_widget(widget.enableButton, "Enable button state")
-                print("  PASSED: Enable button accessible")
-                results["passed"] += 1
-            else:
-                print("  SKIPPED: No enable button")
-        except Exception as e:
-            print(f"  FAILED: {e}")
-            results["failed"] += 1
-            results["errors"].append(f"Enable button: {e}")
-
-        # Run test: Mapping table
-        print("\nTest: Mapping table...")
-        try:
-            if hasattr(widget, "mappingTable"):
-                capture.capture_widget(widget.mappingTable, "Mapping table")
-                # Handle both property and method access for rowCount
-                row_count = widget.mappingTable.rowCount
-                if callable(row_count):
-                    row_count = row_count()
-                print(f"  PASSED: Mapping table has {row_count} rows")
-                results["passed"] += 1
-            else:
-                print("  SKIPPED: No mapping table")
-        except Exception as e:
-            print(f"  FAILED: {e}")
-            results["failed"] += 1
-            results["errors"].append(f"Mapping table: {e}")
+        for label, check in WIDGET_CHECKS:
+            print(f"\nTest: {label}...")
+            try:
+                message = check(slicer, widget, capture)
+            except _Skipped as e:
+                print(f"  SKIPPED: {e}")
+                continue
+            except Exception as e:
+                print(f"  FAILED: {e}")
+                results["failed"] += 1
+                results["errors"].append(f"{label}: {e}")
+                continue
+            print(f"  PASSED: {message}")
+            results["passed"] += 1
 
         # Capture final state
         capture.capture_layout("Final layout after all tests")
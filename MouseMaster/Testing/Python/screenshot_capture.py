@@ -15,8 +15,13 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import json
-from dataclasses import dataclass, field
+import operator
+import os
+import re
+import sys
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -24,17 +29,87 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     pass
 
+# This module is loaded standalone inside Slicer, before MouseMasterLib is
+# importable, so it only depends on the standard library
+_DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class ScreenshotInfo:
     """Information about a captured screenshot."""
 
     filename: str
     description: str
     group: str
-    timestamp: str
+    timestamp: datetime
     capture_type: str  # "layout", "slice_view", "3d_view", "widget"
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] | None = None  # None when there is no metadata
+
+
+@functools.cache
+def _detect_slicer() -> bool:
+    """Check whether we're running inside real Slicer (not the test mocks).
+
+    The result cannot change within a process, so it is computed once.
+    """
+    try:
+        from unittest.mock import MagicMock
+
+        import slicer
+
+        return (
+            hasattr(slicer, "mrmlScene")
+            and not isinstance(slicer.mrmlScene, MagicMock)
+            and hasattr(slicer, "app")
+            and not isinstance(slicer.app, MagicMock)
+        )
+    except (ImportError, AttributeError):
+        return False
+
+
+class _FilenameCharMap(dict):
+    """``str.translate`` table replacing non-alphanumeric characters with "_".
+
+    Entries are filled in on first use of each character, so translate
+    runs in C for every character seen before.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        replacement = char if char.isalnum() else "_"
+        self[codepoint] = replacement
+        return replacement
+
+
+_FILENAME_CHARS = _FilenameCharMap()
+_UNDERSCORE_RUNS = re.compile("_+")
+
+
+@functools.lru_cache(maxsize=2048)
+def _sanitize(description: str) -> str:
+    """Turn a description into a filename fragment.
+
+    Lowercases, replaces spaces/special chars with underscores, drops empty
+    parts and limits the length. Test runs reuse the same descriptions a
+    lot, so results are cached.
+    """
+    safe_desc = description.lower().translate(_FILENAME_CHARS)
+    safe_desc = _UNDERSCORE_RUNS.sub("_", safe_desc).strip("_")
+    return safe_desc[:50]
+
+
+# ScreenshotInfo fields written to the manifest, in order; the getter
+# fetches them all in one call
+_MANIFEST_FIELDS = ("filename", "description", "group", "timestamp", "capture_type", "metadata")
+_get_manifest_fields = operator.attrgetter(*_MANIFEST_FIELDS)
+
+
+def _indent_json(data: str, level: int) -> str:
+    """Indent serialized JSON for nesting ``level`` levels deep.
+
+    JSON strings never contain raw newlines, so every newline is layout.
+    """
+    return data.replace("\n", "\n" + "  " * level)
 
 
 class ScreenshotCapture:
@@ -55,6 +130,8 @@ class ScreenshotCapture:
         self,
         base_folder: Path | str = Path("./screenshots"),
         flat_mode: bool = True,
+        image_format: str = "png",
+        quality: int = -1,
     ):
         """Initialize screenshot capture.
 
@@ -62,28 +139,30 @@ class ScreenshotCapture:
             base_folder: Directory to save screenshots
             flat_mode: If True, save all screenshots in base_folder with numbered names.
                       If False, create subdirectories per group.
+            image_format: Image file format and extension, e.g. "png", "jpg" or
+                      "webp". Lossy formats are much smaller and faster to write;
+                      "webp" needs Qt's WebP image format plugin.
+            quality: Compression quality from 0 to 100, or -1 for Qt's default
         """
         self.base_folder = Path(base_folder)
         self.flat_mode = flat_mode
+        self.image_format = image_format.lower()
+        self.quality = quality
         self._counter = 0
         self._current_group = "default"
         self._screenshots: list[ScreenshotInfo] = []
-        self._slicer_available = False
-
-        # Check if we're running inside real Slicer
-        try:
-            from unittest.mock import MagicMock
-
+        # Groups that have screenshots, in first-capture order
+        self._groups: dict[str, None] = {}
+        self._slicer_available = _detect_slicer()
+        # Bound once here rather than imported in every capture method
+        self._slicer: Any = None
+        if self._slicer_available:
             import slicer
 
-            self._slicer_available = (
-                hasattr(slicer, "mrmlScene")
-                and not isinstance(slicer.mrmlScene, MagicMock)
-                and hasattr(slicer, "app")
-                and not isinstance(slicer.app, MagicMock)
-            )
-        except ImportError:
-            self._slicer_available = False
+            self._slicer = slicer
+        # Output directories already created (so each is only mkdir'ed
+        # once), mapped to their string form for building file paths
+        self._created_dirs: dict[Path, str] = {}
 
     @property
     def is_available(self) -> bool:
@@ -116,24 +195,38 @@ class ScreenshotCapture:
             Filename like "001_step1_data_loaded.png"
         """
         self._counter += 1
-        # Sanitize description for filename: lowercase, replace spaces/special chars with underscore
+        extension = self.image_format
         if description:
-            safe_desc = description.lower()
-            safe_desc = "".join(c if c.isalnum() else "_" for c in safe_desc)
-            safe_desc = "_".join(
-                part for part in safe_desc.split("_") if part
-            )  # Remove empty parts
-            safe_desc = safe_desc[:50]  # Limit length
-            return f"{self._counter:03d}_{safe_desc}.png"
+            return f"{self._counter:03d}_{_sanitize(description)}.{extension}"
         if self.flat_mode:
-            return f"{self._counter:03d}.png"
-        return f"{self._current_group}_{self._counter:03d}.png"
+            return f"{self._counter:03d}.{extension}"
+        return f"{self._current_group}_{self._counter:03d}.{extension}"
+
+    def _save_grab(self, widget: Any, filepath: str) -> None:
+        """Grab a widget and save the image in the configured format.
+
+        Everything happens on the calling (GUI) thread: the Qt objects are
+        not safe to touch from worker threads while Slicer keeps running.
+        """
+        widget.grab().save(filepath, self.image_format.upper(), self.quality)
+
+    def _record(self, info: ScreenshotInfo) -> None:
+        """Add a captured screenshot to the manifest."""
+        self._screenshots.append(info)
+        self._groups[info.group] = None
 
-    def _ensure_output_dir(self) -> Path:
-        """Ensure output directory exists."""
+    def _ensure_output_dir(self) -> str:
+        """Ensure output directory exists.
+
+        Returns:
+            The output directory as a string, ready for os.path.join
+        """
         output_dir = self._get_output_path()
-        output_dir.mkdir(parents=True, exist_ok=True)
-        return output_dir
+        output_dir_str = self._created_dirs.get(output_dir)
+        if output_dir_str is None:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            output_dir_str = self._created_dirs[output_dir] = os.fspath(output_dir)
+        return output_dir_str
 
     def capture_layout(
         self, description: str, metadata: dict[str, Any] | None = None
@@ -150,24 +243,24 @@ class ScreenshotCapture:
         if not self._slicer_available:
             return None
 
-        import slicer
+        slicer = self._slicer
 
         output_dir = self._ensure_output_dir()
         filename = self._next_filename(description)
-        filepath = output_dir / filename
+        filepath = os.path.join(output_dir, filename)
 
         # Capture the layout
-        slicer.util.mainWindow().grab().save(str(filepath))
+        self._save_grab(slicer.util.mainWindow(), filepath)
 
         info = ScreenshotInfo(
             filename=filename,
             description=description,
             group=self._current_group,
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.now(),
             capture_type="layout",
-            metadata=metadata or {},
+            metadata=metadata,
         )
-        self._screenshots.append(info)
+        self._record(info)
         return info
 
     def capture_slice_view(
@@ -189,28 +282,28 @@ class ScreenshotCapture:
         if not self._slicer_available:
             return None
 
-        import slicer
+        slicer = self._slicer
 
         output_dir = self._ensure_output_dir()
         full_description = f"{view_name}_{description}"
         filename = self._next_filename(full_description)
-        filepath = output_dir / filename
+        filepath = os.path.join(output_dir, filename)
 
         layout_manager = slicer.app.layoutManager()
         if layout_manager:
             slice_widget = layout_manager.sliceWidget(view_name)
             if slice_widget:
-                slice_widget.grab().save(str(filepath))
+                self._save_grab(slice_widget, filepath)
 
         info = ScreenshotInfo(
             filename=filename,
             description=f"[{view_name}] {description}",
             group=self._current_group,
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.now(),
             capture_type="slice_view",
             metadata={"view_name": view_name, **(metadata or {})},
         )
-        self._screenshots.append(info)
+        self._record(info)
         return info
 
     def capture_3d_view(
@@ -232,28 +325,28 @@ class ScreenshotCapture:
         if not self._slicer_available:
             return None
 
-        import slicer
+        slicer = self._slicer
 
         output_dir = self._ensure_output_dir()
         full_description = f"3d_{view_index}_{description}"
         filename = self._next_filename(full_description)
-        filepath = output_dir / filename
+        filepath = os.path.join(output_dir, filename)
 
         layout_manager = slicer.app.layoutManager()
         if layout_manager:
             three_d_widget = layout_manager.threeDWidget(view_index)
             if three_d_widget:
-                three_d_widget.grab().save(str(filepath))
+                self._save_grab(three_d_widget, filepath)
 
         info = ScreenshotInfo(
             filename=filename,
             description=f"[3D-{view_index}] {description}",
             group=self._current_group,
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.now(),
             capture_type="3d_view",
             metadata={"view_index": view_index, **(metadata or {})},
         )
-        self._screenshots.append(info)
+        self._record(info)
         return info
 
     def capture_widget(
@@ -280,21 +373,21 @@ class ScreenshotCapture:
 
         output_dir = self._ensure_output_dir()
         filename = self._next_filename(description)
-        filepath = output_dir / filename
+        filepath = os.path.join(output_dir, filename)
 
         # Capture the widget
-        widget.grab().save(str(filepath))
+        self._save_grab(widget, filepath)
 
         widget_class = type(widget).__name__
         info = ScreenshotInfo(
             filename=filename,
             description=description,
             group=self._current_group,
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.now(),
             capture_type="widget",
             metadata={"widget_class": widget_class, **(metadata or {})},
         )
-        self._screenshots.append(info)
+        self._record(info)
         return info
 
     def capture_module_widget(
@@ -314,7 +407,7 @@ class ScreenshotCapture:
         if not self._slicer_available:
             return None
 
-        import slicer
+        slicer = self._slicer
 
         try:
             module_widget = slicer.modules.MouseMasterWidget
@@ -342,27 +435,26 @@ class ScreenshotCapture:
             return None
 
         output_dir = self._ensure_output_dir()
-        manifest_path = output_dir / "manifest.json"
-
-        manifest = {
-            "generated": datetime.now().isoformat(),
-            "total_screenshots": len(self._screenshots),
-            "groups": list({s.group for s in self._screenshots}),
-            "screenshots": [
-                {
-                    "filename": s.filename,
-                    "description": s.description,
-                    "group": s.group,
-                    "timestamp": s.timestamp,
-                    "capture_type": s.capture_type,
-                    "metadata": s.metadata,
-                }
-                for s in self._screenshots
-            ],
-        }
+        manifest_path = Path(output_dir, "manifest.json")
+        screenshots = self._screenshots
 
+        # Write the entries one at a time instead of building the whole
+        # manifest in memory; the layout matches json.dump(..., indent=2)
         with open(manifest_path, "w") as f:
-            json.dump(manifest, f, indent=2)
+            f.write('{\n  "generated": ' + json.dumps(datetime.now().isoformat()))
+            f.write(',\n  "total_screenshots": ' + json.dumps(len(screenshots)))
+            groups = list(self._groups)
+            f.write(',\n  "groups": ' + _indent_json(json.dumps(groups, indent=2), 1))
+            f.write(',\n  "screenshots": [')
+            separator = "\n    "
+            for s in screenshots:
+                entry = dict(zip(_MANIFEST_FIELDS, _get_manifest_fields(s)))
+                entry["timestamp"] = entry["timestamp"].isoformat()
+                if entry["metadata"] is None:
+                    entry["metadata"] = {}
+                f.write(separator + _indent_json(json.dumps(entry, indent=2), 2))
+                separator = ",\n    "
+            f.write("\n  ]\n}")
 
         return manifest_path
 
@@ -371,6 +463,8 @@ class ScreenshotCapture:
         self._counter = 0
         self._current_group = "default"
         self._screenshots = []
+        self._groups = {}
+        self._created_dirs.clear()
 
 
 # Singleton instance for convenience
@@ -5,13 +5,23 @@ These tests mock Slicer/Qt dependencies to test action registry logic without ru
 
 from unittest.mock import MagicMock
 
-# Import centralized mocks from conftest
-from conftest import get_mock_qt, get_mock_slicer, get_mock_slicer_util
-
-# Get local references to mocks (they're reset before each test by conftest fixture)
-mock_slicer = get_mock_slicer()
-mock_slicer_util = get_mock_slicer_util()
-mock_qt = get_mock_qt()
+import pytest
+from conftest import make_segment_editor_stub
+
+from MouseMasterLib import action_registry
+from MouseMasterLib.action_registry import (
+    ActionContext,
+    ActionEntry,
+    ActionRegistry,
+    CallableHandler,
+    KeyboardShortcutHandler,
+    PythonCommandHandler,
+    SegmentEditorEffectHandler,
+    SlicerActionHandler,
+    _create_registry,
+    _resolve_modifier_flags,
+    _resolve_qt_key,
+)
 
 
 class TestActionContext:
@@ -19,23 +29,23 @@ class TestActionContext:
 
     def test_default_values(self):
         """Test ActionContext default values."""
-        from MouseMasterLib.action_registry import ActionContext
-
         context = ActionContext()
 
         assert context.module_name is None
         assert context.button_id is None
-        assert context.modifiers == set()
+        assert context.modifiers == frozenset()
         assert context.view_name is None
 
+    def test_default_modifiers_shared(self):
+        """Test that contexts share one empty modifiers frozenset by default."""
+        assert ActionContext().modifiers is ActionContext().modifiers
+
     def test_with_values(self):
         """Test ActionContext with provided values."""
-        from MouseMasterLib.action_registry import ActionContext
-
         context = ActionContext(
             module_name="SegmentEditor",
             button_id="back",
-            modifiers={"ctrl", "shift"},
+            modifiers=frozenset({"ctrl", "shift"}),
             view_name="Red",
         )
 
@@ -50,8 +60,6 @@ class TestActionEntry:
 
     def test_action_entry_fields(self):
         """Test ActionEntry fields."""
-        from MouseMasterLib.action_registry import ActionEntry, CallableHandler
-
         handler = CallableHandler(lambda ctx: True)
         entry = ActionEntry(
             id="test_action",
@@ -69,8 +77,6 @@ class TestActionEntry:
 
     def test_action_entry_optional_icon(self):
         """Test ActionEntry with default None icon."""
-        from MouseMasterLib.action_registry import ActionEntry, CallableHandler
-
         handler = CallableHandler(lambda ctx: True)
         entry = ActionEntry(
             id="test_action",
@@ -87,8 +93,6 @@ class TestCallableHandler:
 
     def test_execute_calls_function(self):
         """Test that execute calls the wrapped function."""
-        from MouseMasterLib.action_registry import ActionContext, CallableHandler
-
         called = []
 
         def test_func(ctx):
@@ -106,8 +110,6 @@ class TestCallableHandler:
 
     def test_is_available_default_true(self):
         """Test that is_available returns True by default."""
-        from MouseMasterLib.action_registry import ActionContext, CallableHandler
-
         handler = CallableHandler(lambda ctx: True)
         context = ActionContext()
 
@@ -115,8 +117,6 @@ class TestCallableHandler:
 
     def test_is_available_with_check(self):
         """Test is_available with custom check function."""
-        from MouseMasterLib.action_registry import ActionContext, CallableHandler
-
         handler = CallableHandler(
             lambda ctx: True, available_check=lambda ctx: ctx.module_name == "SegmentEditor"
         )
@@ -128,17 +128,15 @@ class TestCallableHandler:
 class TestSlicerActionHandler:
     """Test SlicerActionHandler."""
 
-    def test_execute_triggers_action(self):
+    def test_execute_triggers_action(self, slicer_util_mock):
         """Test that execute triggers the Slicer menu action."""
-        from MouseMasterLib.action_registry import ActionContext, SlicerActionHandler
-
         # Set up mock action
         mock_action = MagicMock()
         mock_main_window = MagicMock()
         mock_main_window.findChild.return_value = mock_action
 
         # Configure the mock at the module level
-        mock_slicer_util.mainWindow.return_value = mock_main_window
+        slicer_util_mock.mainWindow.return_value = mock_main_window
 
         handler = SlicerActionHandler("actionUndo")
         context = ActionContext()
@@ -148,11 +146,9 @@ class TestSlicerActionHandler:
         assert result is True
         mock_action.trigger.assert_called_once()
 
-    def test_execute_no_main_window(self):
+    def test_execute_no_main_window(self, slicer_util_mock):
         """Test execute when main window is not available."""
-        from MouseMasterLib.action_registry import ActionContext, SlicerActionHandler
-
-        mock_slicer_util.mainWindow.return_value = None
+        slicer_util_mock.mainWindow.return_value = None
 
         handler = SlicerActionHandler("actionUndo")
         context = ActionContext()
@@ -161,13 +157,11 @@ class TestSlicerActionHandler:
 
         assert result is False
 
-    def test_execute_action_not_found(self):
+    def test_execute_action_not_found(self, slicer_util_mock):
         """Test execute when action is not found."""
-        from MouseMasterLib.action_registry import ActionContext, SlicerActionHandler
-
         mock_main_window = MagicMock()
         mock_main_window.findChild.return_value = None
-        mock_slicer_util.mainWindow.return_value = mock_main_window
+        slicer_util_mock.mainWindow.return_value = mock_main_window
 
         handler = SlicerActionHandler("nonexistentAction")
         context = ActionContext()
@@ -176,14 +170,63 @@ class TestSlicerActionHandler:
 
         assert result is False
 
+    def test_execute_reuses_found_action(self, slicer_util_mock):
+        """Test that the action is looked up once per main window."""
+        mock_action = MagicMock()
+        mock_main_window = MagicMock()
+        mock_main_window.findChild.return_value = mock_action
+        slicer_util_mock.mainWindow.return_value = mock_main_window
+
+        handler = SlicerActionHandler("actionUndo")
+        handler.execute(ActionContext())
+        handler.execute(ActionContext())
+
+        mock_main_window.findChild.assert_called_once()
+        assert mock_action.trigger.call_count == 2
+
+        # A new main window invalidates the cached action
+        new_main_window = MagicMock()
+        new_main_window.findChild.return_value = mock_action
+        slicer_util_mock.mainWindow.return_value = new_main_window
+        handler.execute(ActionContext())
+
+        new_main_window.findChild.assert_called_once()
+
+    def test_execute_looks_up_deleted_action_again(self, slicer_util_mock):
+        """Test that a deleted cached action is looked up again."""
+        deleted_action = MagicMock()
+        deleted_action.trigger.side_effect = RuntimeError("underlying C++ object was deleted")
+        new_action = MagicMock()
+        mock_main_window = MagicMock()
+        mock_main_window.findChild.side_effect = [deleted_action, new_action]
+        slicer_util_mock.mainWindow.return_value = mock_main_window
+
+        handler = SlicerActionHandler("actionUndo")
+        result = handler.execute(ActionContext())
+
+        assert result is True
+        new_action.trigger.assert_called_once()
+        assert mock_main_window.findChild.call_count == 2
+
+        # The new action is cached for the next press
+        handler.execute(ActionContext())
+        assert new_action.trigger.call_count == 2
+        assert mock_main_window.findChild.call_count == 2
+
 
 class TestPythonCommandHandler:
     """Test PythonCommandHandler."""
 
+    def test_from_parameters(self):
+        """Test creating a handler from mapping parameters."""
+        handler = PythonCommandHandler.from_parameters({"command": "pass"})
+
+        assert handler is not None
+        assert handler._command == "pass"
+        assert PythonCommandHandler.from_parameters({}) is None
+
     def test_execute_returns_true(self):
         """Test that execute returns True on success."""
-        from MouseMasterLib.action_registry import ActionContext, PythonCommandHandler
-
         # Simple command that just passes
         handler = PythonCommandHandler("pass")
         context = ActionContext()
@@ -194,8 +237,6 @@ class TestPythonCommandHandler:
 
     def test_execute_has_slicer_available(self):
         """Test that slicer is available in the command namespace."""
-        from MouseMasterLib.action_registry import ActionContext, PythonCommandHandler
-
         # Command that uses slicer - this verifies slicer is in namespace
         handler = PythonCommandHandler("x = slicer")
         context = ActionContext()
@@ -206,8 +247,6 @@ class TestPythonCommandHandler:
 
     def test_execute_has_context_available(self):
         """Test that context is available in the command namespace."""
-        from MouseMasterLib.action_registry import ActionContext, PythonCommandHandler
-
         # Command that accesses context
         handler = PythonCommandHandler("x = context.module_name")
         context = ActionContext(module_name="TestModule")
@@ -216,42 +255,78 @@ class TestPythonCommandHandler:
         result = handler.execute(context)
         assert result is True
 
+    def test_command_compiled_once(self):
+        """Test that handlers for the same command share one code object."""
+        first = PythonCommandHandler("x = 1")
+        second = PythonCommandHandler("x = 1")
+
+        assert first._code is second._code
+
+    def test_syntax_error_raised_on_creation(self):
+        """Test that an invalid command fails when the handler is built."""
+        with pytest.raises(SyntaxError):
+            PythonCommandHandler("x =")
+
 
 class TestKeyboardShortcutHandler:
     """Test KeyboardShortcutHandler."""
 
+    def setup_method(self):
+        """Resolve keys against the qt mock of the current test."""
+        action_registry._KEY_MAP = None
+        _resolve_qt_key.cache_clear()
+
     def test_init_with_modifiers(self):
         """Test initialization with modifiers."""
-        from MouseMasterLib.action_registry import KeyboardShortcutHandler
-
         handler = KeyboardShortcutHandler("Z", ["ctrl", "shift"])
 
         assert handler._key == "Z"
         assert handler._modifiers == ["ctrl", "shift"]
 
+    def test_modifier_flags_resolved_on_init(self, slicer_util_mock, qt_mock):
+        """Test that modifier flags are combined once, not on every execute."""
+        _resolve_modifier_flags.cache_clear()
+        qt_mock.Qt.NoModifier = 0
+        qt_mock.Qt.ControlModifier = 0x04000000
+        qt_mock.Qt.ShiftModifier = 0x02000000
+        qt_mock.Qt.Key_Z = 90
+
+        handler = KeyboardShortcutHandler("Z", ["ctrl", "shift"])
+        handler.execute(ActionContext())
+        handler.execute(ActionContext())
+
+        assert handler._modifier_flags == 0x06000000
+        assert _resolve_modifier_flags.cache_info().misses == 1
+        assert qt_mock.QKeyEvent.call_args[0][2] == 0x06000000
+
+    def test_from_parameters(self):
+        """Test creating a handler from mapping parameters."""
+        handler = KeyboardShortcutHandler.from_parameters({"key": "S", "modifiers": ["ctrl"]})
+
+        assert handler is not None
+        assert handler._key == "S"
+        assert handler._modifiers == ["ctrl"]
+        assert KeyboardShortcutHandler.from_parameters({"modifiers": ["ctrl"]}) is None
+
     def test_init_without_modifiers(self):
         """Test initialization without modifiers."""
-        from MouseMasterLib.action_registry import KeyboardShortcutHandler
-
         handler = KeyboardShortcutHandler("A")
 
         assert handler._key == "A"
         assert handler._modifiers == []
 
-    def test_execute_posts_key_event(self):
+    def test_execute_posts_key_event(self, slicer_util_mock, qt_mock):
         """Test that execute posts a key event."""
-        from MouseMasterLib.action_registry import ActionContext, KeyboardShortcutHandler
-
         # Set up mocks
         mock_main_window = MagicMock()
         mock_focus_widget = MagicMock()
         mock_main_window.focusWidget.return_value = mock_focus_widget
-        mock_slicer_util.mainWindow.return_value = mock_main_window
+        slicer_util_mock.mainWindow.return_value = mock_main_window
 
-        mock_qt.Qt.NoModifier = 0
-        mock_qt.Qt.ControlModifier = 1
-        mock_qt.Qt.Key_Z = 90
-        mock_qt.QEvent.KeyPress = 6
+        qt_mock.Qt.NoModifier = 0
+        qt_mock.Qt.ControlModifier = 1
+        qt_mock.Qt.Key_Z = 90
+        qt_mock.QEvent.KeyPress = 6
 
         handler = KeyboardShortcutHandler("Z", ["ctrl"])
         context = ActionContext()
@@ -259,13 +334,11 @@ class TestKeyboardShortcutHandler:
         result = handler.execute(context)
 
         assert result is True
-        mock_qt.QApplication.postEvent.assert_called_once()
+        qt_mock.QApplication.postEvent.assert_called_once()
 
-    def test_execute_no_main_window(self):
+    def test_execute_no_main_window(self, slicer_util_mock):
         """Test execute when main window is not available."""
-        from MouseMasterLib.action_registry import ActionContext, KeyboardShortcutHandler
-
-        mock_slicer_util.mainWindow.return_value = None
+        slicer_util_mock.mainWindow.return_value = None
 
         handler = KeyboardShortcutHandler("Z")
         context = ActionContext()
@@ -274,18 +347,16 @@ class TestKeyboardShortcutHandler:
 
         assert result is False
 
-    def test_execute_unknown_key(self):
+    def test_execute_unknown_key(self, slicer_util_mock, qt_mock):
         """Test execute with unknown key."""
-        from MouseMasterLib.action_registry import ActionContext, KeyboardShortcutHandler
-
         mock_main_window = MagicMock()
-        mock_slicer_util.mainWindow.return_value = mock_main_window
-        mock_qt.Qt.NoModifier = 0
+        slicer_util_mock.mainWindow.return_value = mock_main_window
+        qt_mock.Qt.NoModifier = 0
 
         # Delete any existing Key_UnknownKey and Key_UNKNOWNKEY attributes
         for attr in ["Key_UnknownKey", "Key_UNKNOWNKEY"]:
-            if hasattr(mock_qt.Qt, attr):
-                delattr(mock_qt.Qt, attr)
+            if hasattr(qt_mock.Qt, attr):
+                delattr(qt_mock.Qt, attr)
 
         handler = KeyboardShortcutHandler("UnknownKey")
         context = ActionContext()
@@ -294,20 +365,103 @@ class TestKeyboardShortcutHandler:
 
         assert result is False
 
+    def test_execute_uses_tracked_focus_widget(self, slicer_util_mock, qt_mock, monkeypatch):
+        """Test that execute posts to the focus widget tracked via focusChanged."""
+        monkeypatch.setattr(action_registry, "_focus_tracking_installed", None)
+        monkeypatch.setattr(action_registry, "_focus_tracking_main", None)
+        monkeypatch.setattr(action_registry, "_cached_focus_widget", None)
 
-class TestActionRegistry:
-    """Test ActionRegistry singleton and methods."""
+        mock_main_window = MagicMock()
+        first_focus = MagicMock()
+        mock_main_window.focusWidget.return_value = first_focus
+        slicer_util_mock.mainWindow.return_value = mock_main_window
+        qt_mock.Qt.Key_Z = 90
 
-    def setup_method(self):
-        """Reset singleton before each test."""
-        from MouseMasterLib.action_registry import ActionRegistry
+        handler = KeyboardShortcutHandler("Z")
+        handler.execute(ActionContext())
+        handler.execute(ActionContext())
 
-        ActionRegistry.reset_instance()
+        qt_mock.QApplication.instance().focusChanged.connect.assert_called_once_with(
+            action_registry._on_focus_changed
+        )
+        mock_main_window.focusWidget.assert_called_once()
+        assert qt_mock.QApplication.postEvent.call_args[0][0] is first_focus
+
+        # Focus moves to another widget
+        new_focus = MagicMock()
+        action_registry._on_focus_changed(first_focus, new_focus)
+        handler.execute(ActionContext())
+
+        assert qt_mock.QApplication.postEvent.call_args[0][0] is new_focus
+
+        # Focus moving to a widget outside the main window (e.g. a dialog) is ignored
+        mock_main_window.isAncestorOf.return_value = False
+        action_registry._on_focus_changed(new_focus, MagicMock())
+        handler.execute(ActionContext())
+
+        assert qt_mock.QApplication.postEvent.call_args[0][0] is new_focus
+
+    def test_execute_focus_tracking_not_retried(self, slicer_util_mock, qt_mock, monkeypatch):
+        """Test that a failed focusChanged connection is not retried on every key press."""
+        monkeypatch.setattr(action_registry, "_focus_tracking_installed", None)
+        monkeypatch.setattr(action_registry, "_focus_tracking_main", None)
+        monkeypatch.setattr(action_registry, "_cached_focus_widget", None)
+
+        mock_main_window = MagicMock()
+        focus = MagicMock()
+        mock_main_window.focusWidget.return_value = focus
+        slicer_util_mock.mainWindow.return_value = mock_main_window
+        qt_mock.Qt.Key_Z = 90
+        qt_mock.QApplication.instance.side_effect = AttributeError("no application")
+
+        handler = KeyboardShortcutHandler("Z")
+        handler.execute(ActionContext())
+        handler.execute(ActionContext())
+
+        qt_mock.QApplication.instance.assert_called_once()
+        assert mock_main_window.focusWidget.call_count == 2
+        assert qt_mock.QApplication.postEvent.call_args[0][0] is focus
+
+    def test_key_resolution_shared_between_handlers(self, qt_mock):
+        """Test that key and modifier resolution is cached across handlers."""
+        _resolve_qt_key.cache_clear()
+        _resolve_modifier_flags.cache_clear()
+        qt_mock.Qt.Key_F5 = 0x01000034
+
+        first = KeyboardShortcutHandler("F5", ["ctrl"])
+        second = KeyboardShortcutHandler("F5", ["ctrl"])
+
+        assert first._key_code == second._key_code == 0x01000034
+        assert _resolve_qt_key.cache_info().hits == 1
+        assert _resolve_modifier_flags.cache_info().hits == 1
+
+    def test_key_names_case_sensitive(self, qt_mock):
+        """Test that key names match as given or upper-cased."""
+        qt_mock.Qt.Key_Delete = 0x01000007
+        qt_mock.Qt.Key_Z = 0x5A
+
+        assert _resolve_qt_key("Delete") == 0x01000007
+        assert _resolve_qt_key("z") == 0x5A
+        assert _resolve_qt_key("delete") is None
+
+    def test_unknown_key_cached_without_rebuilding_map(self, qt_mock):
+        """Test that a miss is cached and does not rebuild the key map."""
+        qt_mock.Qt.Key_A = 0x41
+        assert _resolve_qt_key("NoSuchKey") is None
+        key_map = action_registry._KEY_MAP
+
+        assert _resolve_qt_key("NoSuchKey") is None
+
+        assert _resolve_qt_key.cache_info().hits == 1
+        assert action_registry._KEY_MAP is key_map
+
+
+@pytest.mark.usefixtures("builtin_registry")
+class TestActionRegistry:
+    """Test ActionRegistry singleton and methods."""
 
     def test_get_instance_returns_singleton(self):
         """Test that get_instance returns the same instance."""
-        from MouseMasterLib.action_registry import ActionRegistry
-
         instance1 = ActionRegistry.get_instance()
         instance2 = ActionRegistry.get_instance()
 
@@ -315,18 +469,26 @@ class TestActionRegistry:
 
     def test_reset_instance_clears_singleton(self):
         """Test that reset_instance clears the singleton."""
-        from MouseMasterLib.action_registry import ActionRegistry
-
         instance1 = ActionRegistry.get_instance()
         ActionRegistry.reset_instance()
         instance2 = ActionRegistry.get_instance()
 
         assert instance1 is not instance2
 
+    def test_reset_instance_removes_scene_observers(self, slicer_mock):
+        """Test that reset_instance removes the old registry's scene observers."""
+        scene = slicer_mock.mrmlScene
+        scene.AddObserver.side_effect = [1, 2, 3]
+        instance = ActionRegistry.get_instance()
+        instance._observe_scene()
+
+        ActionRegistry.reset_instance()
+
+        assert [c.args for c in scene.RemoveObserver.call_args_list] == [(1,), (2,), (3,)]
+        assert instance._scene_observer_tags == []
+
     def test_register_action(self):
         """Test registering an action."""
-        from MouseMasterLib.action_registry import ActionRegistry, CallableHandler
-
         registry = ActionRegistry()
         handler = CallableHandler(lambda ctx: True)
 
@@ -342,8 +504,6 @@ class TestActionRegistry:
 
     def test_register_adds_to_category(self):
         """Test that register adds action to category list."""
-        from MouseMasterLib.action_registry import ActionRegistry, CallableHandler
-
         registry = ActionRegistry()
         handler = CallableHandler(lambda ctx: True)
 
@@ -357,8 +517,6 @@ class TestActionRegistry:
 
     def test_unregister_action(self):
         """Test unregistering an action."""
-        from MouseMasterLib.action_registry import ActionRegistry, CallableHandler
-
         registry = ActionRegistry()
         handler = CallableHandler(lambda ctx: True)
         registry.register("test_action", handler, "test_category", "Test")
@@ -369,10 +527,22 @@ class TestActionRegistry:
         assert "test_action" not in registry._actions
         assert "test_action" not in registry._categories.get("test_category", [])
 
+    def test_unregister_keeps_category_order(self):
+        """Test that unregistering leaves the remaining category order intact."""
+        registry = ActionRegistry()
+        handler = CallableHandler(lambda ctx: True)
+        for action_id in ("action1", "action2", "action3"):
+            registry.register(action_id, handler, "category1", action_id)
+
+        registry.unregister("action2")
+
+        assert [e.id for e in registry.get_actions_by_category("category1")] == [
+            "action1",
+            "action3",
+        ]
+
     def test_unregister_nonexistent(self):
         """Test unregistering a nonexistent action."""
-        from MouseMasterLib.action_registry import ActionRegistry
-
         registry = ActionRegistry()
 
         result = registry.unregister("nonexistent")
@@ -381,8 +551,6 @@ class TestActionRegistry:
 
     def test_get_action(self):
         """Test getting an action by ID."""
-        from MouseMasterLib.action_registry import ActionRegistry, CallableHandler
-
         registry = ActionRegistry()
         handler = CallableHandler(lambda ctx: True)
         registry.register("test_action", handler, "test_category", "Test")
@@ -394,8 +562,6 @@ class TestActionRegistry:
 
     def test_get_action_not_found(self):
         """Test getting a nonexistent action."""
-        from MouseMasterLib.action_registry import ActionRegistry
-
         registry = ActionRegistry()
 
         entry = registry.get_action("nonexistent")
@@ -404,8 +570,6 @@ class TestActionRegistry:
 
     def test_execute_action(self):
         """Test executing an action."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry, CallableHandler
-
         executed = []
 
         def handler_func(ctx):
@@ -424,8 +588,6 @@ class TestActionRegistry:
 
     def test_execute_nonexistent_action(self):
         """Test executing a nonexistent action."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
         registry = ActionRegistry()
         context = ActionContext()
 
@@ -435,8 +597,6 @@ class TestActionRegistry:
 
     def test_execute_unavailable_action(self):
         """Test executing an unavailable action."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry, CallableHandler
-
         registry = ActionRegistry()
         handler = CallableHandler(lambda ctx: True, available_check=lambda ctx: False)
         registry.register("test_action", handler, "test_category", "Test")
@@ -446,10 +606,17 @@ class TestActionRegistry:
 
         assert result is False
 
+    def test_register_sets_always_available(self):
+        """Test always_available reflects whether is_available is overridden."""
+        registry = ActionRegistry()
+        registry.register("plain", SlicerActionHandler("actionEditUndo"), "test", "Plain")
+        registry.register("checked", CallableHandler(lambda ctx: True), "test", "Checked")
+
+        assert registry.get_action("plain").always_available is True
+        assert registry.get_action("checked").always_available is False
+
     def test_get_actions_by_category(self):
         """Test getting actions by category."""
-        from MouseMasterLib.action_registry import ActionRegistry, CallableHandler
-
         registry = ActionRegistry()
         handler = CallableHandler(lambda ctx: True)
         registry.register("action1", handler, "category1", "Action 1")
@@ -463,8 +630,6 @@ class TestActionRegistry:
 
     def test_get_actions_by_nonexistent_category(self):
         """Test getting actions by nonexistent category."""
-        from MouseMasterLib.action_registry import ActionRegistry
-
         registry = ActionRegistry()
 
         actions = registry.get_actions_by_category("nonexistent")
@@ -473,8 +638,6 @@ class TestActionRegistry:
 
     def test_get_categories(self):
         """Test getting all categories."""
-        from MouseMasterLib.action_registry import ActionRegistry, CallableHandler
-
         registry = ActionRegistry()
         handler = CallableHandler(lambda ctx: True)
         registry.register("action1", handler, "category1", "Action 1")
@@ -487,8 +650,6 @@ class TestActionRegistry:
 
     def test_get_all_actions(self):
         """Test getting all actions."""
-        from MouseMasterLib.action_registry import ActionRegistry, CallableHandler
-
         registry = ActionRegistry()
         handler = CallableHandler(lambda ctx: True)
         registry.register("action1", handler, "category1", "Action 1")
@@ -498,21 +659,38 @@ class TestActionRegistry:
 
         assert len(actions) == 2
 
+    def test_listings_cached_until_registry_changes(self):
+        """Test that category and action lists are reused until a change."""
+        registry = ActionRegistry()
+        handler = CallableHandler(lambda ctx: True)
+        registry.register("action1", handler, "category1", "Action 1")
+
+        categories = registry.get_categories()
+        actions = registry.get_all_actions()
+        assert registry.get_categories() is categories
+        assert registry.get_all_actions() is actions
 
-class TestActionRegistryBuiltinActions:
-    """Test built-in action registration."""
+        registry.register("action2", handler, "category2", "Action 2")
+        assert registry.get_categories() == ["category1", "category2"]
+        assert len(registry.get_all_actions()) == 2
 
-    def setup_method(self):
-        """Reset singleton before each test."""
-        from MouseMasterLib.action_registry import ActionRegistry
+        registry.unregister("action1")
+        assert [e.id for e in registry.get_all_actions()] == ["action2"]
 
-        ActionRegistry.reset_instance()
 
-    def test_get_instance_registers_builtin_actions(self):
-        """Test that get_instance registers built-in actions."""
-        from MouseMasterLib.action_registry import ActionRegistry
+@pytest.fixture(scope="class")
+def class_registry(request):
+    """Build one registry with the built-in actions for a test class to read."""
+    request.cls.registry = _create_registry()
 
-        registry = ActionRegistry.get_instance()
+
+@pytest.mark.usefixtures("class_registry")
+class TestActionRegistryBuiltinActions:
+    """Test built-in action registration."""
+
+    def test_registers_builtin_actions(self):
+        """Test that the registry is created with the built-in actions."""
+        registry = self.registry
 
         # Check some known built-in actions exist
         assert registry.get_action("edit_undo") is not None
@@ -522,39 +700,28 @@ class TestActionRegistryBuiltinActions:
 
     def test_builtin_actions_have_correct_categories(self):
         """Test that built-in actions have correct categories."""
-        from MouseMasterLib.action_registry import ActionRegistry
-
-        registry = ActionRegistry.get_instance()
+        registry = self.registry
 
         assert registry.get_action("edit_undo").category == "editing"
         assert registry.get_action("view_reset_3d").category == "navigation"
         assert registry.get_action("segment_editor_paint").category == "segment_editor"
 
 
+@pytest.mark.usefixtures("builtin_registry")
 class TestDiscoverSlicerActions:
     """Test discover_slicer_actions method."""
 
-    def setup_method(self):
-        """Reset singleton before each test."""
-        from MouseMasterLib.action_registry import ActionRegistry
-
-        ActionRegistry.reset_instance()
-
-    def test_discover_actions_no_main_window(self):
+    def test_discover_actions_no_main_window(self, slicer_util_mock):
         """Test discovery when main window is not available."""
-        from MouseMasterLib.action_registry import ActionRegistry
-
-        mock_slicer_util.mainWindow.return_value = None
+        slicer_util_mock.mainWindow.return_value = None
 
         registry = ActionRegistry()
         count = registry.discover_slicer_actions()
 
         assert count == 0
 
-    def test_discover_actions_with_actions(self):
+    def test_discover_actions_with_actions(self, slicer_util_mock):
         """Test discovering actions from main window."""
-        from MouseMasterLib.action_registry import ActionRegistry
-
         # Set up mock main window with actions
         mock_main = MagicMock()
         mock_action = MagicMock()
@@ -563,7 +730,7 @@ class TestDiscoverSlicerActions:
         mock_action.isSeparator = False
         mock_action.parent.return_value = None
         mock_main.findChildren.return_value = [mock_action]
-        mock_slicer_util.mainWindow.return_value = mock_main
+        slicer_util_mock.mainWindow.return_value = mock_main
 
         registry = ActionRegistry()
         count = registry.discover_slicer_actions()
@@ -571,10 +738,8 @@ class TestDiscoverSlicerActions:
         assert count == 1
         assert registry.get_action("slicer_menu_actionTest") is not None
 
-    def test_discover_actions_skips_duplicates(self):
+    def test_discover_actions_skips_duplicates(self, slicer_util_mock):
         """Test that discovery skips already registered actions."""
-        from MouseMasterLib.action_registry import ActionRegistry, CallableHandler
-
         # Pre-register an action
         registry = ActionRegistry()
         registry.register(
@@ -592,23 +757,41 @@ class TestDiscoverSlicerActions:
         mock_action.isSeparator = False
         mock_action.parent.return_value = None
         mock_main.findChildren.return_value = [mock_action]
-        mock_slicer_util.mainWindow.return_value = mock_main
+        slicer_util_mock.mainWindow.return_value = mock_main
 
         count = registry.discover_slicer_actions()
 
         assert count == 0  # Should not register duplicate
 
-    def test_discover_actions_skips_separators(self):
-        """Test that discovery skips separator actions."""
-        from MouseMasterLib.action_registry import ActionRegistry
+    def test_discover_actions_registers_repeated_name_once(self, slicer_util_mock):
+        """Test that actions sharing an object name are registered once."""
+        mock_main = MagicMock()
+        mock_actions = []
+        for text in ("First", "Second"):
+            mock_action = MagicMock()
+            mock_action.objectName = "actionTest"
+            mock_action.text = text
+            mock_action.isSeparator = False
+            mock_action.parent.return_value = None
+            mock_actions.append(mock_action)
+        mock_main.findChildren.return_value = mock_actions
+        slicer_util_mock.mainWindow.return_value = mock_main
+
+        registry = ActionRegistry()
+        count = registry.discover_slicer_actions()
+
+        assert count == 1
+        assert registry.get_action("slicer_menu_actionTest").description == "First"
 
+    def test_discover_actions_skips_separators(self, slicer_util_mock):
+        """Test that discovery skips separator actions."""
         mock_main = MagicMock()
         mock_action = MagicMock()
         mock_action.objectName = "separator"
         mock_action.text = ""
         mock_action.isSeparator = True
         mock_main.findChildren.return_value = [mock_action]
-        mock_slicer_util.mainWindow.return_value = mock_main
+        slicer_util_mock.mainWindow.return_value = mock_main
 
         registry = ActionRegistry()
         count = registry.discover_slicer_actions()
@@ -619,76 +802,28 @@ class TestDiscoverSlicerActions:
 class TestBuiltinActionImplementations:
     """Test built-in action handler implementations."""
 
-    def setup_method(self):
-        """Reset singleton and mocks before each test."""
-        from MouseMasterLib.action_registry import ActionRegistry
-
-        ActionRegistry.reset_instance()
-        mock_slicer.reset_mock()
-        mock_slicer_util.reset_mock()
-
-    def test_do_undo_segment_editor(self):
-        """Test undo in SegmentEditor context."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
-        mock_editor = MagicMock()
-        mock_widget_self = MagicMock()
-        mock_widget_self.editor = mock_editor
-        mock_widget = MagicMock()
-        mock_widget.self.return_value = mock_widget_self
-
-        mock_slicer.modules.segmenteditor.widgetRepresentation.return_value = mock_widget
-
+    @pytest.mark.parametrize(
+        ("method", "editor_call"), [("_do_undo", "undo"), ("_do_redo", "redo")]
+    )
+    def test_undo_redo_segment_editor(self, segment_editor, method, editor_call):
+        """Test undo/redo in SegmentEditor context go through the editor."""
         context = ActionContext(module_name="SegmentEditor")
-        result = ActionRegistry._do_undo(context)
+        result = getattr(ActionRegistry, method)(context)
 
         assert result is True
-        mock_editor.undo.assert_called_once()
-
-    def test_do_undo_other_module(self):
-        """Test undo in non-SegmentEditor context."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
+        getattr(segment_editor, editor_call).assert_called_once()
 
-        mock_slicer.reset_mock()
+    @pytest.mark.parametrize(("method", "scene_call"), [("_do_undo", "Undo"), ("_do_redo", "Redo")])
+    def test_undo_redo_other_module(self, slicer_mock, method, scene_call):
+        """Test undo/redo in non-SegmentEditor context go through the scene."""
         context = ActionContext(module_name="Data")
-        result = ActionRegistry._do_undo(context)
+        result = getattr(ActionRegistry, method)(context)
 
         assert result is True
-        mock_slicer.mrmlScene.Undo.assert_called_once()
-
-    def test_do_redo_segment_editor(self):
-        """Test redo in SegmentEditor context."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
-        mock_editor = MagicMock()
-        mock_widget_self = MagicMock()
-        mock_widget_self.editor = mock_editor
-        mock_widget = MagicMock()
-        mock_widget.self.return_value = mock_widget_self
+        getattr(slicer_mock.mrmlScene, scene_call).assert_called_once()
 
-        mock_slicer.modules.segmenteditor.widgetRepresentation.return_value = mock_widget
-
-        context = ActionContext(module_name="SegmentEditor")
-        result = ActionRegistry._do_redo(context)
-
-        assert result is True
-        mock_editor.redo.assert_called_once()
-
-    def test_do_redo_other_module(self):
-        """Test redo in non-SegmentEditor context."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
-        mock_slicer.reset_mock()
-        context = ActionContext(module_name="Data")
-        result = ActionRegistry._do_redo(context)
-
-        assert result is True
-        mock_slicer.mrmlScene.Redo.assert_called_once()
-
-    def test_reset_3d_view(self):
+    def test_reset_3d_view(self, slicer_mock):
         """Test reset 3D view."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
         mock_view = MagicMock()
         mock_widget = MagicMock()
         mock_widget.threeDView.return_value = mock_view
@@ -697,7 +832,7 @@ class TestBuiltinActionImplementations:
         mock_layout_manager.threeDViewCount = 1
         mock_layout_manager.threeDWidget.return_value = mock_widget
 
-        mock_slicer.app.layoutManager.return_value = mock_layout_manager
+        slicer_mock.app.layoutManager.return_value = mock_layout_manager
 
         context = ActionContext()
         result = ActionRegistry._reset_3d_view(context)
@@ -706,13 +841,11 @@ class TestBuiltinActionImplementations:
         mock_view.resetFocalPoint.assert_called_once()
         mock_view.resetCamera.assert_called_once()
 
-    def test_toggle_crosshair(self):
+    def test_toggle_crosshair(self, slicer_util_mock):
         """Test toggle crosshair."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
         mock_crosshair = MagicMock()
         mock_crosshair.GetCrosshairMode.return_value = 0
-        mock_slicer_util.getNode.return_value = mock_crosshair
+        slicer_util_mock.getNode.return_value = mock_crosshair
 
         context = ActionContext()
         result = ActionRegistry._toggle_crosshair(context)
@@ -720,112 +853,68 @@ class TestBuiltinActionImplementations:
         assert result is True
         mock_crosshair.SetCrosshairMode.assert_called_once()
 
-    def test_is_segment_editor_active(self):
-        """Test segment editor context check."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
-        assert (
-            ActionRegistry._is_segment_editor_active(ActionContext(module_name="SegmentEditor"))
-            is True
-        )
-        assert ActionRegistry._is_segment_editor_active(ActionContext(module_name="Data")) is False
-
-    def test_is_markups_active(self):
-        """Test markups context check."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
-        assert ActionRegistry._is_markups_active(ActionContext(module_name="Markups")) is True
-        assert ActionRegistry._is_markups_active(ActionContext(module_name="Data")) is False
-
-    def test_next_segment(self):
-        """Test next segment selection."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
-        # Set up mock segmentation
-        mock_seg = MagicMock()
-        mock_seg.GetNumberOfSegments.return_value = 3
-        mock_seg.GetNthSegmentID.side_effect = lambda i: f"segment_{i}"
-
-        mock_segmentation = MagicMock()
-        mock_segmentation.GetSegmentation.return_value = mock_seg
-
-        mock_editor = MagicMock()
-        mock_editor.segmentationNode.return_value = mock_segmentation
-        mock_editor.currentSegmentID.return_value = "segment_0"
-
-        mock_widget_self = MagicMock()
-        mock_widget_self.editor = mock_editor
-        mock_widget = MagicMock()
-        mock_widget.self.return_value = mock_widget_self
-
-        mock_slicer.modules.segmenteditor.widgetRepresentation.return_value = mock_widget
+    @pytest.mark.parametrize(
+        ("check", "module_name"),
+        [("_is_segment_editor_active", "SegmentEditor"), ("_is_markups_active", "Markups")],
+    )
+    def test_module_context_checks(self, check, module_name):
+        """Test context checks match only their own module."""
+        is_active = getattr(ActionRegistry, check)
+
+        assert is_active(ActionContext(module_name=module_name)) is True
+        assert is_active(ActionContext(module_name="Data")) is False
+
+    @pytest.mark.parametrize(
+        ("method", "current_id", "expected_id"),
+        [
+            ("_next_segment", "segment_0", "segment_1"),
+            ("_previous_segment", "segment_1", "segment_0"),
+        ],
+    )
+    def test_segment_navigation(self, slicer_mock, method, current_id, expected_id):
+        """Test next/previous segment selection."""
+        stub = make_segment_editor_stub(num_segments=3, current_id=current_id)
+        slicer_mock.modules.segmenteditor.widgetRepresentation.return_value.self.return_value = stub
 
         context = ActionContext(module_name="SegmentEditor")
-        result = ActionRegistry._next_segment(context)
+        result = getattr(ActionRegistry(), method)(context)
 
         assert result is True
-        mock_editor.setCurrentSegmentID.assert_called_once_with("segment_1")
-
-    def test_previous_segment(self):
-        """Test previous segment selection."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
+        stub.editor.setCurrentSegmentID.assert_called_once_with(expected_id)
 
-        # Set up mock segmentation
-        mock_seg = MagicMock()
-        mock_seg.GetNumberOfSegments.return_value = 3
-        mock_seg.GetNthSegmentID.side_effect = lambda i: f"segment_{i}"
-
-        mock_segmentation = MagicMock()
-        mock_segmentation.GetSegmentation.return_value = mock_seg
-
-        mock_editor = MagicMock()
-        mock_editor.segmentationNode.return_value = mock_segmentation
-        mock_editor.currentSegmentID.return_value = "segment_1"
-
-        mock_widget_self = MagicMock()
-        mock_widget_self.editor = mock_editor
-        mock_widget = MagicMock()
-        mock_widget.self.return_value = mock_widget_self
-
-        mock_slicer.modules.segmenteditor.widgetRepresentation.return_value = mock_widget
+    def test_segment_ids_cached_until_modified(self, slicer_mock):
+        """Test that segment IDs are walked again only after the segmentation changes."""
+        stub = make_segment_editor_stub(num_segments=3, current_id="segment_0")
+        get_nth = MagicMock(side_effect=lambda i: f"segment_{i}")
+        stub.segmentation.GetNthSegmentID = get_nth
+        slicer_mock.modules.segmenteditor.widgetRepresentation.return_value.self.return_value = stub
 
+        registry = ActionRegistry()
         context = ActionContext(module_name="SegmentEditor")
-        result = ActionRegistry._previous_segment(context)
-
-        assert result is True
-        mock_editor.setCurrentSegmentID.assert_called_once_with("segment_0")
-
-    def test_add_segment(self):
-        """Test adding a new segment."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
+        registry._next_segment(context)
+        registry._previous_segment(context)
 
-        mock_seg = MagicMock()
-        mock_seg.AddEmptySegment.return_value = "new_segment_id"
+        assert get_nth.call_count == 3
 
-        mock_segmentation = MagicMock()
-        mock_segmentation.GetSegmentation.return_value = mock_seg
+        stub.segmentation.GetMTime = lambda: 2
+        registry._next_segment(context)
 
-        mock_editor = MagicMock()
-        mock_editor.segmentationNode.return_value = mock_segmentation
+        assert get_nth.call_count == 6
 
-        mock_widget_self = MagicMock()
-        mock_widget_self.editor = mock_editor
-        mock_widget = MagicMock()
-        mock_widget.self.return_value = mock_widget_self
-
-        mock_slicer.modules.segmenteditor.widgetRepresentation.return_value = mock_widget
+    def test_add_segment(self, slicer_mock):
+        """Test adding a new segment."""
+        stub = make_segment_editor_stub(new_segment_id="new_segment_id")
+        slicer_mock.modules.segmenteditor.widgetRepresentation.return_value.self.return_value = stub
 
         context = ActionContext(module_name="SegmentEditor")
         result = ActionRegistry._add_segment(context)
 
         assert result is True
-        mock_seg.AddEmptySegment.assert_called_once()
-        mock_editor.setCurrentSegmentID.assert_called_once_with("new_segment_id")
+        stub.segmentation.AddEmptySegment.assert_called_once()
+        stub.editor.setCurrentSegmentID.assert_called_once_with("new_segment_id")
 
-    def test_place_fiducial(self):
+    def test_place_fiducial(self, slicer_mock):
         """Test placing fiducial."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
         mock_interaction = MagicMock()
         mock_interaction.Place = 1
         mock_selection = MagicMock()
@@ -834,7 +923,7 @@ class TestBuiltinActionImplementations:
         mock_app_logic.GetInteractionNode.return_value = mock_interaction
         mock_app_logic.GetSelectionNode.return_value = mock_selection
 
-        mock_slicer.app.applicationLogic.return_value = mock_app_logic
+        slicer_mock.app.applicationLogic.return_value = mock_app_logic
 
         context = ActionContext(module_name="Markups")
         result = ActionRegistry._place_fiducial(context)
@@ -843,10 +932,8 @@ class TestBuiltinActionImplementations:
         mock_selection.SetReferenceActivePlaceNodeClassName.assert_called_once()
         mock_interaction.SetCurrentInteractionMode.assert_called_once()
 
-    def test_delete_markup_point(self):
+    def test_delete_markup_point(self, slicer_mock):
         """Test deleting a markup point."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
         mock_markup = MagicMock()
         mock_markup.GetNumberOfControlPoints.return_value = 5
 
@@ -856,8 +943,8 @@ class TestBuiltinActionImplementations:
         mock_app_logic = MagicMock()
         mock_app_logic.GetSelectionNode.return_value = mock_selection
 
-        mock_slicer.app.applicationLogic.return_value = mock_app_logic
-        mock_slicer.mrmlScene.GetNodeByID.return_value = mock_markup
+        slicer_mock.app.applicationLogic.return_value = mock_app_logic
+        slicer_mock.mrmlScene.GetNodeByID.return_value = mock_markup
 
         context = ActionContext(module_name="Markups")
         result = ActionRegistry._delete_markup_point(context)
@@ -865,74 +952,117 @@ class TestBuiltinActionImplementations:
         assert result is True
         mock_markup.RemoveNthControlPoint.assert_called_once_with(4)
 
-    def test_delete_markup_point_no_active_node(self):
+    def test_delete_markup_point_no_active_node(self, slicer_mock):
         """Test deleting markup point when no active node."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
         mock_selection = MagicMock()
         mock_selection.GetActivePlaceNodeID.return_value = ""
 
         mock_app_logic = MagicMock()
         mock_app_logic.GetSelectionNode.return_value = mock_selection
 
-        mock_slicer.app.applicationLogic.return_value = mock_app_logic
+        slicer_mock.app.applicationLogic.return_value = mock_app_logic
 
         context = ActionContext(module_name="Markups")
         result = ActionRegistry._delete_markup_point(context)
 
         assert result is False
 
-    def test_toggle_volume_rendering(self):
+    def test_toggle_volume_rendering(self, slicer_util_mock):
         """Test toggling volume rendering."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
         mock_node = MagicMock()
         mock_node.GetVisibility.return_value = True
-        mock_slicer_util.getNodesByClass.return_value = [mock_node]
+        slicer_util_mock.getNodesByClass.return_value = [mock_node]
 
         context = ActionContext()
-        result = ActionRegistry._toggle_volume_rendering(context)
+        result = ActionRegistry()._toggle_volume_rendering(context)
 
         assert result is True
         mock_node.SetVisibility.assert_called_once_with(False)
 
+    def test_center_crosshair_caches_slice_nodes(self, slicer_util_mock):
+        """Test center crosshair reuses slice nodes until the scene changes."""
+        mock_slice_node = MagicMock()
+        slicer_util_mock.getNodesByClass.return_value = [mock_slice_node]
 
-class TestSetSegmentEditorEffect:
-    """Test _set_segment_editor_effect factory method."""
+        registry = ActionRegistry()
+        context = ActionContext()
+        assert registry._center_crosshair(context) is True
+        assert registry._center_crosshair(context) is True
 
-    def setup_method(self):
-        """Reset mocks before each test."""
-        mock_slicer.reset_mock()
+        slicer_util_mock.getNodesByClass.assert_called_once_with("vtkMRMLSliceNode")
+        slicer_util_mock.getNode.assert_called_once_with("Crosshair")
+        assert mock_slice_node.JumpSliceByCentering.call_count == 2
 
-    def test_creates_handler_function(self):
-        """Test that factory creates a working handler."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
+        # Scene observer callback drops the cache
+        registry._invalidate_node_caches()
+        registry._center_crosshair(context)
+
+        assert slicer_util_mock.getNodesByClass.call_count == 2
 
-        mock_editor = MagicMock()
-        mock_widget_self = MagicMock()
-        mock_widget_self.editor = mock_editor
-        mock_widget = MagicMock()
-        mock_widget.self.return_value = mock_widget_self
 
-        mock_slicer.modules.segmenteditor.widgetRepresentation.return_value = mock_widget
+class TestSegmentEditorEffectHandler:
+    """Test SegmentEditorEffectHandler."""
 
-        handler_func = ActionRegistry._set_segment_editor_effect("Paint")
+    def setup_method(self):
+        """Reset the cached editor before each test."""
+        SegmentEditorEffectHandler.invalidate_editor_cache()
+
+    def test_activates_effect(self, segment_editor):
+        """Test that the handler activates its effect."""
+        handler = SegmentEditorEffectHandler("Paint")
         context = ActionContext(module_name="SegmentEditor")
 
-        result = handler_func(context)
+        result = handler.execute(context)
 
         assert result is True
-        mock_editor.setActiveEffectByName.assert_called_once_with("Paint")
+        segment_editor.setActiveEffectByName.assert_called_once_with("Paint")
 
-    def test_returns_false_when_no_widget(self):
+    def test_returns_false_when_no_widget(self, slicer_mock):
         """Test handler returns False when editor widget unavailable."""
-        from MouseMasterLib.action_registry import ActionContext, ActionRegistry
-
-        mock_slicer.modules.segmenteditor.widgetRepresentation.return_value = None
+        slicer_mock.modules.segmenteditor.widgetRepresentation.return_value = None
 
-        handler_func = ActionRegistry._set_segment_editor_effect("Paint")
+        handler = SegmentEditorEffectHandler("Paint")
         context = ActionContext(module_name="SegmentEditor")
 
-        result = handler_func(context)
+        result = handler.execute(context)
 
         assert result is False
+
+    def test_editor_resolved_once(self, slicer_mock, segment_editor):
+        """Test that the editor widget is shared and resolved only once."""
+        context = ActionContext(module_name="SegmentEditor")
+        SegmentEditorEffectHandler("Paint").execute(context)
+        SegmentEditorEffectHandler("Erase").execute(context)
+
+        slicer_mock.modules.segmenteditor.widgetRepresentation.assert_called_once()
+        assert segment_editor.setActiveEffectByName.call_count == 2
+
+        SegmentEditorEffectHandler.invalidate_editor_cache()
+        SegmentEditorEffectHandler("Paint").execute(context)
+
+        assert slicer_mock.modules.segmenteditor.widgetRepresentation.call_count == 2
+
+    def test_deleted_editor_resolved_again(self, slicer_mock):
+        """Test that a deleted cached editor is dropped and resolved again."""
+        deleted_editor = MagicMock()
+        deleted_editor.setActiveEffectByName.side_effect = RuntimeError(
+            "underlying C++ object was deleted"
+        )
+        new_editor = MagicMock()
+        widget = slicer_mock.modules.segmenteditor.widgetRepresentation.return_value
+        widget.self.side_effect = [MagicMock(editor=deleted_editor), MagicMock(editor=new_editor)]
+
+        result = SegmentEditorEffectHandler("Paint").execute(
+            ActionContext(module_name="SegmentEditor")
+        )
+
+        assert result is True
+        new_editor.setActiveEffectByName.assert_called_once_with("Paint")
+        assert SegmentEditorEffectHandler._editor is new_editor
+
+    def test_is_available(self):
+        """Test availability is limited to the Segment Editor module."""
+        handler = SegmentEditorEffectHandler("Paint")
+
+        assert handler.is_available(ActionContext(module_name="SegmentEditor")) is True
+        assert handler.is_available(ActionContext(module_name="Data")) is False
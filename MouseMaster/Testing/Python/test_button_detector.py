@@ -4,14 +4,19 @@ from __future__ import annotations
 
 import pytest
 
+from MouseMasterLib.button_detector import (
+    ButtonDetector,
+    DetectedButton,
+    DetectionSession,
+    _classify_button,
+)
+
 
 class TestDetectedButton:
     """Tests for DetectedButton dataclass."""
 
     def test_default_values(self) -> None:
         """Test DetectedButton with default values."""
-        from MouseMasterLib.button_detector import DetectedButton
-
         button = DetectedButton(qt_button=8)
 
         assert button.qt_button == 8
@@ -25,22 +30,46 @@ class TestDetectionSession:
 
     def test_default_values(self) -> None:
         """Test DetectionSession with default values."""
-        from MouseMasterLib.button_detector import DetectionSession
-
         session = DetectionSession()
 
         assert session.buttons == {}
         assert session.step == 0
         assert session.completed is False
 
+    def test_get_button_by_bit(self) -> None:
+        """Test lookup of single-bit and multi-bit button codes."""
+        session = DetectionSession()
+        back = DetectedButton(qt_button=8, suggested_id="back")
+        combo = DetectedButton(qt_button=12, suggested_id="combo")
+        session.add_button(back)
+        session.add_button(combo)
+
+        assert session.get_button(8) is back
+        assert session.get_button(12) is combo
+        assert session.get_button(16) is None
+        assert session.buttons == {8: back, 12: combo}
+
+
+class TestClassifyButton:
+    """Tests for the _classify_button helper."""
+
+    def test_single_bit_codes(self) -> None:
+        """Test Qt button flags map to their bit position."""
+        assert _classify_button(1) == 0
+        assert _classify_button(8) == 3
+        assert _classify_button(1 << 31) == 31
+
+    def test_codes_without_slot(self) -> None:
+        """Test codes outside the slot range return -1."""
+        assert _classify_button(0) == -1
+        assert _classify_button(1 << 32) == -1
+
 
 class TestButtonDetector:
     """Tests for ButtonDetector class."""
 
     def test_start_detection(self) -> None:
         """Test starting a detection session."""
-        from MouseMasterLib.button_detector import ButtonDetector
-
         detector = ButtonDetector()
         session = detector.start_detection(expected_buttons=5)
 
@@ -50,8 +79,6 @@ class TestButtonDetector:
 
     def test_stop_detection(self) -> None:
         """Test stopping a detection session."""
-        from MouseMasterLib.button_detector import ButtonDetector
-
         detector = ButtonDetector()
         detector.start_detection()
 
@@ -62,8 +89,6 @@ class TestButtonDetector:
 
     def test_on_button_press_new_button(self) -> None:
         """Test detecting a new button."""
-        from MouseMasterLib.button_detector import ButtonDetector
-
         detector = ButtonDetector()
         detector.start_detection()
 
@@ -76,8 +101,6 @@ class TestButtonDetector:
 
     def test_on_button_press_duplicate(self) -> None:
         """Test pressing the same button twice."""
-        from MouseMasterLib.button_detector import ButtonDetector
-
         detector = ButtonDetector()
         detector.start_detection()
 
@@ -89,34 +112,32 @@ class TestButtonDetector:
 
     def test_on_button_press_no_session(self) -> None:
         """Test button press without active session."""
-        from MouseMasterLib.button_detector import ButtonDetector
-
         detector = ButtonDetector()
 
         result = detector.on_button_press(8)
 
         assert result is False
 
-    def test_detection_order(self) -> None:
+    @pytest.mark.parametrize(
+        ("presses", "expected_ids"),
+        [
+            ((1, 2, 4), ["left", "right", "middle"]),
+            ((8, 1, 16, 2), ["left", "right", "middle", "back"]),
+        ],
+    )
+    def test_detection_order(self, presses, expected_ids) -> None:
         """Test buttons are assigned IDs in detection order."""
-        from MouseMasterLib.button_detector import ButtonDetector
-
         detector = ButtonDetector()
         detector.start_detection()
 
-        detector.on_button_press(1)
-        detector.on_button_press(2)
-        detector.on_button_press(4)
+        for qt_button in presses:
+            detector.on_button_press(qt_button)
 
         session = detector.get_session()
-        assert session.buttons[1].suggested_id == "left"
-        assert session.buttons[2].suggested_id == "right"
-        assert session.buttons[4].suggested_id == "middle"
+        assert [session.buttons[b].suggested_id for b in presses] == expected_ids
 
     def test_detection_complete_callback(self) -> None:
         """Test completion callback is called."""
-        from MouseMasterLib.button_detector import ButtonDetector
-
         callback_received = []
 
         def on_complete(session):
@@ -131,10 +152,20 @@ class TestButtonDetector:
         assert len(callback_received) == 1
         assert callback_received[0].completed is True
 
+    def test_complete_callback_fires_once(self) -> None:
+        """Test finalize after automatic completion does not re-fire the callback."""
+        callback_received = []
+
+        detector = ButtonDetector()
+        detector.start_detection(on_complete=callback_received.append, expected_buttons=1)
+
+        detector.on_button_press(1)
+        detector.finalize_detection()
+
+        assert len(callback_received) == 1
+
     def test_button_callback(self) -> None:
         """Test button detection callback."""
-        from MouseMasterLib.button_detector import ButtonDetector
-
         detected_buttons = []
 
         def on_button(detected):
@@ -150,8 +181,6 @@ class TestButtonDetector:
 
     def test_generate_profile(self) -> None:
         """Test generating a mouse profile from detected buttons."""
-        from MouseMasterLib.button_detector import ButtonDetector
-
         detector = ButtonDetector()
         detector.start_detection()
 
@@ -170,10 +199,22 @@ class TestButtonDetector:
         assert profile["vendor"] == "Custom"
         assert len(profile["buttons"]) == 3
 
+    def test_generate_profile_remappable_flags(self) -> None:
+        """Test that left/right are marked non-remappable in generated profiles."""
+        detector = ButtonDetector()
+        detector.start_detection()
+
+        detector.on_button_press(1)
+        detector.on_button_press(2)
+        detector.on_button_press(8)
+
+        profile = detector.generate_profile("my_mouse", "My Mouse")
+
+        assert [b["qtButton"] for b in profile["buttons"]] == [1, 2, 8]
+        assert [b["remappable"] for b in profile["buttons"]] == [False, False, True]
+
     def test_generate_profile_no_buttons(self) -> None:
         """Test generating profile without any detected buttons."""
-        from MouseMasterLib.button_detector import ButtonDetector
-
         detector = ButtonDetector()
         detector.start_detection()
 
@@ -182,8 +223,6 @@ class TestButtonDetector:
 
     def test_generate_profile_no_session(self) -> None:
         """Test generating profile without session."""
-        from MouseMasterLib.button_detector import ButtonDetector
-
         detector = ButtonDetector()
 
         with pytest.raises(ValueError, match="No buttons detected"):
@@ -191,8 +230,6 @@ class TestButtonDetector:
 
     def test_finalize_detection(self) -> None:
         """Test manually finalizing detection."""
-        from MouseMasterLib.button_detector import ButtonDetector
-
         detector = ButtonDetector()
         detector.start_detection(expected_buttons=10)
 
@@ -203,20 +240,20 @@ class TestButtonDetector:
 
         assert session.completed is True
 
-    def test_prompt_updates(self) -> None:
-        """Test that prompts update during detection."""
-        from MouseMasterLib.button_detector import ButtonDetector
-
+    @pytest.mark.parametrize(
+        ("expected_buttons", "presses", "expected_prompts"),
+        [
+            (3, (1, 2, 4), ["button 2", "button 3", "complete"]),
+            (2, (8, 8, 16), ["button 2", "button 2", "complete"]),
+        ],
+    )
+    def test_prompt_updates(self, expected_buttons, presses, expected_prompts) -> None:
+        """Test that prompts update during detection and ignore repeat presses."""
         detector = ButtonDetector()
-        session = detector.start_detection(expected_buttons=3)
+        session = detector.start_detection(expected_buttons=expected_buttons)
 
         assert "button 1" in session.current_prompt.lower()
 
-        detector.on_button_press(1)
-        assert "button 2" in session.current_prompt.lower()
-
-        detector.on_button_press(2)
-        assert "button 3" in session.current_prompt.lower()
-
-        detector.on_button_press(4)
-        assert "complete" in session.current_prompt.lower()
+        for qt_button, expected in zip(presses, expected_prompts):
+            detector.on_button_press(qt_button)
+            assert expected in session.current_prompt.lower()
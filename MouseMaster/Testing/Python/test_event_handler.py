@@ -3,15 +3,35 @@
 These tests mock Slicer/Qt dependencies to test event handler logic without running inside Slicer.
 """
 
+import sys
 from unittest.mock import MagicMock, patch
 
-# Import centralized mocks from conftest
-from conftest import get_mock_qt, get_mock_slicer, get_mock_slicer_util
+import pytest
 
-# Get local references to mocks (they're reset before each test by conftest fixture)
-mock_slicer = get_mock_slicer()
-mock_slicer_util = get_mock_slicer_util()
-mock_qt = get_mock_qt()
+from MouseMasterLib.event_handler import (
+    _CONTEXT_CACHE_TTL,
+    MouseMasterEventHandler,
+    _create_event_filter,
+    logger,
+)
+from MouseMasterLib.platform_adapter import CanonicalButton, NormalizedEvent, PlatformAdapter
+from MouseMasterLib.preset_manager import Mapping, Preset
+
+
+@pytest.fixture
+def selected_module(slicer_util_mock):
+    """``slicer.util.selectedModule`` on the fresh mock, reporting the Data module."""
+    slicer_util_mock.selectedModule.return_value = "Data"
+    return slicer_util_mock.selectedModule
+
+
+@pytest.fixture
+def layout_manager(slicer_mock):
+    """Layout manager returned by ``slicer.app.layoutManager()``, with no views."""
+    manager = slicer_mock.app.layoutManager.return_value
+    manager.sliceViewNames.return_value = []
+    manager.threeDViewCount = 0
+    return manager
 
 
 class TestMouseMasterEventHandlerInit:
@@ -19,8 +39,6 @@ class TestMouseMasterEventHandlerInit:
 
     def test_init_defaults(self):
         """Test that handler initializes with correct defaults."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
 
         assert handler._installed is False
@@ -30,7 +48,7 @@ class TestMouseMasterEventHandlerInit:
         assert handler._platform_adapter is None
         assert handler._action_registry is None
         assert handler._on_button_press is None
-        assert handler._vtk_observers == []
+        assert len(handler._vtk_observers) == 0
 
 
 class TestMouseMasterEventHandlerProperties:
@@ -38,22 +56,16 @@ class TestMouseMasterEventHandlerProperties:
 
     def test_is_installed_false_by_default(self):
         """Test is_installed returns False initially."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
         assert handler.is_installed is False
 
     def test_is_enabled_true_by_default(self):
         """Test is_enabled returns True initially."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
         assert handler.is_enabled is True
 
     def test_set_enabled(self):
         """Test set_enabled method."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
         handler.set_enabled(False)
         assert handler.is_enabled is False
@@ -66,8 +78,6 @@ class TestMouseMasterEventHandlerSetPreset:
 
     def test_set_preset_stores_preset(self):
         """Test that set_preset stores the preset."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
         mock_preset = MagicMock()
         mock_preset.name = "Test Preset"
@@ -78,8 +88,6 @@ class TestMouseMasterEventHandlerSetPreset:
 
     def test_set_preset_none(self):
         """Test that set_preset can clear the preset."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
         mock_preset = MagicMock()
         handler.set_preset(mock_preset)
@@ -93,8 +101,6 @@ class TestMouseMasterEventHandlerSetOnButtonPress:
 
     def test_set_on_button_press(self):
         """Test setting the button press callback."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
         callback = MagicMock()
 
@@ -104,8 +110,6 @@ class TestMouseMasterEventHandlerSetOnButtonPress:
 
     def test_set_on_button_press_none(self):
         """Test clearing the button press callback."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
         handler.set_on_button_press(MagicMock())
         handler.set_on_button_press(None)
@@ -118,29 +122,43 @@ class TestMouseMasterEventHandlerInstall:
 
     def test_install_sets_installed_flag(self):
         """Test that install sets the installed flag."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
 
         with (
             patch("MouseMasterLib.event_handler._create_event_filter") as mock_create,
-            patch.object(handler, "_install_vtk_observers"),
+            patch.object(MouseMasterEventHandler, "_connect_view_tracking"),
         ):
             mock_create.return_value = MagicMock()
             handler.install()
 
             assert handler.is_installed is True
             assert handler._qt_handler is not None
+            assert handler._normalize is not None
+            assert handler._registry_execute is not None
+            assert handler._action_context is not None
+
+    def test_install_filters_application(self, slicer_mock):
+        """Test that the filter is installed on the application and removed again."""
+        handler = MouseMasterEventHandler()
+
+        with (
+            patch("MouseMasterLib.event_handler._create_event_filter") as mock_create,
+            patch.object(MouseMasterEventHandler, "_connect_view_tracking") as mock_tracking,
+        ):
+            handler.install()
+            handler.uninstall()
+
+        mock_tracking.assert_called_once_with()
+        slicer_mock.app.installEventFilter.assert_called_once_with(mock_create.return_value)
+        slicer_mock.app.removeEventFilter.assert_called_once_with(mock_create.return_value)
 
     def test_install_idempotent(self):
         """Test that calling install twice doesn't install twice."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
 
         with (
             patch("MouseMasterLib.event_handler._create_event_filter") as mock_create,
-            patch.object(handler, "_install_vtk_observers"),
+            patch.object(MouseMasterEventHandler, "_connect_view_tracking"),
         ):
             mock_create.return_value = MagicMock()
 
@@ -154,13 +172,11 @@ class TestMouseMasterEventHandlerInstall:
 
     def test_uninstall_clears_handler(self):
         """Test that uninstall clears the event filter."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
 
         with (
             patch("MouseMasterLib.event_handler._create_event_filter") as mock_create,
-            patch.object(handler, "_install_vtk_observers"),
+            patch.object(MouseMasterEventHandler, "_connect_view_tracking"),
         ):
             mock_create.return_value = MagicMock()
 
@@ -172,8 +188,6 @@ class TestMouseMasterEventHandlerInstall:
 
     def test_uninstall_when_not_installed(self):
         """Test that uninstall does nothing when not installed."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
 
         # Should not raise
@@ -187,8 +201,6 @@ class TestMouseMasterEventHandlerHandleButtonPress:
 
     def test_handle_button_press_disabled_returns_false(self):
         """Test that disabled handler returns False."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
         handler.set_enabled(False)
 
@@ -196,314 +208,432 @@ class TestMouseMasterEventHandlerHandleButtonPress:
 
         assert result is False
 
-    def test_handle_button_press_no_preset_returns_false(self):
+    def test_handle_button_press_no_preset_returns_false(self, patched_adapter, selected_module):
         """Test that handler with no preset returns False."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
 
-        # Mock platform adapter
-        mock_adapter = MagicMock()
-        mock_normalized = MagicMock()
-        mock_normalized.button_id = "back"
-        mock_adapter.normalize_event.return_value = mock_normalized
-
-        with patch(
-            "MouseMasterLib.platform_adapter.PlatformAdapter.get_instance",
-            return_value=mock_adapter,
-        ):
-            mock_slicer.util.selectedModule.return_value = "Data"
-            result = handler.handle_button_press(MagicMock())
+        result = handler.handle_button_press(MagicMock())
 
         assert result is False
 
-    def test_handle_button_press_no_mapping_returns_false(self):
+    def test_handle_button_press_no_mapping_returns_false(self, patched_adapter, selected_module):
         """Test that handler with no mapping returns False."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
 
         # Set up preset with no mapping
-        mock_preset = MagicMock()
-        mock_preset.get_mapping.return_value = None
-        handler.set_preset(mock_preset)
+        preset = Preset(id="test", name="Test", version="1.0", mouse_id="generic")
+        handler.set_preset(preset)
 
-        # Mock platform adapter
-        mock_adapter = MagicMock()
-        mock_normalized = MagicMock()
-        mock_normalized.button_id = "back"
-        mock_adapter.normalize_event.return_value = mock_normalized
-
-        with patch(
-            "MouseMasterLib.platform_adapter.PlatformAdapter.get_instance",
-            return_value=mock_adapter,
-        ):
-            mock_slicer.util.selectedModule.return_value = "Data"
-            result = handler.handle_button_press(MagicMock())
+        result = handler.handle_button_press(MagicMock())
 
         assert result is False
-        mock_preset.get_mapping.assert_called_once()
 
-    def test_handle_button_press_calls_callback(self):
+    def test_handle_button_press_calls_callback(self, patched_adapter, monkeypatch):
         """Test that button press callback is called."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
 
         callback = MagicMock()
         handler.set_on_button_press(callback)
 
-        # Mock platform adapter
-        mock_adapter = MagicMock()
-        mock_normalized = MagicMock()
-        mock_normalized.button_id = "back"
-        mock_adapter.normalize_event.return_value = mock_normalized
-
-        with (
-            patch(
-                "MouseMasterLib.platform_adapter.PlatformAdapter.get_instance",
-                return_value=mock_adapter,
-            ),
-            patch.object(handler, "_get_current_context", return_value="Data"),
-        ):
-            handler.handle_button_press(MagicMock())
+        monkeypatch.setattr(
+            MouseMasterEventHandler, "_get_current_context", MagicMock(return_value="Data")
+        )
+        handler.handle_button_press(MagicMock())
 
         callback.assert_called_once_with("back", "Data")
 
-    def test_handle_button_press_with_mapping_returns_true(self):
-        """Test that handler with mapping returns True and executes."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
+    def test_handle_button_press_binds_adapter_once(self, patched_adapter, monkeypatch):
+        """Test that the adapter is looked up once and its bound method reused."""
         handler = MouseMasterEventHandler()
 
-        # Set up preset with mapping
-        mock_mapping = MagicMock()
-        mock_mapping.action = "edit_undo"
-        mock_mapping.action_id = None
-        mock_preset = MagicMock()
-        mock_preset.get_mapping.return_value = mock_mapping
-        handler.set_preset(mock_preset)
+        monkeypatch.setattr(
+            MouseMasterEventHandler, "_get_current_context", MagicMock(return_value="Data")
+        )
+        handler.handle_button_press(MagicMock())
+        handler.handle_button_press(MagicMock())
 
-        # Mock platform adapter
-        mock_adapter = MagicMock()
-        mock_normalized = MagicMock()
-        mock_normalized.button_id = "back"
-        mock_normalized.modifiers = set()
-        mock_adapter.normalize_event.return_value = mock_normalized
+        PlatformAdapter.get_instance.assert_called_once()
+        assert patched_adapter.normalize_event.call_count == 2
 
-        # Mock action registry
-        mock_registry = MagicMock()
+    def test_handle_button_press_with_mapping_returns_true(
+        self, patched_adapter, patched_registry, selected_module
+    ):
+        """Test that handler with mapping returns True and executes."""
+        handler = MouseMasterEventHandler()
 
-        with (
-            patch(
-                "MouseMasterLib.platform_adapter.PlatformAdapter.get_instance",
-                return_value=mock_adapter,
-            ),
-            patch(
-                "MouseMasterLib.action_registry.ActionRegistry.get_instance",
-                return_value=mock_registry,
-            ),
-        ):
-            mock_slicer.util.selectedModule.return_value = "Data"
-            result = handler.handle_button_press(MagicMock())
+        # Set up preset with mapping
+        preset = Preset(
+            id="test",
+            name="Test",
+            version="1.0",
+            mouse_id="generic",
+            mappings={"back": Mapping(action="edit_undo")},
+        )
+        handler.set_preset(preset)
+
+        result = handler.handle_button_press(MagicMock())
 
         assert result is True
-        mock_registry.execute.assert_called_once()
+        patched_registry.execute.assert_called_once()
 
 
 class TestMouseMasterEventHandlerExecuteMapping:
     """Test _execute_mapping method."""
 
-    def test_execute_python_command(self):
-        """Test executing a Python command mapping."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
+    @pytest.mark.parametrize(
+        ("action", "parameters", "patched_execute", "expected_attrs"),
+        [
+            (
+                "python_command",
+                {"command": "print('test')"},
+                "patched_python_handler",
+                {"_command": "print('test')"},
+            ),
+            (
+                "keyboard_shortcut",
+                {"key": "Z", "modifiers": ["ctrl"]},
+                "patched_keyboard_handler",
+                {"_key": "Z", "_modifiers": ["ctrl"]},
+            ),
+        ],
+    )
+    def test_execute_handler_mapping(
+        self, request, normalized_back_event, action, parameters, patched_execute, expected_attrs
+    ):
+        """Test that parameterized mappings build and execute their handler."""
+        mock_execute = request.getfixturevalue(patched_execute)
         handler = MouseMasterEventHandler()
 
-        mock_mapping = MagicMock()
-        mock_mapping.action = "python_command"
-        mock_mapping.parameters = {"command": "print('test')"}
+        mapping = Mapping(action=action, parameters=parameters)
 
-        mock_normalized = MagicMock()
-        mock_normalized.button_id = "back"
-        mock_normalized.modifiers = set()
+        handler._execute_mapping(mapping, normalized_back_event, "Data")
 
-        with patch("MouseMasterLib.action_registry.PythonCommandHandler") as MockPythonHandler:
-            mock_handler_instance = MagicMock()
-            MockPythonHandler.return_value = mock_handler_instance
+        mock_execute.assert_called_once()
+        action_handler = mock_execute.call_args[0][0]
+        for name, value in expected_attrs.items():
+            assert getattr(action_handler, name) == value
 
-            handler._execute_mapping(mock_mapping, mock_normalized, "Data")
+    def test_execute_slicer_action(self, normalized_back_event, patched_registry):
+        """Test executing a Slicer action mapping."""
+        handler = MouseMasterEventHandler()
 
-            MockPythonHandler.assert_called_once_with("print('test')")
-            mock_handler_instance.execute.assert_called_once()
+        mapping = Mapping(action="slicer_action", action_id="edit_undo")
 
-    def test_execute_keyboard_shortcut(self):
-        """Test executing a keyboard shortcut mapping."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
+        handler._execute_mapping(mapping, normalized_back_event, "Data")
 
+        patched_registry.execute.assert_called_once()
+        # Check the action_id was passed
+        call_args = patched_registry.execute.call_args
+        assert call_args[0][0] == "edit_undo"
+
+    def test_execute_reuses_action_context(self, patched_registry):
+        """Test that one ActionContext is reused and updated for each dispatch."""
         handler = MouseMasterEventHandler()
 
-        mock_mapping = MagicMock()
-        mock_mapping.action = "keyboard_shortcut"
-        mock_mapping.parameters = {"key": "Z", "modifiers": ["ctrl"]}
+        mapping = Mapping(action="slicer_action", action_id="edit_undo")
 
-        mock_normalized = MagicMock()
-        mock_normalized.button_id = "back"
-        mock_normalized.modifiers = set()
+        first = NormalizedEvent(CanonicalButton.BACK, "back", frozenset({"ctrl"}))
+        second = NormalizedEvent(CanonicalButton.FORWARD, "forward", frozenset())
 
-        with patch("MouseMasterLib.action_registry.KeyboardShortcutHandler") as MockKeyboardHandler:
-            mock_handler_instance = MagicMock()
-            MockKeyboardHandler.return_value = mock_handler_instance
+        handler._execute_mapping(mapping, first, "Data")
+        first_context = patched_registry.execute.call_args[0][1]
+        assert first_context.modifiers == frozenset({"ctrl"})
 
-            handler._execute_mapping(mock_mapping, mock_normalized, "Data")
+        handler._execute_mapping(mapping, second, "Markups")
+        second_context = patched_registry.execute.call_args[0][1]
 
-            MockKeyboardHandler.assert_called_once_with("Z", ["ctrl"])
-            mock_handler_instance.execute.assert_called_once()
+        assert second_context is first_context
+        assert second_context.module_name == "Markups"
+        assert second_context.button_id == "forward"
+        assert second_context.modifiers == frozenset()
 
-    def test_execute_slicer_action(self):
-        """Test executing a Slicer action mapping."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
 
+class TestViewFilterInstall:
+    """Test installation of view event filters."""
+
+    def _make_handler(self):
         handler = MouseMasterEventHandler()
+        handler._qt_handler = MagicMock()
+        return handler
+
+    def test_connect_view_tracking_no_layout_manager(self, slicer_mock):
+        """Test handling when layout manager is not available."""
+        handler = self._make_handler()
+        slicer_mock.app.layoutManager.return_value = None
 
-        mock_mapping = MagicMock()
-        mock_mapping.action = "slicer_action"
-        mock_mapping.action_id = "edit_undo"
+        # Should not raise
+        handler._connect_view_tracking()
+
+        assert handler._layout_manager is None
+        assert len(handler._vtk_observers) == 0
+
+    def test_connect_view_tracking_filters_all_views(self, layout_manager):
+        """Test every slice and 3D view is filtered at install time."""
+        handler = self._make_handler()
+        slice_views = {name: MagicMock(name=name) for name in ("Red", "Yellow", "Green")}
+        three_d_view = MagicMock(name="3D")
+        layout_manager.sliceViewNames.return_value = list(slice_views)
+        layout_manager.sliceWidget.side_effect = lambda name: MagicMock(
+            **{"sliceView.return_value": slice_views[name]}
+        )
+        layout_manager.threeDViewCount = 1
+        layout_manager.threeDWidget.return_value.threeDView.return_value = three_d_view
+
+        handler._connect_view_tracking()
+
+        layout_manager.layoutChanged.connect.assert_called_once_with(handler._on_layout_changed)
+        for view in [*slice_views.values(), three_d_view]:
+            view.installEventFilter.assert_called_once_with(handler._qt_handler)
+        assert len(handler._vtk_observers) == 4
 
-        mock_normalized = MagicMock()
-        mock_normalized.button_id = "back"
-        mock_normalized.modifiers = set()
+    def test_layout_change_filters_new_views_once(self, layout_manager):
+        """Test a layout change filters added views without re-filtering old ones."""
+        handler = self._make_handler()
+        red = MagicMock(name="Red")
+        green = MagicMock(name="Green")
+        views = {"Red": red, "Green": green}
+        layout_manager.sliceViewNames.return_value = ["Red"]
+        layout_manager.sliceWidget.side_effect = lambda name: MagicMock(
+            **{"sliceView.return_value": views[name]}
+        )
 
-        mock_registry = MagicMock()
+        handler._connect_view_tracking()
+        layout_manager.sliceViewNames.return_value = ["Red", "Green"]
+        handler._on_layout_changed(2)
+
+        red.installEventFilter.assert_called_once_with(handler._qt_handler)
+        green.installEventFilter.assert_called_once_with(handler._qt_handler)
+        assert len(handler._vtk_observers) == 2
 
-        with patch(
-            "MouseMasterLib.action_registry.ActionRegistry.get_instance",
-            return_value=mock_registry,
-        ):
-            handler._execute_mapping(mock_mapping, mock_normalized, "Data")
 
-            mock_registry.execute.assert_called_once()
-            # Check the action_id was passed
-            call_args = mock_registry.execute.call_args
-            assert call_args[0][0] == "edit_undo"
+class TestCreateEventFilter:
+    """Test _create_event_filter function."""
 
+    def test_create_event_filter_returns_object(self, qt_mock):
+        """Test that _create_event_filter returns a Qt object."""
+        handler = MouseMasterEventHandler()
 
-class TestInstallVtkObservers:
-    """Test VTK observer installation."""
+        # Mock qt.QObject
+        qt_mock.QObject = MagicMock()
+        qt_mock.QEvent.MouseButtonPress = 2
+        qt_mock.QEvent.MouseButtonRelease = 3
 
-    def test_install_vtk_observers_no_layout_manager(self):
-        """Test handling when layout manager is not available."""
-        import slicer
+        filter_obj = _create_event_filter(handler)
+
+        assert filter_obj is not None
 
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
+    def test_event_filter_fast_pass(self, qt_mock, monkeypatch):
+        """Test that the filter skips dispatch while fast pass is set."""
+
+        class StubQObject:
+            def __init__(self, parent=None):
+                pass
+
+        monkeypatch.setattr(qt_mock, "QObject", StubQObject)
+        qt_mock.QEvent.MouseButtonPress = 2
+        qt_mock.QEvent.MouseButtonRelease = 3
 
         handler = MouseMasterEventHandler()
-        handler._qt_handler = MagicMock()
+        mock_press = MagicMock(return_value=True)
+        monkeypatch.setattr(MouseMasterEventHandler, "handle_button_press", mock_press)
+        filter_obj = _create_event_filter(handler)
 
-        # Configure layoutManager to return None
-        slicer.app.layoutManager = MagicMock(return_value=None)
+        event = MagicMock()
+        event.type.return_value = 2
+        event.button.return_value = 8
 
-        # Should not raise
-        handler._install_vtk_observers()
+        assert filter_obj._fast_pass is True
+        assert filter_obj.eventFilter(None, event) is False
+        mock_press.assert_not_called()
 
-        assert handler._vtk_observers == []
+        filter_obj._fast_pass = False
+        assert filter_obj.eventFilter(None, event) is True
+        mock_press.assert_called_once_with(event)
+        assert filter_obj._consumed_bits == 8
+
+        # Release of a consumed button is swallowed even after fast pass is re-enabled
+        filter_obj._fast_pass = True
+        release = MagicMock()
+        release.type.return_value = 3
+        release.button.return_value = 8
+        assert filter_obj.eventFilter(None, release) is True
+        assert filter_obj.eventFilter(None, release) is False
+        assert filter_obj._consumed_bits == 0
 
-    def test_install_vtk_observers_with_views(self):
-        """Test installing observers on slice and 3D views."""
-        import slicer
+    def test_event_filter_dispatches_press_once(self, qt_mock, monkeypatch):
+        """Test a press delivered by several filters is only dispatched once."""
 
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
+        class StubQObject:
+            def __init__(self, parent=None):
+                pass
+
+        monkeypatch.setattr(qt_mock, "QObject", StubQObject)
+        qt_mock.QEvent.MouseButtonPress = 2
+        qt_mock.QEvent.MouseButtonRelease = 3
 
         handler = MouseMasterEventHandler()
-        handler._qt_handler = MagicMock()
+        mock_press = MagicMock(return_value=False)
+        monkeypatch.setattr(MouseMasterEventHandler, "handle_button_press", mock_press)
+        filter_obj = _create_event_filter(handler)
+        filter_obj._fast_pass = False
 
-        # Set up mock layout manager
-        mock_layout_manager = MagicMock()
-        mock_layout_manager.sliceViewNames.return_value = ["Red", "Green", "Yellow"]
-        mock_layout_manager.threeDViewCount = 1
+        def press(timestamp):
+            event = MagicMock()
+            event.type.return_value = 2
+            event.button.return_value = 8
+            event.timestamp.return_value = timestamp
+            return event
 
-        # Mock slice widgets - each must be unique
-        mock_slice_views = [MagicMock(name=f"slice_view_{i}") for i in range(3)]
-        mock_slice_widgets = []
-        for view in mock_slice_views:
-            widget = MagicMock()
-            widget.sliceView.return_value = view
-            mock_slice_widgets.append(widget)
+        # Application filter, then the view filter, see the same press
+        assert filter_obj.eventFilter(None, press(100)) is False
+        assert filter_obj.eventFilter(None, press(100)) is False
+        assert mock_press.call_count == 1
 
-        mock_layout_manager.sliceWidget.side_effect = mock_slice_widgets
+        # The next press is dispatched again
+        filter_obj.eventFilter(None, press(250))
+        assert mock_press.call_count == 2
 
-        # Mock 3D widget
-        mock_3d_view = MagicMock(name="3d_view")
-        mock_3d_widget = MagicMock()
-        mock_3d_widget.threeDView.return_value = mock_3d_view
-        mock_layout_manager.threeDWidget.return_value = mock_3d_widget
+    def test_event_filter_dispatches_press_after_release(self, qt_mock, monkeypatch):
+        """Test presses with equal timestamps are dispatched when a release separates them."""
 
-        slicer.app.layoutManager = MagicMock(return_value=mock_layout_manager)
+        class StubQObject:
+            def __init__(self, parent=None):
+                pass
 
-        handler._install_vtk_observers()
+        monkeypatch.setattr(qt_mock, "QObject", StubQObject)
+        qt_mock.QEvent.MouseButtonPress = 2
+        qt_mock.QEvent.MouseButtonRelease = 3
 
-        # Should have 3 slice views + 1 3D view = 4 observers
-        assert len(handler._vtk_observers) == 4
+        handler = MouseMasterEventHandler()
+        mock_press = MagicMock(return_value=False)
+        monkeypatch.setattr(MouseMasterEventHandler, "handle_button_press", mock_press)
+        filter_obj = _create_event_filter(handler)
+        filter_obj._fast_pass = False
 
+        def mouse_event(event_type):
+            event = MagicMock()
+            event.type.return_value = event_type
+            event.button.return_value = 8
+            # Synthetic events and some platforms report no timestamp
+            event.timestamp.return_value = 0
+            return event
 
-class TestCreateEventFilter:
-    """Test _create_event_filter function."""
+        filter_obj.eventFilter(None, mouse_event(2))
+        filter_obj.eventFilter(None, mouse_event(3))
+        filter_obj.eventFilter(None, mouse_event(2))
 
-    def test_create_event_filter_returns_object(self):
-        """Test that _create_event_filter returns a Qt object."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler, _create_event_filter
+        assert mock_press.call_count == 2
 
+    def test_refresh_log_level(self):
+        """Test that refresh_log_level pushes the DEBUG flag to the filter."""
+        import logging
+
+        handler = MouseMasterEventHandler()
+        handler._qt_handler = MagicMock()
+        original_level = logger.level
+        try:
+            logger.setLevel(logging.DEBUG)
+            handler.refresh_log_level()
+            assert handler._log_debug is True
+            assert handler._qt_handler._log_debug is True
+
+            logger.setLevel(logging.INFO)
+            handler.refresh_log_level()
+            assert handler._log_debug is False
+            assert handler._qt_handler._log_debug is False
+        finally:
+            logger.setLevel(original_level)
+
+    def test_setters_update_fast_pass(self):
+        """Test that enabled/preset changes are pushed to the filter."""
         handler = MouseMasterEventHandler()
+        handler._qt_handler = MagicMock()
 
-        # Mock qt.QObject
-        mock_qt.QObject = MagicMock()
-        mock_qt.QEvent.MouseButtonPress = 2
-        mock_qt.QEvent.MouseButtonRelease = 3
+        handler.set_preset(MagicMock())
+        assert handler._qt_handler._fast_pass is False
 
-        filter_obj = _create_event_filter(handler)
+        handler.set_enabled(False)
+        assert handler._qt_handler._fast_pass is True
 
-        assert filter_obj is not None
+        handler.set_enabled(True)
+        handler.set_preset(None)
+        assert handler._qt_handler._fast_pass is True
+
+        # A button-press callback still needs every press
+        handler.set_on_button_press(MagicMock())
+        assert handler._qt_handler._fast_pass is False
 
 
 class TestGetCurrentContext:
     """Test _get_current_context method."""
 
-    def test_get_current_context_returns_module_name(self):
+    def test_get_current_context_returns_module_name(self, selected_module):
         """Test getting current module context."""
-        import slicer.util
-
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
 
-        # Configure the mock directly
-        slicer.util.selectedModule = MagicMock(return_value="SegmentEditor")
+        selected_module.return_value = "SegmentEditor"
         context = handler._get_current_context()
 
         assert context == "SegmentEditor"
 
-    def test_get_current_context_returns_default_when_none(self):
+    def test_get_current_context_returns_default_when_none(self, selected_module):
         """Test that default context is returned when no module selected."""
-        import slicer.util
-
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
-
         handler = MouseMasterEventHandler()
 
-        # Configure the mock to return None
-        slicer.util.selectedModule = MagicMock(return_value=None)
+        selected_module.return_value = None
         context = handler._get_current_context()
 
         assert context == "default"
 
+    def test_get_current_context_without_main_window(self, selected_module):
+        """Test that default context is returned when the module selector is missing."""
+        handler = MouseMasterEventHandler()
 
-class TestUninstallWithRuntimeError:
-    """Test uninstall handling RuntimeError from deleted views."""
+        selected_module.side_effect = AttributeError("no main window")
 
-    def test_uninstall_handles_deleted_view(self):
-        """Test that uninstall handles RuntimeError from deleted view widgets."""
-        from MouseMasterLib.event_handler import MouseMasterEventHandler
+        assert handler._get_current_context() == "default"
+
+    def test_get_current_context_interned(self, selected_module):
+        """Test that module names are interned before being used as lookup keys."""
+        handler = MouseMasterEventHandler()
 
+        name = "".join(["Segment", "Editor"])
+        selected_module.return_value = name
+
+        assert handler._get_current_context() is sys.intern(name)
+
+    def test_get_current_context_cached(self, selected_module):
+        """Test that the context is cached until invalidated."""
+        handler = MouseMasterEventHandler()
+
+        selected_module.return_value = "SegmentEditor"
+        assert handler._get_current_context() == "SegmentEditor"
+
+        selected_module.return_value = "Markups"
+        assert handler._get_current_context() == "SegmentEditor"
+        selected_module.assert_called_once()
+
+        # Module selector signal drops the cache
+        handler._invalidate_context("Markups")
+        assert handler._get_current_context() == "Markups"
+
+    def test_get_current_context_expires(self, selected_module):
+        """Test that the cached context expires after the TTL."""
+        handler = MouseMasterEventHandler()
+
+        selected_module.return_value = "SegmentEditor"
+        handler._get_current_context()
+        handler._context_cache_time -= _CONTEXT_CACHE_TTL
+
+        selected_module.return_value = "Markups"
+        assert handler._get_current_context() == "Markups"
+
+
+class TestUninstallViews:
+    """Test removal of view event filters on uninstall."""
+
+    def test_uninstall_removes_view_filters(self):
+        """Test that uninstall removes the filter from every tracked view."""
         handler = MouseMasterEventHandler()
 
         # Simulate installed state with views
@@ -511,14 +641,29 @@ class TestUninstallWithRuntimeError:
         mock_qt_handler = MagicMock()
         handler._qt_handler = mock_qt_handler
 
-        # Create a mock view that raises RuntimeError when removing filter
         mock_view = MagicMock()
-        mock_view.removeEventFilter.side_effect = RuntimeError("Widget deleted")
-        handler._vtk_observers = [(mock_view, "filter")]
+        handler._vtk_observers.append(mock_view)
 
-        # Should not raise
         handler.uninstall()
 
+        mock_view.removeEventFilter.assert_called_once_with(mock_qt_handler)
         assert handler.is_installed is False
-        assert handler._vtk_observers == []
+        assert len(handler._vtk_observers) == 0
         assert handler._qt_handler is None
+
+    def test_uninstall_handles_deleted_view(self):
+        """Test that a view deleted by Qt does not stop the remaining cleanup."""
+        handler = MouseMasterEventHandler()
+        handler._installed = True
+        handler._qt_handler = MagicMock()
+
+        deleted_view = MagicMock()
+        deleted_view.removeEventFilter.side_effect = RuntimeError("underlying C++ object deleted")
+        live_view = MagicMock()
+        handler._vtk_observers.extend([deleted_view, live_view])
+
+        handler.uninstall()
+
+        live_view.removeEventFilter.assert_called_once()
+        assert handler._vtk_observers == []
+        assert handler.is_installed is False
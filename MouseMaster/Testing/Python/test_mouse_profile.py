@@ -75,6 +75,17 @@ class TestMouseButton:
 
         assert "defaultAction" not in data
 
+    def test_bulk_from_dict_matches_from_dict(self) -> None:
+        """Test the __init__-free constructor builds an equal button."""
+        from MouseMasterLib.mouse_profile import MouseButton
+
+        for data in (
+            {"id": "back", "name": "Back", "qtButton": 8},
+            {"id": "left", "name": "Left", "qtButton": 1, "remappable": False},
+            {"id": "thumb", "name": "Thumb", "qtButton": 32, "defaultAction": "edit_undo"},
+        ):
+            assert MouseButton._bulk_from_dict(data) == MouseButton.from_dict(data)
+
 
 class TestMouseFeatures:
     """Tests for MouseFeatures dataclass."""
@@ -137,6 +148,23 @@ class TestMouseProfile:
         assert len(profile.buttons) == 4
         assert profile.features.horizontal_scroll is True
 
+    def test_from_dict_many_buttons(self, sample_mouse_profile_data: dict) -> None:
+        """Test profiles above the bulk threshold load the same buttons."""
+        from MouseMasterLib.mouse_profile import (
+            _BULK_BUTTON_THRESHOLD,
+            MouseButton,
+            MouseProfile,
+        )
+
+        buttons = [
+            {"id": f"b{i}", "name": f"Button {i}", "qtButton": 1 << i}
+            for i in range(_BULK_BUTTON_THRESHOLD + 2)
+        ]
+        profile = MouseProfile.from_dict(dict(sample_mouse_profile_data, buttons=buttons))
+
+        assert profile.buttons == [MouseButton.from_dict(b) for b in buttons]
+        assert profile.get_button_by_qt_code(1 << 9) is profile.buttons[9]
+
     def test_from_json_file(self, temp_json_file: Path) -> None:
         """Test loading MouseProfile from JSON file."""
         from MouseMasterLib.mouse_profile import MouseProfile
@@ -170,6 +198,28 @@ class TestMouseProfile:
             loaded = json.load(f)
         assert loaded["id"] == "test_mouse"
 
+    def test_to_json_file_after_edit(self, tmp_path: Path, sample_mouse_profile_data: dict) -> None:
+        """Test saving writes fields edited after loading."""
+        from MouseMasterLib.mouse_profile import MouseProfile
+
+        profile = MouseProfile.from_dict(sample_mouse_profile_data)
+        profile.name = "Renamed Mouse"
+        output_path = tmp_path / "edited.json"
+        profile.to_json_file(output_path)
+
+        assert MouseProfile.from_json_file(output_path).name == "Renamed Mouse"
+
+    def test_json_file_roundtrip(self, tmp_path: Path, sample_mouse_profile_data: dict) -> None:
+        """Test saving and reloading a profile, including non-ASCII text."""
+        from MouseMasterLib.mouse_profile import MouseProfile
+
+        data = dict(sample_mouse_profile_data, name="Souris Ergonomique Élan")
+        profile = MouseProfile.from_dict(data)
+        output_path = tmp_path / "roundtrip.json"
+        profile.to_json_file(output_path)
+
+        assert MouseProfile.from_json_file(output_path) == profile
+
     def test_get_button(self, sample_mouse_profile_data: dict) -> None:
         """Test getting button by ID."""
         from MouseMasterLib.mouse_profile import MouseProfile
@@ -196,6 +246,21 @@ class TestMouseProfile:
         missing = profile.get_button_by_qt_code(999)
         assert missing is None
 
+    def test_reindex_buttons(self, sample_mouse_profile_data: dict) -> None:
+        """Test lookups reflect in-place button changes after reindexing."""
+        from MouseMasterLib.mouse_profile import MouseButton, MouseProfile
+
+        profile = MouseProfile.from_dict(sample_mouse_profile_data)
+        profile.buttons.append(MouseButton(id="forward", name="Forward", qt_button=16))
+
+        assert profile.get_button("forward") is None
+
+        profile.reindex_buttons()
+
+        assert profile.get_button("forward") is profile.buttons[-1]
+        assert profile.get_button_by_qt_code(16) is profile.buttons[-1]
+        assert profile.remappable_count == 3
+
     def test_get_remappable_buttons(self, sample_mouse_profile_data: dict) -> None:
         """Test getting remappable buttons."""
         from MouseMasterLib.mouse_profile import MouseProfile
@@ -231,3 +296,17 @@ class TestMouseProfile:
 
         with pytest.raises(json.JSONDecodeError):
             MouseProfile.from_json_file(bad_file)
+
+    def test_load_all(self, tmp_path: Path, sample_mouse_profile_data: dict) -> None:
+        """Test loading every profile in a directory, sorted by file name."""
+        from MouseMasterLib.mouse_profile import MouseProfile
+
+        other = dict(sample_mouse_profile_data, id="other_mouse")
+        (tmp_path / "b.json").write_text(json.dumps(other))
+        (tmp_path / "a.json").write_text(json.dumps(sample_mouse_profile_data))
+        (tmp_path / "notes.txt").write_text("not a profile")
+
+        profiles = MouseProfile.load_all(tmp_path)
+
+        assert [p.id for p in profiles] == [sample_mouse_profile_data["id"], "other_mouse"]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.json", "b.json", "notes.txt"]
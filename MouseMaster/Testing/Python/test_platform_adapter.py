@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 
 class TestCanonicalButton:
     """Tests for CanonicalButton enum."""
@@ -51,6 +53,25 @@ class TestWindowsAdapter:
         # Multiple modifiers
         assert adapter.normalize_modifiers(0x02000000 | 0x04000000) == {"shift", "ctrl"}
 
+    def test_normalize_modifiers_all_combinations(self) -> None:
+        """Test every Shift/Ctrl/Alt/Meta combination, ignoring other Qt flags."""
+        from MouseMasterLib.platform_adapter import WindowsAdapter
+
+        adapter = WindowsAdapter()
+        flags = {
+            "shift": adapter.QT_SHIFT,
+            "ctrl": adapter.QT_CTRL,
+            "alt": adapter.QT_ALT,
+            "meta": adapter.QT_META,
+        }
+        keypad = 0x20000000
+
+        for index in range(16):
+            expected = {name for bit, name in enumerate(flags) if index >> bit & 1}
+            qt_modifiers = sum(flags[name] for name in expected)
+            assert adapter.normalize_modifiers(qt_modifiers) == expected
+            assert adapter.normalize_modifiers(qt_modifiers | keypad) == expected
+
 
 class TestMacOSAdapter:
     """Tests for MacOSAdapter."""
@@ -88,6 +109,26 @@ class TestMacOSAdapter:
         # Qt Meta (Ctrl on macOS) -> canonical Ctrl
         assert adapter.normalize_modifiers(0x10000000) == {"ctrl"}
 
+    @pytest.mark.parametrize(
+        ("swap_ctrl_meta", "qt_modifiers", "expected"),
+        [
+            (True, 0x04000000, {"ctrl"}),
+            (True, 0x10000000, {"meta"}),
+            (True, 0x16000000, {"shift", "ctrl", "meta"}),
+            (False, 0x04000000, {"meta"}),
+            (False, 0x10000000, {"ctrl"}),
+            (False, 0x16000000, {"shift", "ctrl", "meta"}),
+            (False, 0x06000000, {"shift", "meta"}),
+        ],
+    )
+    def test_normalize_ctrl_meta(self, swap_ctrl_meta, qt_modifiers, expected) -> None:
+        """Test Ctrl/Meta on macOS in both configurations, alone and combined."""
+        from MouseMasterLib.platform_adapter import MacOSAdapter
+
+        adapter = MacOSAdapter(swap_ctrl_meta=swap_ctrl_meta)
+
+        assert adapter.normalize_modifiers(qt_modifiers) == expected
+
 
 class TestLinuxAdapter:
     """Tests for LinuxAdapter."""
@@ -112,6 +153,17 @@ class TestLinuxAdapter:
         assert adapter.normalize_modifiers(0x08000000) == {"alt"}
         assert adapter.normalize_modifiers(0x02000000 | 0x08000000) == {"shift", "alt"}
 
+    def test_normalize_modifiers_shared_frozensets(self) -> None:
+        """Test equal modifier states return the same frozenset instance."""
+        from MouseMasterLib.platform_adapter import LinuxAdapter
+
+        adapter = LinuxAdapter()
+
+        first = adapter.normalize_modifiers(0x04000000)
+        assert isinstance(first, frozenset)
+        assert adapter.normalize_modifiers(0x04000000) is first
+        assert adapter.normalize_modifiers(0) is adapter.normalize_modifiers(0x20000000)
+
 
 class TestPlatformAdapter:
     """Tests for PlatformAdapter base class."""
@@ -128,6 +180,17 @@ class TestPlatformAdapter:
 
         assert instance1 is instance2
 
+    def test_reset_instance_creates_new_adapter(self) -> None:
+        """Test that reset_instance replaces the shared adapter."""
+        from MouseMasterLib.platform_adapter import PlatformAdapter
+
+        before = PlatformAdapter.get_instance()
+        PlatformAdapter.reset_instance()
+        after = PlatformAdapter.get_instance()
+
+        assert after is not before
+        assert type(after) is type(before)
+
     def test_button_to_id(self) -> None:
         """Test converting canonical button to string ID."""
         from MouseMasterLib.platform_adapter import (
@@ -142,6 +205,17 @@ class TestPlatformAdapter:
         assert adapter.button_to_id(CanonicalButton.BACK) == "back"
         assert adapter.button_to_id(CanonicalButton.UNKNOWN) == "unknown"
 
+    def test_id_to_button(self) -> None:
+        """Test converting string IDs back to canonical buttons."""
+        from MouseMasterLib.platform_adapter import BUTTON_ID_MAP, CanonicalButton, LinuxAdapter
+
+        adapter = LinuxAdapter()
+
+        for button in BUTTON_ID_MAP:
+            assert adapter.id_to_button(adapter.button_to_id(button)) is button
+        assert adapter.id_to_button("thumb") is CanonicalButton.EXTRA1
+        assert adapter.id_to_button("no_such_button") is CanonicalButton.UNKNOWN
+
     def test_normalize_event(self, mock_mouse_event) -> None:
         """Test normalizing a mock mouse event."""
         from MouseMasterLib.platform_adapter import PlatformAdapter
@@ -156,3 +230,34 @@ class TestPlatformAdapter:
         assert "shift" in normalized.modifiers
         assert normalized.x == 100
         assert normalized.y == 200
+
+    def test_normalize_event_button_ids(self, mock_mouse_event) -> None:
+        """Test every canonical button gets the same ID as button_to_id."""
+        from MouseMasterLib.platform_adapter import LinuxAdapter
+
+        adapter = LinuxAdapter()
+
+        for qt_button in (0, 1, 2, 4, 8, 16, 32, 64, 128, 999):
+            normalized = adapter.normalize_event(mock_mouse_event(button=qt_button))
+            expected = adapter.button_to_id(adapter.normalize_button(qt_button))
+            assert normalized.button_id == expected
+        assert adapter.normalize_event(mock_mouse_event(button=999)).button_id == "unknown"
+
+    def test_normalize_event_int_subclass_values(self, mock_mouse_event) -> None:
+        """Test Qt enum/flag values (int subclasses) normalize without conversion."""
+        from enum import IntFlag
+
+        from MouseMasterLib.platform_adapter import CanonicalButton, LinuxAdapter
+
+        class QtFlag(IntFlag):
+            BACK = 8
+            SHIFT = 0x02000000
+            CTRL = 0x04000000
+
+        adapter = LinuxAdapter()
+        event = mock_mouse_event(button=QtFlag.BACK, modifiers=QtFlag.SHIFT | QtFlag.CTRL)
+        normalized = adapter.normalize_event(event)
+
+        assert normalized.button is CanonicalButton.BACK
+        assert normalized.button_id == "back"
+        assert normalized.modifiers == {"shift", "ctrl"}
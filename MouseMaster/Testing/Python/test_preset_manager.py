@@ -38,6 +38,42 @@ class TestMapping:
         assert mapping.action_id == "custom_cmd"
         assert mapping.parameters["command"] == "print('hello')"
 
+    def test_immutable(self) -> None:
+        """Test Mapping fields cannot be reassigned."""
+        from dataclasses import FrozenInstanceError
+
+        from MouseMasterLib.preset_manager import Mapping
+
+        mapping = Mapping(action="edit_undo")
+
+        with pytest.raises(FrozenInstanceError):
+            mapping.action = "edit_redo"  # type: ignore[misc]
+
+    def test_hashable_with_parameters(self) -> None:
+        """Test a Mapping with parameters can be hashed and used in a set."""
+        from MouseMasterLib.preset_manager import Mapping
+
+        mapping = Mapping(
+            action="keyboard_shortcut", parameters={"key": "Z", "modifiers": ["ctrl"]}
+        )
+        same = Mapping(action="keyboard_shortcut", parameters={"key": "Z", "modifiers": ["ctrl"]})
+
+        assert hash(mapping) == hash(same)
+        assert {mapping, same} == {mapping}
+
+    def test_parameters_read_only(self) -> None:
+        """Test parameters are a read-only copy of the dict passed in."""
+        from MouseMasterLib.preset_manager import Mapping
+
+        params = {"command": "print('a')"}
+        mapping = Mapping(action="python_command", parameters=params)
+        params["command"] = "print('b')"
+
+        assert mapping.parameters["command"] == "print('a')"
+        with pytest.raises(TypeError):
+            mapping.parameters["command"] = "print('c')"  # type: ignore[index]
+        assert type(mapping.to_dict()["parameters"]) is dict
+
     def test_to_dict(self) -> None:
         """Test serializing Mapping."""
         from MouseMasterLib.preset_manager import Mapping
@@ -82,6 +118,24 @@ class TestPreset:
         assert "middle" in preset.mappings
         assert "SegmentEditor" in preset.context_mappings
 
+    def test_from_json_file_interns_keys(self, temp_preset_file: Path) -> None:
+        """Test button IDs and contexts parsed from JSON are interned."""
+        import sys
+
+        from MouseMasterLib.preset_manager import Preset
+
+        def is_interned(value: str) -> bool:
+            # Intern an equal but distinct string; it resolves to value only
+            # if value itself is the interned copy
+            return sys.intern(value[:1] + value[1:]) is value
+
+        preset = Preset.from_json_file(temp_preset_file)
+
+        assert all(is_interned(button_id) for button_id in preset.mappings)
+        for context, context_mappings in preset.context_mappings.items():
+            assert is_interned(context)
+            assert all(is_interned(button_id) for button_id in context_mappings)
+
     def test_from_json_file(self, temp_preset_file: Path) -> None:
         """Test loading Preset from JSON file."""
         from MouseMasterLib.preset_manager import Preset
@@ -150,6 +204,52 @@ class TestPreset:
         mapping = preset.get_mapping("nonexistent")
         assert mapping is None
 
+    def test_get_mapping_after_set_and_remove(self, sample_preset_data: dict) -> None:
+        """Test lookups follow set_mapping and remove_mapping."""
+        from MouseMasterLib.preset_manager import Mapping, Preset
+
+        preset = Preset.from_dict(sample_preset_data)
+        assert preset.get_mapping("forward", "SegmentEditor") is None
+
+        new_mapping = Mapping(action="edit_redo")
+        preset.set_mapping("forward", new_mapping, "SegmentEditor")
+        assert preset.get_mapping("forward", "SegmentEditor") is new_mapping
+
+        preset.remove_mapping("forward", "SegmentEditor")
+        assert preset.get_mapping("forward", "SegmentEditor") is None
+
+        default_mapping = Mapping(action="edit_undo")
+        preset.set_mapping("forward", default_mapping)
+        assert preset.get_mapping("forward", "SegmentEditor") is default_mapping
+        assert preset.build_lookup()[("forward", None)] is default_mapping
+
+    def test_build_lookup(self, sample_preset_data: dict) -> None:
+        """Test the flattened lookup matches get_mapping."""
+        from MouseMasterLib.preset_manager import Preset
+
+        preset = Preset.from_dict(sample_preset_data)
+        lookup = preset.build_lookup()
+
+        assert lookup[("middle", None)] is preset.get_mapping("middle")
+        assert lookup[("back", None)] is preset.get_mapping("back")
+        assert lookup[("back", "SegmentEditor")] is preset.get_mapping("back", "SegmentEditor")
+        assert ("middle", "SegmentEditor") not in lookup
+
+    def test_build_lookup_interns_keys(self, sample_preset_data: dict) -> None:
+        """Test lookup keys are interned strings."""
+        import sys
+
+        from MouseMasterLib.preset_manager import Preset
+
+        preset = Preset.from_dict(sample_preset_data)
+        lookup = preset.build_lookup()
+
+        context = "".join(["Segment", "Editor"])
+        for button_id, key_context in lookup:
+            assert button_id is sys.intern(button_id)
+            if key_context is not None:
+                assert key_context is sys.intern(context)
+
     def test_set_mapping(self, sample_preset_data: dict) -> None:
         """Test setting a mapping."""
         from MouseMasterLib.preset_manager import Mapping, Preset
@@ -202,6 +302,94 @@ class TestPreset:
         assert mapping.action == "edit_undo"
 
 
+class TestMigratePresetData:
+    """Tests for migrate_preset_data."""
+
+    def test_current_and_unknown_versions_unchanged(self) -> None:
+        """Test data without an applicable migration is returned as is."""
+        from MouseMasterLib.preset_manager import CURRENT_PRESET_VERSION, migrate_preset_data
+
+        current = {"id": "p", "version": CURRENT_PRESET_VERSION}
+        unknown = {"id": "p", "version": "0.1"}
+
+        assert migrate_preset_data(current) is current
+        assert migrate_preset_data(unknown) is unknown
+
+    def test_migration_does_not_modify_input(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a migration runs on a copy and stamps the current version."""
+        from MouseMasterLib import preset_manager
+
+        def add_field(data: dict[str, Any]) -> dict[str, Any]:
+            data["newField"] = "value"
+            return data
+
+        monkeypatch.setitem(preset_manager.PRESET_MIGRATIONS, "0.9", add_field)
+        data = {"id": "p", "version": "0.9"}
+
+        migrated = preset_manager.migrate_preset_data(data)
+
+        assert migrated == {
+            "id": "p",
+            "version": preset_manager.CURRENT_PRESET_VERSION,
+            "newField": "value",
+        }
+        assert data == {"id": "p", "version": "0.9"}
+
+    def test_migrations_chain(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test migrations are applied in sequence up to the current version."""
+        from MouseMasterLib import preset_manager
+
+        applied: list[str] = []
+
+        def step(source: str, target: str) -> Any:
+            def migrate(data: dict[str, Any]) -> dict[str, Any]:
+                applied.append(source)
+                return {**data, "version": target}
+
+            return migrate
+
+        monkeypatch.setattr(preset_manager, "CURRENT_PRESET_VERSION", "1.0")
+        monkeypatch.setitem(preset_manager.PRESET_MIGRATIONS, "0.8", step("0.8", "0.9"))
+        monkeypatch.setitem(preset_manager.PRESET_MIGRATIONS, "0.9", step("0.9", "1.0"))
+
+        migrated = preset_manager.migrate_preset_data({"id": "p", "version": "0.8"})
+
+        assert applied == ["0.8", "0.9"]
+        assert migrated["version"] == "1.0"
+
+    def test_migration_chain_stops_at_gap(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a chain with a missing step stops at the last version reached."""
+        from MouseMasterLib import preset_manager
+
+        monkeypatch.setattr(preset_manager, "CURRENT_PRESET_VERSION", "1.0")
+        monkeypatch.setitem(
+            preset_manager.PRESET_MIGRATIONS, "0.7", lambda data: {**data, "version": "0.8"}
+        )
+
+        migrated = preset_manager.migrate_preset_data({"id": "p", "version": "0.7"})
+
+        assert migrated["version"] == "0.8"
+
+    def test_from_dict_migrates_old_versions(
+        self, sample_preset_data: dict, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test Preset.from_dict still migrates presets at an old version."""
+        from MouseMasterLib import preset_manager
+
+        def rename(data: dict[str, Any]) -> dict[str, Any]:
+            data["name"] = "Migrated"
+            return data
+
+        monkeypatch.setitem(preset_manager.PRESET_MIGRATIONS, "0.9", rename)
+
+        old = preset_manager.Preset.from_dict(dict(sample_preset_data, version="0.9"))
+        current = preset_manager.Preset.from_dict(sample_preset_data)
+
+        assert old.name == "Migrated"
+        assert old.version == preset_manager.CURRENT_PRESET_VERSION
+        assert current.name == sample_preset_data["name"]
+
+
 class TestPresetManager:
     """Tests for PresetManager class."""
 
@@ -247,6 +435,40 @@ class TestPresetManager:
         assert len(presets) == 1
         assert presets[0].id == "test_preset"
 
+    def test_load_from_directory_skips_invalid(
+        self, tmp_path: Path, sample_preset_data: dict
+    ) -> None:
+        """Test one bad file does not stop the other presets from loading."""
+        from MouseMasterLib.preset_manager import PresetManager
+
+        preset_dir = tmp_path / "presets"
+        preset_dir.mkdir()
+        for i in range(10):
+            data = dict(sample_preset_data, id=f"preset_{i}")
+            (preset_dir / f"preset_{i}.json").write_text(json.dumps(data))
+        (preset_dir / "broken.json").write_text("not valid json")
+        (preset_dir / "missing_id.json").write_text(json.dumps({"name": "No ID"}))
+
+        manager = PresetManager(builtin_dir=preset_dir)
+        manager.load_all()
+
+        assert sorted(p.id for p in manager.get_all_presets()) == [f"preset_{i}" for i in range(10)]
+
+    def test_load_from_directory_only_json(self, tmp_path: Path, sample_preset_data: dict) -> None:
+        """Test files without a .json suffix are not loaded."""
+        from MouseMasterLib.preset_manager import PresetManager
+
+        preset_dir = tmp_path / "presets"
+        preset_dir.mkdir()
+        (preset_dir / "test.json").write_text(json.dumps(sample_preset_data))
+        (preset_dir / "other.json.bak").write_text(json.dumps(dict(sample_preset_data, id="bak")))
+        (preset_dir / "notes.txt").write_text("not a preset")
+
+        manager = PresetManager(builtin_dir=preset_dir)
+        manager.load_all()
+
+        assert [p.id for p in manager.get_all_presets()] == [sample_preset_data["id"]]
+
     def test_get_preset(self, tmp_path: Path, sample_preset_data: dict) -> None:
         """Test getting preset by ID."""
         from MouseMasterLib.preset_manager import PresetManager
@@ -265,6 +487,44 @@ class TestPresetManager:
 
         assert manager.get_preset("nonexistent") is None
 
+    def test_get_preset_loads_single_file(self, tmp_path: Path, sample_preset_data: dict) -> None:
+        """Test get_preset reads only the matching file before a full load."""
+        from MouseMasterLib.preset_manager import PresetManager
+
+        builtin_dir = tmp_path / "builtin"
+        user_dir = tmp_path / "user"
+        builtin_dir.mkdir()
+        user_dir.mkdir()
+        (builtin_dir / "test_preset.json").write_text(json.dumps(sample_preset_data))
+        (builtin_dir / "other.json").write_text("not valid json")
+        user_copy = dict(sample_preset_data, name="User Copy")
+        (user_dir / "test_preset.json").write_text(json.dumps(user_copy))
+
+        manager = PresetManager(builtin_dir=builtin_dir, user_dir=user_dir)
+        preset = manager.get_preset("test_preset")
+
+        assert preset is not None
+        assert preset.name == "User Copy"
+        assert manager._loaded is False
+        assert list(manager._presets) == ["test_preset"]
+        assert manager.get_preset("test_preset") is preset
+
+    def test_get_preset_falls_back_to_full_load(
+        self, tmp_path: Path, sample_preset_data: dict
+    ) -> None:
+        """Test presets whose file name differs from their ID are still found."""
+        from MouseMasterLib.preset_manager import PresetManager
+
+        preset_dir = tmp_path / "presets"
+        preset_dir.mkdir()
+        (preset_dir / "renamed.json").write_text(json.dumps(sample_preset_data))
+
+        manager = PresetManager(builtin_dir=preset_dir)
+
+        preset = manager.get_preset("test_preset")
+        assert preset is not None
+        assert manager._loaded is True
+
     def test_get_presets_for_mouse(self, tmp_path: Path, sample_preset_data: dict) -> None:
         """Test getting presets for a specific mouse."""
         from MouseMasterLib.preset_manager import PresetManager
@@ -302,6 +562,64 @@ class TestPresetManager:
         saved_file = user_dir / "test_preset.json"
         assert saved_file.exists()
 
+    def test_save_preset_skips_unchanged(
+        self, tmp_path: Path, sample_preset_data: dict, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test saving an unchanged preset again does not rewrite the file."""
+        from MouseMasterLib.preset_manager import Mapping, Preset, PresetManager
+
+        writes: list[Path] = []
+        to_json_file = Preset.to_json_file
+
+        def counting_to_json_file(self: Preset, path: Path) -> None:
+            writes.append(path)
+            to_json_file(self, path)
+
+        monkeypatch.setattr(Preset, "to_json_file", counting_to_json_file)
+
+        manager = PresetManager(user_dir=tmp_path / "user")
+        preset = Preset.from_dict(sample_preset_data)
+
+        manager.save_preset(preset)
+        manager.save_preset(preset)
+        assert len(writes) == 1
+
+        preset.set_mapping("back", Mapping(action="edit_redo"))
+        manager.save_preset(preset)
+        assert len(writes) == 2
+
+    def test_save_preset_after_rename(self, tmp_path: Path, sample_preset_data: dict) -> None:
+        """Test editing a non-mapping field is saved and survives a reload."""
+        from MouseMasterLib.preset_manager import Preset, PresetManager
+
+        manager = PresetManager(user_dir=tmp_path / "user")
+        manager.save_preset(Preset.from_dict(sample_preset_data))
+        path = tmp_path / "user" / "test_preset.json"
+
+        preset = Preset.from_json_file(path)
+        preset.name = "Renamed Preset"
+        preset.description = "Edited"
+        manager.save_preset(preset)
+
+        reloaded = Preset.from_json_file(path)
+        assert reloaded.name == "Renamed Preset"
+        assert reloaded.description == "Edited"
+
+    def test_save_loaded_builtin_preset(self, tmp_path: Path, sample_preset_data: dict) -> None:
+        """Test an unchanged preset read from elsewhere is still written."""
+        from MouseMasterLib.preset_manager import Preset, PresetManager
+
+        builtin_dir = tmp_path / "builtin"
+        builtin_dir.mkdir()
+        (builtin_dir / "test_preset.json").write_text(json.dumps(sample_preset_data))
+        user_dir = tmp_path / "user"
+        manager = PresetManager(builtin_dir=builtin_dir, user_dir=user_dir)
+
+        preset = Preset.from_json_file(builtin_dir / "test_preset.json")
+        manager.save_preset(preset)
+
+        assert (user_dir / "test_preset.json").exists()
+
     def test_save_preset_no_user_dir(self, sample_preset_data: dict) -> None:
         """Test saving without user directory configured."""
         from MouseMasterLib.preset_manager import Preset, PresetManager